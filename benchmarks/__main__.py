@@ -0,0 +1,108 @@
+"""Run the benchmarks against generated pages in headless Chrome.
+
+Usage:
+    python -m benchmarks --sizes 1000,10000 --output results.json
+    python -m benchmarks --compare results.json --threshold 0.2
+
+Every `bench_*` function of the `bench_*` modules runs against each page size, except the ones
+independent of the page (`per_page=False`), which run once. With `--compare`, the run fails when
+the median latency of a benchmark regressed by more than the threshold, or when it needs more
+round-trips than in the baseline.
+"""
+
+import argparse
+import importlib
+import json
+import pkgutil
+import sys
+import tempfile
+from pathlib import Path
+
+import benchmarks
+from benchmarks.harness import BenchContext, make_driver, run_benchmark
+from benchmarks.pages import page_path
+
+DEFAULT_SIZES = "1000,10000,50000,200000"
+
+
+def collect(pattern: str | None) -> list:
+    functions = []
+    for module_info in sorted(pkgutil.iter_modules(benchmarks.__path__), key=lambda info: info.name):
+        if not module_info.name.startswith("bench_"):
+            continue
+        module = importlib.import_module(f"benchmarks.{module_info.name}")
+        for name, func in vars(module).items():
+            if name.startswith("bench_") and callable(func) and (pattern is None or pattern in name):
+                functions.append(func)
+    return functions
+
+
+def name(func) -> str:
+    return f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+
+def measure(func, context: BenchContext, key: str) -> dict:
+    result = run_benchmark(func, context)
+    print(
+        f"{key:<64} p50 {result['p50_ms']:>9.2f} ms  p90 {result['p90_ms']:>9.2f} ms  "
+        f"p99 {result['p99_ms']:>9.2f} ms  round-trips {result['round_trips']:>6.1f}",
+        flush=True,
+    )
+    context.reload()
+    return result
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """List the benchmarks that regressed against a baseline."""
+    regressions = []
+    for key, result in results.items():
+        previous = baseline.get(key)
+        if previous is None:
+            continue
+        if result["p50_ms"] > previous["p50_ms"] * (1 + threshold):
+            regressions.append(f"{key}: p50 {previous['p50_ms']:.2f} ms -> {result['p50_ms']:.2f} ms")
+        if result["round_trips"] > previous["round_trips"]:
+            regressions.append(f"{key}: round-trips {previous['round_trips']:g} -> {result['round_trips']:g}")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="comma-separated page sizes, in element nodes")
+    parser.add_argument("--filter", help="only run benchmarks whose name contains this string")
+    parser.add_argument("--pages", type=Path, default=Path(tempfile.gettempdir()) / "browserjquery-bench")
+    parser.add_argument("--output", type=Path, help="write the results as JSON")
+    parser.add_argument("--compare", type=Path, help="JSON results of a baseline run")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed p50 slowdown, as a fraction")
+    args = parser.parse_args(argv)
+
+    functions = collect(args.filter)
+    results = {}
+    driver = make_driver()
+    try:
+        context = None
+        for nodes in (int(size) for size in args.sizes.split(",")):
+            context = BenchContext(driver, page_path(nodes, args.pages), nodes)
+            for func in functions:
+                if func.per_page:
+                    key = f"{name(func)}[{nodes}]"
+                    results[key] = measure(func, context, key)
+        # Benchmarks independent of the page run once, against the last page.
+        for func in functions:
+            if not func.per_page and context is not None:
+                results[name(func)] = measure(func, context, name(func))
+    finally:
+        driver.quit()
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    if args.compare:
+        regressions = compare(results, json.loads(args.compare.read_text()), args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,22 @@
+"""Iterating collections: reading every element of eager and lazy collections."""
+
+from benchmarks.harness import BenchContext, benchmark
+
+
+@benchmark(repeat=5, warmup=1)
+def bench_iterate_eager(context: BenchContext):
+    for title in context.browser.find("h2.title"):
+        title.text()
+
+
+@benchmark(repeat=5, warmup=1)
+def bench_iterate_lazy(context: BenchContext):
+    titles = context.browser.find("h2.title", lazy=True)
+    for title in titles:
+        title.text()
+    titles.release()
+
+
+@benchmark()
+def bench_collection_extract(context: BenchContext):
+    context.browser.find("h2.title").extract({"text": "text"}, columns=True)
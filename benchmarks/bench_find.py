@@ -0,0 +1,28 @@
+"""Selector queries: native selectors, jQuery extensions, id lookups and batched extraction."""
+
+from benchmarks.harness import BenchContext, benchmark
+
+
+@benchmark()
+def bench_find_native(context: BenchContext):
+    context.browser.find("div.card > h2.title")
+
+
+@benchmark()
+def bench_find_jquery_extension(context: BenchContext):
+    context.browser.find("div.card:visible a.link")
+
+
+@benchmark()
+def bench_find_by_id(context: BenchContext):
+    context.browser.find("#catalog")
+
+
+@benchmark()
+def bench_find_lazy(context: BenchContext):
+    context.browser.find("li.tag", lazy=True).release()
+
+
+@benchmark()
+def bench_extract(context: BenchContext):
+    context.browser.extract("div.card", {"title": "find:h2|text", "price": "find:.price|text"})
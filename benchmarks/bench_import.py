@@ -0,0 +1,20 @@
+"""Importing the package in a fresh interpreter, interpreter startup included; independent of the page."""
+
+import subprocess
+import sys
+
+from benchmarks.harness import BenchContext, benchmark
+
+
+def import_in_subprocess(statement: str):
+    subprocess.run([sys.executable, "-c", statement], check=True)
+
+
+@benchmark(repeat=10, warmup=1, per_page=False)
+def bench_import_package(context: BenchContext):
+    import_in_subprocess("import browserjquery")
+
+
+@benchmark(repeat=10, warmup=1, per_page=False)
+def bench_import_browserjquery(context: BenchContext):
+    import_in_subprocess("from browserjquery import BrowserJQuery")
@@ -0,0 +1,19 @@
+"""Setting up a fresh document: injecting jQuery and the operation library, then a first query."""
+
+from benchmarks.harness import BenchContext, benchmark
+from browserjquery import BrowserJQuery
+
+
+def fresh_document(context: BenchContext):
+    # Navigate with the raw driver: creating a BrowserJQuery would already inject jQuery.
+    context.driver.refresh()
+
+
+@benchmark(repeat=10, warmup=1, setup=fresh_document)
+def bench_inject(context: BenchContext):
+    BrowserJQuery(context.driver).ensure_jquery()
+
+
+@benchmark(repeat=10, warmup=1, setup=fresh_document)
+def bench_first_query(context: BenchContext):
+    BrowserJQuery(context.driver).find("#catalog")
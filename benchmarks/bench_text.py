@@ -0,0 +1,27 @@
+"""Text searches, with and without the in-page text index."""
+
+from benchmarks.harness import BenchContext, benchmark
+from benchmarks.pages import NEEDLE
+
+
+def without_index(context: BenchContext):
+    context.browser.disable_text_index()
+
+
+def with_index(context: BenchContext):
+    context.browser.enable_text_index()
+
+
+@benchmark(setup=without_index)
+def bench_lowest_element_with_text(context: BenchContext):
+    context.browser.find_lowest_element_with_text(NEEDLE)
+
+
+@benchmark(setup=with_index)
+def bench_lowest_element_with_text_indexed(context: BenchContext):
+    context.browser.find_lowest_element_with_text(NEEDLE)
+
+
+@benchmark(setup=without_index)
+def bench_selector_and_text(context: BenchContext):
+    context.browser.find_elements_with_selector_and_text("li.tag", "omega")
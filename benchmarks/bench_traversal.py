@@ -0,0 +1,27 @@
+"""Traversal from an element in the middle of the page."""
+
+from benchmarks.harness import BenchContext, benchmark
+
+
+def middle_card(context: BenchContext):
+    cards = context.browser.find("div.card", lazy=True)
+    card = cards[len(cards) // 2]
+    cards.release()
+    return card
+
+
+@benchmark()
+def bench_parents(context: BenchContext):
+    middle_card(context).parents()
+
+
+@benchmark()
+def bench_children_and_siblings(context: BenchContext):
+    card = middle_card(context)
+    card.children()
+    card.siblings(".card")
+
+
+@benchmark()
+def bench_closest_ancestor(context: BenchContext):
+    middle_card(context).find("span.highlight").first().find_closest_ancestor("section")
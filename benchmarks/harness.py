@@ -0,0 +1,126 @@
+"""Benchmark runner: latency percentiles and round-trips per call."""
+
+import statistics
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+from browserjquery import BrowserJQuery
+
+
+def make_driver() -> webdriver.Chrome:
+    """Create a headless Chrome driver."""
+    options = Options()
+    options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    return webdriver.Chrome(options=options)
+
+
+def benchmark(
+    repeat: int = 20,
+    warmup: int = 2,
+    setup: Callable[["BenchContext"], Any] | None = None,
+    per_page: bool = True,
+):
+    """Mark a `bench_*` function with its run parameters.
+
+    Args:
+        repeat: Number of timed calls.
+        warmup: Number of untimed calls before measuring.
+        setup: Called with the context before every call, outside of the measurement.
+        per_page: Run against every page size. False for benchmarks independent of the page, run once.
+    """
+
+    def decorator(func: Callable[["BenchContext"], Any]) -> Callable[["BenchContext"], Any]:
+        func.repeat, func.warmup, func.setup, func.per_page = repeat, warmup, setup, per_page
+        return func
+
+    return decorator
+
+
+class RoundTripCounter:
+    """Counts WebDriver script executions by wrapping the driver's methods."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.count = 0
+        for name in ("execute_script", "execute_async_script"):
+            original = getattr(driver, name)
+
+            def counting(*args, _original=original, **kwargs):
+                self.count += 1
+                return _original(*args, **kwargs)
+
+            setattr(driver, name, counting)
+
+
+class BenchContext:
+    """State shared by the benchmarks of one page."""
+
+    def __init__(self, driver, page: Path, nodes: int):
+        """Load a page and bind a BrowserJQuery to it.
+
+        Args:
+            driver: The webdriver instance.
+            page: Path of the page to load.
+            nodes: Number of element nodes of the page.
+        """
+        self.driver = driver
+        self.page = page
+        self.nodes = nodes
+        self.counter = RoundTripCounter(driver)
+        self.reload()
+
+    @property
+    def url(self) -> str:
+        return self.page.resolve().as_uri()
+
+    def reload(self):
+        """Load the page again, dropping all in-page state."""
+        self.driver.get(self.url)
+        self.browser = BrowserJQuery(self.driver)
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """Get a percentile of sorted samples, by linear interpolation."""
+    position = (len(samples) - 1) * fraction
+    low = int(position)
+    high = min(low + 1, len(samples) - 1)
+    return samples[low] + (samples[high] - samples[low]) * (position - low)
+
+
+def run_benchmark(func: Callable[[BenchContext], Any], context: BenchContext) -> dict[str, float]:
+    """Time a benchmark function.
+
+    Returns:
+        Latency percentiles and mean in milliseconds, and round-trips per call.
+    """
+    repeat, warmup, setup = getattr(func, "repeat", 20), getattr(func, "warmup", 2), getattr(func, "setup", None)
+    for _ in range(warmup):
+        if setup:
+            setup(context)
+        func(context)
+
+    samples, round_trips = [], 0
+    for _ in range(repeat):
+        if setup:
+            setup(context)
+        count = context.counter.count
+        start = time.perf_counter()
+        func(context)
+        samples.append((time.perf_counter() - start) * 1000)
+        round_trips += context.counter.count - count
+
+    samples.sort()
+    return {
+        "p50_ms": percentile(samples, 0.5),
+        "p90_ms": percentile(samples, 0.9),
+        "p99_ms": percentile(samples, 0.99),
+        "mean_ms": statistics.fmean(samples),
+        "round_trips": round_trips / repeat,
+    }
@@ -0,0 +1,73 @@
+"""Synthetic pages for benchmarks.
+
+Pages are lists of product cards grouped in sections, generated deterministically for a target
+number of element nodes and cached on disk, so that runs on the same machine load the same page.
+"""
+
+import random
+from pathlib import Path
+
+# Element nodes per card: div.card, h2, p, span, ul, 3 li, a, span.price
+NODES_PER_CARD = 10
+CARDS_PER_SECTION = 20
+WORDS = "alpha beta gamma delta epsilon zeta eta theta iota kappa lambda omicron sigma tau upsilon omega".split()
+
+# Text present exactly once per page, in the last card, for text searches.
+NEEDLE = "Needle in the haystack"
+
+
+def card(index: int, rng: random.Random) -> str:
+    words = " ".join(rng.choice(WORDS) for _ in range(12))
+    tags = "".join(f"<li class='tag'>{rng.choice(WORDS)}</li>" for _ in range(3))
+    hidden = " hidden" if index % 7 == 0 else ""
+    return (
+        f"<div class='card{hidden}' data-id='{index}'>"
+        f"<h2 class='title'>Product {index}</h2>"
+        f"<p class='description'>{words} <span class='highlight'>{rng.choice(WORDS)}</span></p>"
+        f"<ul class='tags'>{tags}</ul>"
+        f"<a class='link' href='/products/{index}'>Details</a>"
+        f"<span class='price'>{rng.randint(1, 999)}.99</span>"
+        "</div>"
+    )
+
+
+def generate_page(nodes: int, seed: int = 0) -> str:
+    """Generate a page with roughly `nodes` element nodes.
+
+    Args:
+        nodes: Target number of element nodes.
+        seed: Seed of the text generator.
+
+    Returns:
+        The page HTML.
+    """
+    rng = random.Random(seed)
+    cards = max(1, nodes // NODES_PER_CARD)
+    sections = []
+    for start in range(0, cards, CARDS_PER_SECTION):
+        body = "".join(card(index, rng) for index in range(start, min(start + CARDS_PER_SECTION, cards)))
+        sections.append(f"<section class='group' id='group-{start // CARDS_PER_SECTION}'>{body}</section>")
+    sections[-1] = sections[-1].replace("</div></section>", f"<p class='needle'>{NEEDLE}</p></div></section>")
+    return (
+        "<!DOCTYPE html><html><head><meta charset='utf-8'><title>Benchmark page</title>"
+        "<style>.hidden { display: none; }</style></head>"
+        f"<body><header><nav><a href='#'>Home</a><a href='#'>Catalog</a></nav></header>"
+        f"<main id='catalog'>{''.join(sections)}</main></body></html>"
+    )
+
+
+def page_path(nodes: int, directory: Path) -> Path:
+    """Get the path of the page with `nodes` element nodes, generating it if needed.
+
+    Args:
+        nodes: Target number of element nodes.
+        directory: Directory caching the generated pages.
+
+    Returns:
+        The path of the page.
+    """
+    path = directory / f"page_{nodes}.html"
+    if not path.exists():
+        directory.mkdir(parents=True, exist_ok=True)
+        path.write_text(generate_page(nodes), encoding="utf-8")
+    return path
@@ -1 +1,30 @@
-from browserjquery.jquery import BrowserJQuery  # noqa
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from browserjquery.async_jquery import AsyncBrowserJQuery
+    from browserjquery.jquery import BrowserJQuery
+    from browserjquery.pool import BrowserJQueryPool
+
+__all__ = ["AsyncBrowserJQuery", "BrowserJQuery", "BrowserJQueryPool"]
+
+# Public names and the submodules defining them, imported on first access (PEP 562) so that importing
+# the package does not load selenium.
+_LAZY_NAMES = {
+    "AsyncBrowserJQuery": "browserjquery.async_jquery",
+    "BrowserJQuery": "browserjquery.jquery",
+    "BrowserJQueryPool": "browserjquery.pool",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_NAMES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
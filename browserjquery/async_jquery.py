@@ -0,0 +1,494 @@
+import asyncio
+import functools
+import re
+import threading
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, TypeVar, Union
+
+from selenium import webdriver
+from selenium.webdriver.remote import webelement
+
+from browserjquery import settings
+from browserjquery.chain import QueryChain
+from browserjquery.jquery import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_WAIT_TIMEOUT,
+    HTML_CHUNK_SIZE,
+    BrowserJQuery,
+    BrowserJQueryCollection,
+    LazyBrowserJQueryCollection,
+)
+from browserjquery.session import BrowserSession
+from browserjquery.snapshot import BrowserSnapshot
+
+logger = settings.getLogger(__name__)
+
+R = TypeVar("R")
+
+_EXECUTOR: ThreadPoolExecutor | None = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def default_executor() -> ThreadPoolExecutor:
+    """Get the thread pool shared by all AsyncBrowserJQuery instances, created on first use.
+
+    Its size is bounded by `settings.ASYNC_MAX_WORKERS`; calls on the same driver are serialized by the
+    driver's session, so the pool only runs calls of different drivers in parallel.
+    """
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(max_workers=settings.ASYNC_MAX_WORKERS, thread_name_prefix="browserjquery")
+        return _EXECUTOR
+
+
+def driver_lock(driver, loop: asyncio.AbstractEventLoop) -> asyncio.Lock:
+    """Get the lock serializing calls on a driver within an event loop."""
+    locks = BrowserSession.for_driver(driver).async_locks
+    lock = locks.get(loop)
+    if lock is None:
+        lock = locks[loop] = asyncio.Lock()
+    return lock
+
+
+async def run_in_executor(driver, executor: Executor | None, func: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+    """Run a blocking call using a driver in a thread pool, one call at a time per driver.
+
+    Args:
+        driver: The webdriver instance the call uses.
+        executor: Executor to run the call in. Defaults to the shared thread pool.
+        func: The callable to run.
+        *args: Positional arguments of the call.
+        **kwargs: Keyword arguments of the call.
+
+    Returns:
+        The result of the call.
+    """
+    loop = asyncio.get_running_loop()
+    async with driver_lock(driver, loop):
+        return await loop.run_in_executor(executor or default_executor(), functools.partial(func, *args, **kwargs))
+
+
+class AsyncBrowserJQuery:
+    """Asyncio front-end to BrowserJQuery.
+
+    Every query runs the synchronous implementation in a bounded thread pool, one call at a time per
+    driver, so coroutines of different drivers can be awaited concurrently with `asyncio.gather`.
+
+    Usage:
+        browser = await AsyncBrowserJQuery.create(driver)
+        async for link in await browser.find("a"):
+            print(await link.text())
+    """
+
+    def __init__(self, browser: BrowserJQuery, executor: Executor | None = None):
+        """Wrap a BrowserJQuery instance; this does not touch the browser.
+
+        Args:
+            browser: The synchronous BrowserJQuery to run queries with.
+            executor: Executor running the WebDriver calls. Defaults to the shared thread pool.
+        """
+        self.browser = browser
+        self.executor = executor
+
+    @classmethod
+    async def create(
+        cls,
+        driver: webdriver.Chrome | webdriver.Firefox,
+        default_element=None,
+        executor: Executor | None = None,
+    ) -> "AsyncBrowserJQuery":
+        """Create an instance for a driver, injecting jQuery without blocking the event loop.
+
+        Args:
+            driver: A Chrome or Firefox webdriver instance.
+            default_element: The element queries run on. Defaults to the document.
+            executor: Executor running the WebDriver calls. Defaults to the shared thread pool.
+
+        Returns:
+            The AsyncBrowserJQuery instance.
+        """
+        instance = cls.__new__(cls)
+        instance.executor = executor
+        instance.browser = await run_in_executor(driver, executor, BrowserJQuery, driver, default_element)
+        return instance
+
+    @property
+    def driver(self) -> webdriver.Chrome | webdriver.Firefox:
+        """The webdriver instance."""
+        return self.browser.driver
+
+    @property
+    def default_element(self):
+        """The element queries run on."""
+        return self.browser.default_element
+
+    def __repr__(self) -> str:
+        return f"<AsyncBrowserJQuery {self.default_element!r}>"
+
+    async def run(self, func: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+        """Run any synchronous call using this driver in the thread pool, serialized with other queries.
+
+        This is the escape hatch for WebDriver APIs without an async counterpart, e.g.
+        `await browser.run(browser.driver.get, url)`.
+
+        Args:
+            func: The callable to run.
+            *args: Positional arguments of the call.
+            **kwargs: Keyword arguments of the call.
+
+        Returns:
+            The result of the call.
+        """
+        return await run_in_executor(self.driver, self.executor, func, *args, **kwargs)
+
+    async def _call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Run a BrowserJQuery method and wrap its result for async use."""
+        return self._wrap_result(await self.run(getattr(self.browser, method), *args, **kwargs))
+
+    def _wrap_result(self, result: Any) -> Any:
+        if isinstance(result, BrowserJQuery):
+            return AsyncBrowserJQuery(result, executor=self.executor)
+        if isinstance(result, BrowserJQueryCollection):
+            return AsyncBrowserJQueryCollection(result, executor=self.executor)
+        return result
+
+    # Core methods
+    async def execute(self, script: str, *args: Any) -> Any:
+        """Async version of `BrowserJQuery.execute`."""
+        return await self._call("execute", script, *args)
+
+    async def query(self, script: str, element: webelement.WebElement | None = None, *args: Any) -> Any:
+        """Async version of `BrowserJQuery.query`."""
+        return await self._call("query", script, element, *args)
+
+    async def call(self, operation: str, *args: Any, element: webelement.WebElement | None = None) -> Any:
+        """Async version of `BrowserJQuery.call`."""
+        return await self._call("call", operation, *args, element=element)
+
+    async def ensure_jquery(self):
+        """Async version of `BrowserJQuery.ensure_jquery`."""
+        await self._call("ensure_jquery")
+
+    async def inject_jquery(self, by: str = "file", wait: int = 5) -> bool:
+        """Async version of `BrowserJQuery.inject_jquery`."""
+        return await self._call("inject_jquery", by=by, wait=wait)
+
+    async def page_html(self) -> str:
+        """Get the complete HTML of the current page, see `BrowserJQuery.page_html`."""
+        return await self.run(lambda: self.browser.page_html)
+
+    async def iter_html(self, chunk_size: int = HTML_CHUNK_SIZE, *, compress: bool = False) -> AsyncIterator[str]:
+        """Async version of `BrowserJQuery.iter_html`, fetching each slice in the thread pool."""
+        parts = self.browser.iter_html(chunk_size, compress=compress)
+        try:
+            while (part := await self.run(next, parts, None)) is not None:
+                yield part
+        finally:
+            await self.run(parts.close)
+
+    async def save_html(self, path: str | Path, *, compress: bool = False, chunk_size: int = HTML_CHUNK_SIZE):
+        """Async version of `BrowserJQuery.save_html`; the file is written from the thread pool."""
+        await self._call("save_html", path, compress=compress, chunk_size=chunk_size)
+
+    async def snapshot(self) -> BrowserSnapshot:
+        """Async version of `BrowserJQuery.snapshot`; queries on the snapshot are synchronous and local."""
+        return await self._call("snapshot")
+
+    # Element finding methods
+    async def find(
+        self, selector: str, *, lazy: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> "AsyncBrowserJQueryCollection":
+        """Async version of `BrowserJQuery.find`."""
+        return await self._call("find", selector, lazy=lazy, chunk_size=chunk_size)
+
+    async def extract(
+        self, selector: str, fields: dict[str, str], *, columns: bool = False
+    ) -> list[dict[str, Any]] | dict[str, list[Any]]:
+        """Async version of `BrowserJQuery.extract`."""
+        return await self._call("extract", selector, fields, columns=columns)
+
+    def chain(self, selector: str | None = None) -> "AsyncQueryChain":
+        """Async version of `BrowserJQuery.chain`; steps are built without awaiting, terminals are awaited."""
+        return AsyncQueryChain(self.browser.chain(selector), executor=self.executor)
+
+    async def stream(
+        self, selector: str, fields: dict[str, str] | None = None, *, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[Union["AsyncBrowserJQuery", dict[str, Any]]]:
+        """Async version of `BrowserJQuery.stream`, fetching each chunk in the thread pool."""
+        chunks = self.browser.stream_chunks(selector, fields, chunk_size=chunk_size)
+        try:
+            while (chunk := await self.run(next, chunks, None)) is not None:
+                for item in chunk:
+                    yield self._wrap_result(item)
+        finally:
+            await self.run(chunks.close)
+
+    async def find_closest_ancestor(self, selector: str) -> Union["AsyncBrowserJQuery", None]:
+        """Async version of `BrowserJQuery.find_closest_ancestor`."""
+        return await self._call("find_closest_ancestor", selector)
+
+    # Element traversal methods
+    async def parent(self) -> list[webelement.WebElement]:
+        """Async version of `BrowserJQuery.parent`."""
+        return await self._call("parent")
+
+    async def parents(self) -> list[webelement.WebElement]:
+        """Async version of `BrowserJQuery.parents`."""
+        return await self._call("parents")
+
+    async def children(self, selector: str | None = None) -> list[webelement.WebElement]:
+        """Async version of `BrowserJQuery.children`."""
+        return await self._call("children", selector)
+
+    async def siblings(self, selector: str | None = None) -> list[webelement.WebElement]:
+        """Async version of `BrowserJQuery.siblings`."""
+        return await self._call("siblings", selector)
+
+    async def next(self, selector: str | None = None) -> Union["AsyncBrowserJQuery", None]:
+        """Async version of `BrowserJQuery.next`."""
+        return await self._call("next", selector)
+
+    async def prev(self, selector: str | None = None) -> Union["AsyncBrowserJQuery", None]:
+        """Async version of `BrowserJQuery.prev`."""
+        return await self._call("prev", selector)
+
+    async def items(self) -> list[webelement.WebElement]:
+        """Async version of `BrowserJQuery.items`."""
+        return await self._call("items")
+
+    async def first(self) -> Union["AsyncBrowserJQuery", None]:
+        """Async version of `BrowserJQuery.first`."""
+        return await self._call("first")
+
+    async def last(self) -> Union["AsyncBrowserJQuery", None]:
+        """Async version of `BrowserJQuery.last`."""
+        return await self._call("last")
+
+    # Element state/attribute methods
+    async def has_class(self, class_name: str) -> bool:
+        """Async version of `BrowserJQuery.has_class`."""
+        return await self._call("has_class", class_name)
+
+    async def matches_selector(self, selector: str) -> bool:
+        """Async version of `BrowserJQuery.matches_selector`."""
+        return await self._call("matches_selector", selector)
+
+    async def has(self, selector: str) -> bool:
+        """Async version of `BrowserJQuery.has`."""
+        return await self._call("has", selector)
+
+    async def attr(self, attribute_name: str) -> str | None:
+        """Async version of `BrowserJQuery.attr`."""
+        return await self._call("attr", attribute_name)
+
+    async def text(self) -> str:
+        """Async version of `BrowserJQuery.text`."""
+        return await self._call("text")
+
+    async def html(self) -> str:
+        """Async version of `BrowserJQuery.html`."""
+        return await self._call("html")
+
+    async def is_visible(self) -> bool:
+        """Async version of `BrowserJQuery.is_visible`."""
+        return await self._call("is_visible")
+
+    async def is_checked(self) -> bool:
+        """Async version of `BrowserJQuery.is_checked`."""
+        return await self._call("is_checked")
+
+    async def is_disabled(self) -> bool:
+        """Async version of `BrowserJQuery.is_disabled`."""
+        return await self._call("is_disabled")
+
+    # Text-based search methods
+    async def find_elements_with_text(
+        self, text: str | re.Pattern, selector: str = "*", *, mode: str = "contains", limit: int | None = None
+    ) -> "AsyncBrowserJQueryCollection":
+        """Async version of `BrowserJQuery.find_elements_with_text`."""
+        return await self._call("find_elements_with_text", text, selector, mode=mode, limit=limit)
+
+    async def find_deepest_elements_with_text(
+        self, text: str | re.Pattern, selector: str = "*", *, mode: str = "contains", limit: int | None = None
+    ) -> "AsyncBrowserJQueryCollection":
+        """Async version of `BrowserJQuery.find_deepest_elements_with_text`."""
+        return await self._call("find_deepest_elements_with_text", text, selector, mode=mode, limit=limit)
+
+    async def find_lowest_element_with_text(
+        self, text: str | re.Pattern, selector: str = "*", *, exact_match: bool = False, mode: str = "contains"
+    ) -> Union["AsyncBrowserJQuery", None]:
+        """Async version of `BrowserJQuery.find_lowest_element_with_text`."""
+        return await self._call("find_lowest_element_with_text", text, selector, exact_match=exact_match, mode=mode)
+
+    async def find_elements_with_selector_and_text(
+        self,
+        selector: str,
+        text: str | re.Pattern,
+        *,
+        exact_match: bool = False,
+        mode: str = "contains",
+        limit: int | None = None,
+    ) -> "AsyncBrowserJQueryCollection":
+        """Async version of `BrowserJQuery.find_elements_with_selector_and_text`."""
+        return await self._call(
+            "find_elements_with_selector_and_text", selector, text, exact_match=exact_match, mode=mode, limit=limit
+        )
+
+    # Waiting methods
+    async def wait_for(
+        self, selector: str, *, text: str | None = None, visible: bool = False, timeout: float = DEFAULT_WAIT_TIMEOUT
+    ) -> "AsyncBrowserJQueryCollection":
+        """Async version of `BrowserJQuery.wait_for`; other queries on the driver wait until it returns."""
+        return await self._call("wait_for", selector, text=text, visible=visible, timeout=timeout)
+
+    async def wait_until_gone(
+        self, selector: str, *, text: str | None = None, visible: bool = False, timeout: float = DEFAULT_WAIT_TIMEOUT
+    ):
+        """Async version of `BrowserJQuery.wait_until_gone`."""
+        await self._call("wait_until_gone", selector, text=text, visible=visible, timeout=timeout)
+
+
+class AsyncBrowserJQueryCollection:
+    """Asyncio front-end to BrowserJQueryCollection and LazyBrowserJQueryCollection.
+
+    Supports `len()` and `async for`. Elements of lazy collections are fetched chunk by chunk in the
+    thread pool while iterating.
+    """
+
+    def __init__(self, collection: BrowserJQueryCollection, executor: Executor | None = None):
+        """Wrap a collection.
+
+        Args:
+            collection: The synchronous collection.
+            executor: Executor running the WebDriver calls. Defaults to the shared thread pool.
+        """
+        self.collection = collection
+        self.executor = executor
+
+    @property
+    def lazy(self) -> bool:
+        """Whether the elements are still held by the page."""
+        return isinstance(self.collection, LazyBrowserJQueryCollection)
+
+    def __len__(self) -> int:
+        """Get the number of elements in the collection, without a round-trip."""
+        return len(self.collection)
+
+    async def __aiter__(self) -> AsyncIterator[Union[AsyncBrowserJQuery, str]]:
+        """Iterate over the elements, fetching lazy collections `chunk_size` elements at a time."""
+        if not self.lazy:
+            for index, element in enumerate(self.collection.elements):
+                yield self._wrap(element, index)
+            return
+
+        collection: LazyBrowserJQueryCollection = self.collection
+        for start in range(0, collection.count, collection.chunk_size):
+            stop = min(start + collection.chunk_size, collection.count)
+            for offset, element in enumerate(await self._run(collection.fetch, start, stop)):
+                yield self._wrap(element, start + offset)
+
+    async def _run(self, func: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+        return await run_in_executor(self.collection.driver, self.executor, func, *args, **kwargs)
+
+    def _wrap(self, element: Union[webelement.WebElement, str], index: int) -> Union[AsyncBrowserJQuery, str]:
+        if isinstance(element, str):
+            return element
+        return AsyncBrowserJQuery(self.collection._wrap(element, index), executor=self.executor)
+
+    async def elements(self) -> list[webelement.WebElement]:
+        """Get all elements of the collection, fetching them from the page for lazy collections."""
+        if not self.lazy:
+            return self.collection.elements
+        return await self._run(lambda: self.collection.elements)
+
+    async def get(self, index: int) -> Union[AsyncBrowserJQuery, str]:
+        """Get an element by index."""
+        item = self.collection[index] if not self.lazy else await self._run(self.collection.__getitem__, index)
+        return item if isinstance(item, str) else AsyncBrowserJQuery(item, executor=self.executor)
+
+    async def first(self) -> Union[AsyncBrowserJQuery, str, None]:
+        """Get the first element in the collection, or None if empty."""
+        return await self.get(0) if len(self) else None
+
+    async def last(self) -> Union[AsyncBrowserJQuery, str, None]:
+        """Get the last element in the collection, or None if empty."""
+        return await self.get(-1) if len(self) else None
+
+    async def items(self) -> list[Union[AsyncBrowserJQuery, str]]:
+        """Get all elements in the collection."""
+        return [item async for item in self]
+
+    async def extract(
+        self, fields: dict[str, str], *, columns: bool = False
+    ) -> list[dict[str, Any]] | dict[str, list[Any]]:
+        """Async version of `BrowserJQueryCollection.extract`."""
+        return await self._run(self.collection.extract, fields, columns=columns)
+
+    async def release(self):
+        """Drop the match set of a lazy collection from the page; does nothing for eager collections."""
+        if self.lazy:
+            await self._run(self.collection.release)
+
+
+class AsyncQueryChain:
+    """Asyncio front-end to QueryChain.
+
+    Steps (`find`, `children`, `filter`...) return a new AsyncQueryChain without touching the browser;
+    terminals run the chain in the thread pool.
+    """
+
+    def __init__(self, chain: QueryChain, executor: Executor | None = None):
+        """Wrap a QueryChain.
+
+        Args:
+            chain: The synchronous chain to build and run.
+            executor: Executor running the WebDriver calls. Defaults to the shared thread pool.
+        """
+        self.chain = chain
+        self.executor = executor
+
+    def __repr__(self) -> str:
+        return f"<Async{repr(self.chain)[1:]}"
+
+    def __getattr__(self, name: str) -> Callable[..., "AsyncQueryChain"]:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        step = getattr(self.chain, name)
+
+        @functools.wraps(step)
+        def wrapper(*args: Any, **kwargs: Any) -> "AsyncQueryChain":
+            return AsyncQueryChain(step(*args, **kwargs), executor=self.executor)
+
+        return wrapper
+
+    async def _run(self, func: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+        return await run_in_executor(self.chain.browser.driver, self.executor, func, *args, **kwargs)
+
+    async def get(self) -> AsyncBrowserJQueryCollection:
+        """Async version of `QueryChain.get`."""
+        return AsyncBrowserJQueryCollection(await self._run(self.chain.get), executor=self.executor)
+
+    async def count(self) -> int:
+        """Async version of `QueryChain.count`."""
+        return await self._run(self.chain.count)
+
+    async def extract(
+        self, fields: dict[str, str], *, columns: bool = False
+    ) -> list[dict[str, Any]] | dict[str, list[Any]]:
+        """Async version of `QueryChain.extract`."""
+        return await self._run(self.chain.extract, fields, columns=columns)
+
+    async def values(self, spec: str) -> list[Any]:
+        """Async version of `QueryChain.values`."""
+        return await self._run(self.chain.values, spec)
+
+    async def attr(self, name: str) -> list[Any]:
+        """Async version of `QueryChain.attr`."""
+        return await self._run(self.chain.attr, name)
+
+    async def text(self) -> list[str]:
+        """Async version of `QueryChain.text`."""
+        return await self._run(self.chain.text)
@@ -0,0 +1,134 @@
+from collections.abc import Callable
+from typing import Any
+
+from selenium.common.exceptions import JavascriptException
+
+from browserjquery import jquery_scripts, settings
+
+logger = settings.getLogger(__name__)
+
+
+class Deferred:
+    """Placeholder for the result of a query recorded inside a batch.
+
+    The value becomes available once the batch it belongs to has been flushed.
+    """
+
+    def __init__(self):
+        """Initialize an unresolved deferred result."""
+        self.resolved = False
+        self._value: Any = None
+        self._error: str | None = None
+        self._callbacks: list[Callable[[Any], Any]] = []
+
+    def then(self, callback: Callable[[Any], Any]) -> "Deferred":
+        """Register a transformation applied to the raw result on resolution.
+
+        Args:
+            callback: Function receiving the (already transformed) result.
+
+        Returns:
+            The same deferred, to allow chaining.
+        """
+        if self.resolved:
+            self._value = callback(self._value)
+        else:
+            self._callbacks.append(callback)
+        return self
+
+    def resolve(self, value: Any = None, error: str | None = None):
+        """Resolve the deferred with the raw value returned by the page.
+
+        Args:
+            value: The raw value returned for this query.
+            error: The in-page error message, if the query raised.
+        """
+        self._error = error
+        if error is None:
+            for callback in self._callbacks:
+                value = callback(value)
+        self._value = value
+        self._callbacks = []
+        self.resolved = True
+
+    @property
+    def value(self) -> Any:
+        """Get the resolved value.
+
+        Raises:
+            RuntimeError: If the batch has not been flushed yet.
+            JavascriptException: If the query raised an error in the page.
+        """
+        if not self.resolved:
+            raise RuntimeError("Batch has not been executed yet; read deferred values after the batch exits.")
+        if self._error is not None:
+            raise JavascriptException(self._error)
+        return self._value
+
+    def __repr__(self) -> str:
+        state = repr(self._value) if self.resolved else "pending"
+        return f"<Deferred {state}>"
+
+
+class QueryBatch:
+    """Records queries and ships them to the browser in a single round-trip.
+
+    Usage:
+        with browser.batch() as batch:
+            title = card.text()
+            link = card.attr("href")
+        print(title.value, link.value)
+    """
+
+    def __init__(self, driver):
+        """Initialize an empty batch.
+
+        Args:
+            driver: The webdriver instance the batch executes on.
+        """
+        self.driver = driver
+        self.calls: list[tuple[str, list[Any], Deferred]] = []
+
+    def __len__(self) -> int:
+        """Get the number of pending queries."""
+        return len(self.calls)
+
+    def add(self, script: str, *args: Any) -> Deferred:
+        """Record a script for deferred execution.
+
+        Args:
+            script: The JavaScript to execute, reading its input from `arguments`.
+            *args: Arguments the script receives.
+
+        Returns:
+            A Deferred resolved when the batch is flushed.
+        """
+        deferred = Deferred()
+        self.calls.append((script, list(args), deferred))
+        return deferred
+
+    def flush(self) -> list[Deferred]:
+        """Execute all pending queries in one combined script.
+
+        Returns:
+            The deferred results, in the order the queries were recorded.
+        """
+        calls, self.calls = self.calls, []
+        if not calls:
+            return []
+
+        script = jquery_scripts.BATCH_WRAPPER.format(
+            calls=",\n".join(
+                jquery_scripts.BATCH_CALL.format(script=call_script, index=index)
+                for index, (call_script, _, _) in enumerate(calls)
+            )
+        )
+        logger.debug("Executing batch of %d queries", len(calls))
+        results = self.driver.execute_script(script, *[call_args for _, call_args, _ in calls])
+
+        for (_, _, deferred), (ok, value) in zip(calls, results):
+            if ok:
+                deferred.resolve(value)
+            else:
+                deferred.resolve(error=value)
+        return [deferred for _, _, deferred in calls]
@@ -0,0 +1,160 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+from selenium.webdriver.remote import webelement
+
+from browserjquery import settings
+
+logger = settings.getLogger(__name__)
+
+# Library operations that only read the page, whose results can be cached.
+CACHEABLE_OPERATIONS = frozenset(
+    {
+        "find",
+        "findById",
+        "matches",
+        "has",
+        "isVisible",
+        "isChecked",
+        "isDisabled",
+        "hasClass",
+        "attr",
+        "text",
+        "html",
+        "parent",
+        "parents",
+        "children",
+        "siblings",
+        "next",
+        "prev",
+        "closest",
+        "first",
+        "last",
+        "textSearch",
+        "extract",
+        "findAndExtract",
+        "chain",
+    }
+)
+
+# Default maximum number of cached results.
+DEFAULT_CACHE_SIZE = 1024
+
+
+def freeze(value: Any) -> Hashable:
+    """Convert query arguments to a hashable key; elements are identified by their WebDriver id."""
+    if isinstance(value, webelement.WebElement):
+        return ("element", value.id)
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, freeze(item)) for key, item in value.items()))
+    return value
+
+
+class ResultCache:
+    """Bounded LRU cache of read-only query results, enabled with `BrowserJQuery.enable_cache()`.
+
+    Results are keyed by (element id, operation, arguments). While caching is enabled, every library
+    call also returns the page's mutation epoch, which changes on any DOM mutation (tracked by a
+    MutationObserver) and on navigation; the cache is cleared whenever a round-trip observes a new
+    epoch, when a raw script or an element method (click, send_keys...) may have changed the page,
+    and after navigation commands sent through the driver (`get`, `refresh`, `back`, switching windows
+    or frames...).
+
+    Hits are served without contacting the page, so changes made by the page itself since the last
+    round-trip, including navigations it starts, are only noticed on the next one. `max_age` bounds
+    that delay: hits are only served within `max_age` seconds of the last round-trip. Visibility
+    changes caused by layout alone (CSS media queries, resizing) are not DOM mutations and are not
+    detected.
+    """
+
+    def __init__(self, size: int = DEFAULT_CACHE_SIZE, max_age: float | None = None):
+        """Initialize an empty cache.
+
+        Args:
+            size: Maximum number of cached results; the least recently used are evicted first.
+            max_age: Seconds after the last round-trip during which hits are served. None for no limit.
+        """
+        if size < 1:
+            raise ValueError("Cache size must be at least 1")
+        self.size = size
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.epoch: str | None = None
+        self._synced_at = 0.0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key(self, element: Any, operation: str, args: tuple) -> Hashable | None:
+        """Get the cache key of a call, or None if the operation or its arguments cannot be cached."""
+        if operation not in CACHEABLE_OPERATIONS:
+            return None
+        key = (freeze(element), operation, freeze(args))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def lookup(self, key: Hashable) -> tuple[bool, Any]:
+        """Look up a result.
+
+        Returns:
+            (True, result) on a hit, (False, None) on a miss.
+        """
+        with self._lock:
+            fresh = self.max_age is None or time.monotonic() - self._synced_at < self.max_age
+            if fresh and key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                value = self._entries[key]
+                return True, list(value) if isinstance(value, list) else value
+            self.misses += 1
+            return False, None
+
+    def store(self, key: Hashable, value: Any):
+        """Cache the result of a call made at the current epoch."""
+        with self._lock:
+            self._entries[key] = list(value) if isinstance(value, list) else value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def sync(self, epoch: str):
+        """Record the epoch returned by a round-trip, dropping all results if the page changed since."""
+        with self._lock:
+            if epoch != self.epoch:
+                if self._entries:
+                    self.invalidations += 1
+                self._entries.clear()
+                self.epoch = epoch
+            self._synced_at = time.monotonic()
+
+    def clear(self):
+        """Drop all cached results, e.g. when the page may have changed without a new epoch being seen."""
+        with self._lock:
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+            self.epoch = None
+
+    def stats(self) -> dict[str, int | float]:
+        """Get hit and miss counts, the hit rate, the number of invalidations and the current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "invalidations": self.invalidations,
+                "size": len(self._entries),
+            }
@@ -0,0 +1,173 @@
+import functools
+import operator
+from typing import TYPE_CHECKING, Any
+
+from browserjquery import settings
+from browserjquery.batch import Deferred
+from browserjquery.jquery import BrowserJQueryCollection, parse_extract_field, parse_extract_fields, wrap_result
+
+if TYPE_CHECKING:
+    from browserjquery.jquery import BrowserJQuery
+
+logger = settings.getLogger(__name__)
+
+# A chain step: jQuery method name and its arguments.
+Step = tuple[str, tuple]
+
+
+class QueryChain:
+    """A jQuery traversal built step by step and run in the page by a terminal operation.
+
+    Building a chain does not touch the browser: each step returns a new chain, so a chain can be
+    extended in several ways. Terminals (`get()`, `count()`, `values()`, `attr()`, `text()`,
+    `extract()`) send the whole pipeline in a single round-trip and only transfer its final result,
+    instead of one round-trip and one intermediate wrapper per step.
+
+    Usage:
+        hrefs = browser.chain("ul.menu").first().children("li").not_(".hidden").find("a").attr("href")
+    """
+
+    def __init__(self, browser: "BrowserJQuery", steps: tuple[Step, ...] = ()):
+        """Initialize a chain starting from the default element of a browser.
+
+        Args:
+            browser: The BrowserJQuery instance whose default element the chain starts from.
+            steps: The jQuery methods applied in turn, with their arguments.
+        """
+        self.browser = browser
+        self.steps = steps
+
+    def __repr__(self) -> str:
+        return "<QueryChain " + "".join(f".{method}({', '.join(map(repr, args))})" for method, args in self.steps) + ">"
+
+    def _then(self, method: str, *args: Any) -> "QueryChain":
+        """Extend the chain with a jQuery method; None arguments (omitted selectors) are not sent."""
+        return QueryChain(self.browser, self.steps + ((method, tuple(arg for arg in args if arg is not None)),))
+
+    # Steps
+    def find(self, selector: str) -> "QueryChain":
+        """Select the descendants matching a selector."""
+        return self._then("find", selector)
+
+    def filter(self, selector: str) -> "QueryChain":
+        """Keep the elements matching a selector."""
+        return self._then("filter", selector)
+
+    def not_(self, selector: str) -> "QueryChain":
+        """Drop the elements matching a selector."""
+        return self._then("not", selector)
+
+    def has(self, selector: str) -> "QueryChain":
+        """Keep the elements with a descendant matching a selector."""
+        return self._then("has", selector)
+
+    def first(self) -> "QueryChain":
+        """Keep the first element."""
+        return self._then("first")
+
+    def last(self) -> "QueryChain":
+        """Keep the last element."""
+        return self._then("last")
+
+    def eq(self, index: int) -> "QueryChain":
+        """Keep the element at an index, negative indexes counting from the end."""
+        return self._then("eq", index)
+
+    def slice(self, start: int, stop: int | None = None) -> "QueryChain":
+        """Keep the elements from `start` to `stop` (excluded)."""
+        return self._then("slice", start, stop)
+
+    def children(self, selector: str | None = None) -> "QueryChain":
+        """Select the children, optionally filtered by a selector."""
+        return self._then("children", selector)
+
+    def parent(self, selector: str | None = None) -> "QueryChain":
+        """Select the parents, optionally filtered by a selector."""
+        return self._then("parent", selector)
+
+    def parents(self, selector: str | None = None) -> "QueryChain":
+        """Select the ancestors, optionally filtered by a selector."""
+        return self._then("parents", selector)
+
+    def closest(self, selector: str) -> "QueryChain":
+        """Select the closest ancestor-or-self of each element matching a selector."""
+        return self._then("closest", selector)
+
+    def siblings(self, selector: str | None = None) -> "QueryChain":
+        """Select the siblings, optionally filtered by a selector."""
+        return self._then("siblings", selector)
+
+    def next(self, selector: str | None = None) -> "QueryChain":
+        """Select the next sibling of each element, optionally filtered by a selector."""
+        return self._then("next", selector)
+
+    def next_all(self, selector: str | None = None) -> "QueryChain":
+        """Select all following siblings, optionally filtered by a selector."""
+        return self._then("nextAll", selector)
+
+    def prev(self, selector: str | None = None) -> "QueryChain":
+        """Select the previous sibling of each element, optionally filtered by a selector."""
+        return self._then("prev", selector)
+
+    def prev_all(self, selector: str | None = None) -> "QueryChain":
+        """Select all preceding siblings, optionally filtered by a selector."""
+        return self._then("prevAll", selector)
+
+    # Terminals
+    def _arguments(self, terminal: str, fields: list | None = None) -> tuple:
+        return [[method, list(args)] for method, args in self.steps], terminal, fields
+
+    def _run(self, terminal: str, fields: list | None = None) -> Any:
+        return self.browser.call("chain", *self._arguments(terminal, fields))
+
+    def get(self) -> BrowserJQueryCollection | Deferred:
+        """Run the chain and get the selected elements.
+
+        Returns:
+            A BrowserJQueryCollection, or a Deferred when called inside `batch()`.
+        """
+        args = self._arguments("get")
+        # Stale elements are relocated by replaying the chain, like the results of other library calls.
+        origin = self.browser._origin("chain", args)
+        result = self.browser.call("chain", *args)
+        create = functools.partial(wrap_result, self.browser, origin=origin)
+        return result.then(create) if isinstance(result, Deferred) else create(result)
+
+    def count(self) -> int | Deferred:
+        """Run the chain and get the number of selected elements, without transferring them."""
+        return self._run("count")
+
+    def extract(
+        self, fields: dict[str, str], *, columns: bool = False
+    ) -> list[dict[str, Any]] | dict[str, list[Any]] | Deferred:
+        """Run the chain and extract fields from the selected elements.
+
+        Args:
+            fields: Mapping of field names to field specs, see `BrowserJQueryCollection.extract`.
+            columns: Return a dict of column lists instead of a list of records.
+
+        Returns:
+            A list of dicts, one per element, or a dict of lists when `columns` is True.
+        """
+        return self._run("extract", [parse_extract_fields(fields), columns])
+
+    def values(self, spec: str) -> list[Any] | Deferred:
+        """Run the chain and read one value from each selected element.
+
+        Args:
+            spec: Field spec of the value, e.g. "text" or "attr:href", see `BrowserJQueryCollection.extract`.
+
+        Returns:
+            The values, in document order.
+        """
+        result = self._run("extract", [[parse_extract_field("value", spec)], True])
+        take = operator.itemgetter("value")
+        return result.then(take) if isinstance(result, Deferred) else take(result)
+
+    def attr(self, name: str) -> list[Any] | Deferred:
+        """Run the chain and read an attribute of each selected element (None where it is missing)."""
+        return self.values(f"attr:{name}")
+
+    def text(self) -> list[str] | Deferred:
+        """Run the chain and read the text of each selected element."""
+        return self.values("text")
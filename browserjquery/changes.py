@@ -0,0 +1,104 @@
+from typing import TYPE_CHECKING, Union
+
+from selenium.common.exceptions import StaleElementReferenceException
+
+from browserjquery import settings
+
+if TYPE_CHECKING:
+    from browserjquery.jquery import BrowserJQuery
+
+logger = settings.getLogger(__name__)
+
+# Change types recorded by a DomChangeFeed.
+CHANGE_TYPES = ("added", "removed", "attribute", "text")
+
+# Default number of changes buffered in the page between two drains.
+DEFAULT_BUFFER_SIZE = 10000
+
+
+class DomChange:
+    """A change of the DOM recorded by a DomChangeFeed.
+
+    Attributes:
+        type: One of CHANGE_TYPES. "text" changes are reported on the element containing the text.
+        element: The added or changed element, wrapped in a BrowserJQuery. None for removed elements
+            and for elements detached from the page since the change.
+        tag: Lowercase tag name of the element.
+        name: Name of the changed attribute, for "attribute" changes.
+        value: New value of the attribute, or new text, for "attribute" and "text" changes.
+    """
+
+    __slots__ = ("type", "element", "tag", "name", "value")
+
+    def __init__(
+        self,
+        type: str,
+        element: Union["BrowserJQuery", None],
+        tag: str | None,
+        name: str | None = None,
+        value: str | None = None,
+    ):
+        self.type = type
+        self.element = element
+        self.tag = tag
+        self.name = name
+        self.value = value
+
+    def __repr__(self) -> str:
+        detail = f" {self.name}={self.value!r}" if self.type == "attribute" else ""
+        detail += f" {self.value!r}" if self.type == "text" else ""
+        return f"<DomChange {self.type} {self.tag}{detail}>"
+
+
+class DomChangeFeed:
+    """Changes of a page region, buffered in the page by a MutationObserver.
+
+    `changes()` drains the buffer in a single round-trip, so live regions (tickers, chats, feeds)
+    can be processed as deltas instead of being queried again in full. The observer keeps running
+    until `disconnect()` is called or the feed is used as a context manager, and is lost on navigation.
+    """
+
+    def __init__(self, browser: "BrowserJQuery", feed_id: int, targets: int):
+        """Initialize a feed over an observer installed in the page.
+
+        Args:
+            browser: The BrowserJQuery instance that installed the observer.
+            feed_id: Id of the feed in the page.
+            targets: Number of observed elements.
+        """
+        self.browser = browser
+        self.feed_id = feed_id
+        self.targets = targets
+
+    def __enter__(self) -> "DomChangeFeed":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.disconnect()
+
+    def changes(self) -> list[DomChange]:
+        """Get the changes recorded since the last call, and clear the buffer.
+
+        Returns:
+            The changes in the order they happened.
+
+        Raises:
+            RuntimeError: If called inside `batch()`.
+            StaleElementReferenceException: If the observer is no longer in the page.
+        """
+        self.browser._require_unbatched("Change feeds")
+        result = self.browser.call("drainChanges", self.feed_id)
+        if result is None:
+            raise StaleElementReferenceException("Change feed is no longer available in the page")
+
+        records, dropped = result
+        if dropped:
+            logger.warning("Change buffer overflowed, %d changes were dropped", dropped)
+        return [
+            DomChange(type, self.browser._wrap(element) if element is not None else None, tag, name, value)
+            for type, element, tag, name, value in records
+        ]
+
+    def disconnect(self):
+        """Stop observing and drop the buffered changes."""
+        self.browser.call("disconnect", self.feed_id)
@@ -0,0 +1,158 @@
+import operator
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any, Union
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.remote import webelement
+
+from browserjquery import settings
+from browserjquery.batch import Deferred
+from browserjquery.jquery import BrowserJQueryCollection, parse_extract_fields
+
+if TYPE_CHECKING:
+    from browserjquery.jquery import BrowserJQuery
+
+logger = settings.getLogger(__name__)
+
+# Array type code of handle ids.
+HANDLE_TYPECODE = "q"
+
+
+class ElementHandle:
+    """An element kept in the page's registry, referred to by a small integer id.
+
+    Handles cost a few dozen bytes and no WebDriver element reference until the element is
+    materialized with `element()` or `jquery()`.
+    """
+
+    __slots__ = ("browser", "id")
+
+    def __init__(self, browser: "BrowserJQuery", id: int):
+        """Initialize a handle.
+
+        Args:
+            browser: The BrowserJQuery instance whose page holds the registry entry.
+            id: Id of the element in the registry.
+        """
+        self.browser = browser
+        self.id = id
+
+    def __repr__(self) -> str:
+        return f"<ElementHandle {self.id}>"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, ElementHandle) and other.id == self.id and other.browser.driver is self.browser.driver
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+    def element(self) -> webelement.WebElement:
+        """Get the WebElement of the handle, in a single round-trip.
+
+        Raises:
+            StaleElementReferenceException: If the handle was released, or its element removed from the page.
+        """
+        return materialize(self.browser, [self.id])[0]
+
+    def jquery(self) -> "BrowserJQuery":
+        """Get a BrowserJQuery running queries on the element of the handle."""
+        return self.browser._wrap(self.element())
+
+    def extract(self, fields: dict[str, str]) -> dict[str, Any] | Deferred:
+        """Extract fields from the element without materializing it, see `BrowserJQueryCollection.extract`.
+
+        Returns:
+            The fields of the element, or a Deferred when called inside `batch()`.
+        """
+        take = operator.itemgetter(0)
+        result = self.browser.call("extractRegistered", [self.id], parse_extract_fields(fields), False)
+        return result.then(take) if isinstance(result, Deferred) else take(result)
+
+    def release(self):
+        """Drop the element from the registry."""
+        self.browser.call("unregister", [self.id])
+
+
+class HandleCollection:
+    """Elements kept in the page's registry, stored in Python as a compact array of integer ids.
+
+    Unlike a BrowserJQueryCollection, which holds one WebElement per element, the collection only
+    transfers and stores integers: large match sets cost 8 bytes per element, and elements are only
+    turned into WebElements by `materialize()`, for the windows that need them. Fields can be
+    extracted without materializing anything.
+
+    Registry entries are held until `release()` is called, the collection is used as a context
+    manager, or `BrowserJQuery.release_handles()` / `evict_handles()` drop them, and are lost on
+    navigation. Slicing a collection shares the entries of the slice with the original.
+    """
+
+    def __init__(self, browser: "BrowserJQuery", ids: Iterable[int]):
+        """Initialize a collection over registered elements.
+
+        Args:
+            browser: The BrowserJQuery instance whose page holds the registry entries.
+            ids: Ids of the elements in the registry.
+        """
+        self.browser = browser
+        self.ids = ids if isinstance(ids, array) else array(HANDLE_TYPECODE, ids)
+
+    def __enter__(self) -> "HandleCollection":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+    def __repr__(self) -> str:
+        return f"<HandleCollection of {len(self.ids)} elements>"
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[ElementHandle]:
+        return (ElementHandle(self.browser, id) for id in self.ids)
+
+    def __getitem__(self, index: int | slice) -> Union[ElementHandle, "HandleCollection"]:
+        """Get the handle at an index, or a collection for a slice, without any round-trip."""
+        if isinstance(index, slice):
+            return HandleCollection(self.browser, self.ids[index])
+        return ElementHandle(self.browser, self.ids[index])
+
+    def materialize(self) -> BrowserJQueryCollection:
+        """Get the elements as a BrowserJQueryCollection, in a single round-trip; slice first to get a window.
+
+        Raises:
+            StaleElementReferenceException: If an element was released or removed from the page.
+        """
+        return BrowserJQueryCollection(
+            self.browser.driver, materialize(self.browser, self.ids.tolist()), session=self.browser.session
+        )
+
+    def extract(self, fields: dict[str, str], *, columns: bool = False) -> list[dict[str, Any]] | dict[str, list[Any]]:
+        """Extract fields from the elements without materializing them, see `BrowserJQueryCollection.extract`.
+
+        Fields of released elements, or of elements collected after their removal from the page, are None.
+        """
+        if not self.ids:
+            return {name: [] for name in fields} if columns else []
+        return self.browser.call("extractRegistered", self.ids.tolist(), parse_extract_fields(fields), columns)
+
+    def release(self):
+        """Drop the elements from the registry."""
+        if self.ids:
+            self.browser.call("unregister", self.ids.tolist())
+
+
+def materialize(browser: "BrowserJQuery", ids: list[int]) -> list[webelement.WebElement]:
+    """Get the WebElements of registered elements in a single round-trip.
+
+    Raises:
+        RuntimeError: If called inside `batch()`.
+        StaleElementReferenceException: If an element was released or removed from the page.
+    """
+    browser._require_unbatched("Handle materialization")
+    elements = browser.call("registered", ids)
+    if None in elements:
+        missing = ids[elements.index(None)]
+        raise StaleElementReferenceException(f"Element handle {missing} is no longer available in the page")
+    return elements
@@ -1,13 +1,32 @@
+import base64
+import codecs
 import contextlib
 import functools
+import gzip
+import logging
+import re
+import secrets
 import time
-from collections.abc import Callable
-from typing import Any, Generic, TypeVar, Union
+import zlib
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, Union
 
 from selenium import webdriver
+from selenium.common.exceptions import JavascriptException, StaleElementReferenceException, TimeoutException
 from selenium.webdriver.remote import webelement
 
 from browserjquery import jquery_scripts, settings
+from browserjquery.batch import Deferred, QueryBatch
+from browserjquery.cache import DEFAULT_CACHE_SIZE, ResultCache
+from browserjquery.changes import DEFAULT_BUFFER_SIZE, DomChangeFeed
+from browserjquery.metrics import QueryMetrics, QueryRecord, payload_size
+from browserjquery.session import BrowserSession
+
+if TYPE_CHECKING:
+    from browserjquery.chain import QueryChain
+    from browserjquery.handles import HandleCollection
+    from browserjquery.snapshot import BrowserSnapshot
 
 logger = settings.getLogger(__name__)
 
@@ -16,18 +35,220 @@ ResultType = Union[list[T], T, None]
 WrappedResultType = Union["BrowserJQueryCollection", "BrowserJQuery", str, None]
 
 
+@functools.cache
+def jquery_source() -> str:
+    """Get the bundled jQuery source, read from disk once per process."""
+    with open(settings.JQUERY_INJECTION_FILE) as f:
+        return f.read()
+
+
+# Operations accepted in extract() field specs, mapped to whether they take an argument.
+EXTRACT_OPERATIONS = {"text": False, "html": False, "val": False, "attr": True, "prop": True, "data": True, "is": True}
+
+
+def parse_extract_field(name: str, spec: str) -> list[str | None]:
+    """Parse an extract() field spec such as "text", "attr:href" or "find:.price|text".
+
+    Args:
+        name: Name of the field in the extracted records.
+        spec: The field spec.
+
+    Returns:
+        The field as [name, sub-selector, operation, argument] for the in-page extractor.
+
+    Raises:
+        ValueError: If the spec is malformed or uses an unknown operation.
+    """
+    selector, operation_spec = None, spec
+    if spec.startswith("find:"):
+        selector, _, operation_spec = spec.removeprefix("find:").rpartition("|")
+        if not selector:
+            raise ValueError(f"Field '{name}': expected 'find:<selector>|<operation>', got '{spec}'")
+
+    operation, _, argument = operation_spec.partition(":")
+    if operation not in EXTRACT_OPERATIONS:
+        raise ValueError(f"Field '{name}': unknown operation '{operation}'")
+    if EXTRACT_OPERATIONS[operation] != bool(argument):
+        requirement = "requires" if EXTRACT_OPERATIONS[operation] else "does not take"
+        raise ValueError(f"Field '{name}': operation '{operation}' {requirement} an argument")
+
+    return [name, selector, operation, argument or None]
+
+
+def parse_extract_fields(fields: dict[str, str]) -> list[list[str | None]]:
+    """Parse a mapping of field names to specs for the in-page extractor."""
+    return [parse_extract_field(name, spec) for name, spec in fields.items()]
+
+
+# Selector syntax only jQuery understands; anything else is routed to the native selector engine.
+JQUERY_ONLY_SYNTAX = re.compile(
+    r":(?:animated|button|checkbox|contains|eq|even|file|first|gt|has|header|hidden|image|input|last|lt|odd"
+    r"|parent|password|radio|reset|selected|submit|text|visible)(?![\w-])"
+    r"|!="
+)
+ID_SELECTOR = re.compile(r"#[A-Za-z_][\w-]*")
+QUOTED_STRING = re.compile(r"\"(?:[^\"\\]|\\.)*\"|'(?:[^'\\]|\\.)*'")
+
+
+@functools.lru_cache(maxsize=1024)
+def classify_selector(selector: str) -> str:
+    """Classify a selector by the cheapest engine able to evaluate it.
+
+    Args:
+        selector: The selector to classify.
+
+    Returns:
+        "id" for a bare id selector, "css" for standard CSS selectors that querySelectorAll
+        understands and "jquery" for selectors using jQuery-only extensions.
+    """
+    if ID_SELECTOR.fullmatch(selector):
+        return "id"
+    if JQUERY_ONLY_SYNTAX.search(QUOTED_STRING.sub('""', selector)):
+        return "jquery"
+    return "css"
+
+
+@functools.lru_cache(maxsize=1024)
+def scope_selector(selector: str) -> str:
+    """Prefix every selector of a selector list with `:scope`.
+
+    This gives querySelectorAll the same rooted semantics as jQuery's `find`, where the whole
+    selector has to match below the root element, and supports leading combinators like "> li".
+
+    Args:
+        selector: A CSS selector list.
+
+    Returns:
+        The scoped selector list.
+    """
+    parts, start, nesting, quote = [], 0, 0, None
+    for index, char in enumerate(selector):
+        if quote:
+            quote = None if char == quote and selector[index - 1] != "\\" else quote
+        elif char in "\"'":
+            quote = char
+        elif char in "([":
+            nesting += 1
+        elif char in ")]":
+            nesting -= 1
+        elif char == "," and nesting == 0:
+            parts.append(selector[start:index])
+            start = index + 1
+    parts.append(selector[start:])
+    return ", ".join(f":scope {part.strip()}" for part in parts)
+
+
+def native_selector(selector: str) -> str | None:
+    """Get the scoped CSS selector for the native engine, or None if jQuery is required."""
+    return None if classify_selector(selector) == "jquery" else scope_selector(selector)
+
+
+# Text matching modes of the in-page text search engine.
+TEXT_SEARCH_MODES = ("contains", "exact", "regex", "casefold", "normalized")
+
+# Python regex flags with a JavaScript equivalent.
+REGEX_FLAGS = {re.IGNORECASE: "i", re.MULTILINE: "m", re.DOTALL: "s"}
+
+
+def first_or_none(elements: list[T]) -> T | None:
+    """Get the first element of a list, or None if it is empty."""
+    return elements[0] if elements else None
+
+
+# Number of elements fetched per round-trip when iterating lazy collections.
+DEFAULT_CHUNK_SIZE = 100
+
+# Library operations returning elements that can be replayed in the page to find them again.
+RESOLVABLE_OPERATIONS = frozenset(
+    {
+        "find",
+        "findById",
+        "parent",
+        "parents",
+        "children",
+        "siblings",
+        "next",
+        "prev",
+        "closest",
+        "first",
+        "last",
+        "textSearch",
+        "elementsAtPaths",
+        "chain",
+    }
+)
+
+# A re-resolution recipe: [operation, arguments, index] steps replayed from the document.
+Recipe = tuple[tuple[str, tuple, int], ...]
+
+# Where the elements of a result come from: the recipe of the element queried, the operation and its arguments.
+Origin = tuple[Recipe, str, tuple]
+
+
+def recipe_at(origin: Origin | None, index: int) -> Recipe | None:
+    """Get the recipe of the element at `index` in a result, or None if the result cannot be replayed."""
+    if origin is None:
+        return None
+    recipe, operation, args = origin
+    return recipe + ((operation, args, index),)
+
+
+# Number of characters, or bytes when compressed, of the page HTML transferred per round-trip.
+HTML_CHUNK_SIZE = 1 << 20
+
+# Default time to wait in wait_for() and wait_until_gone(), in seconds.
+DEFAULT_WAIT_TIMEOUT = 10
+
+# Extra script timeout given to the driver over the in-page timeout of waits, in seconds.
+SCRIPT_TIMEOUT_MARGIN = 5
+
+# Scripts that do not change the page, run without invalidating the result cache.
+READ_ONLY_SCRIPTS = frozenset(
+    {
+        jquery_scripts.LIBRARY_CALL,
+        jquery_scripts.LIBRARY_CALL_TIMED,
+        jquery_scripts.LIBRARY_CALL_EPOCH,
+        jquery_scripts.LIBRARY_CALL_EPOCH_TIMED,
+        jquery_scripts.DOCUMENT_QUERY,
+        jquery_scripts.DOCUMENT_ELEMENT,
+        jquery_scripts.DOCUMENT_QUERY_IF_MARKED,
+        jquery_scripts.JQUERY_READY_CHECK,
+        jquery_scripts.PAGE_HTML,
+    }
+)
+
+# Timed variants of the library call scripts, for metrics.
+TIMED_SCRIPTS = {
+    jquery_scripts.LIBRARY_CALL: jquery_scripts.LIBRARY_CALL_TIMED,
+    jquery_scripts.LIBRARY_CALL_EPOCH: jquery_scripts.LIBRARY_CALL_EPOCH_TIMED,
+}
+
+# Messages of in-page errors raised when a query reaches a document jQuery and the library were never injected into.
+NEW_DOCUMENT_ERRORS = ("$ is not defined", "jQuery is not defined", "BrowserJQuery library is not installed")
+
+
 class BrowserJQueryCollection(Generic[T]):
     """A collection of elements that can be filtered and transformed."""
 
-    def __init__(self, driver: webdriver.Chrome | webdriver.Firefox, elements: list[T]):
+    def __init__(
+        self,
+        driver: webdriver.Chrome | webdriver.Firefox,
+        elements: list[T],
+        session: BrowserSession | None = None,
+        origin: Origin | None = None,
+    ):
         """Initialize a collection of elements.
 
         Args:
             driver: The webdriver instance.
             elements: List of elements in the collection.
+            session: Session shared with the BrowserJQuery that produced the collection.
+            origin: The query that produced the elements, to find them again once stale.
         """
         self.driver = driver
         self.elements = elements
+        self.session = session or BrowserSession.for_driver(driver)
+        self.origin = origin
 
     def __len__(self) -> int:
         """Get the number of elements in the collection."""
@@ -35,18 +256,12 @@ class BrowserJQueryCollection(Generic[T]):
 
     def __iter__(self):
         """Iterate over the elements in the collection."""
-        for element in self.elements:
-            if isinstance(element, str):
-                yield element
-            else:
-                yield BrowserJQuery(self.driver, default_element=element)
+        for index, element in enumerate(self.elements):
+            yield self._wrap(element, index)
 
     def __getitem__(self, index: int) -> Union["BrowserJQuery", str]:
         """Get an element by index."""
-        element = self.elements[index]
-        if isinstance(element, str):
-            return element
-        return BrowserJQuery(self.driver, default_element=element)
+        return self._wrap(self.elements[index], index % len(self.elements) if index < 0 else index)
 
     def first(self) -> Union["BrowserJQuery", str, None]:
         """Get the first element in the collection.
@@ -56,10 +271,7 @@ class BrowserJQueryCollection(Generic[T]):
         """
         if not self.elements:
             return None
-        element = self.elements[0]
-        if isinstance(element, str):
-            return element
-        return BrowserJQuery(self.driver, default_element=element)
+        return self._wrap(self.elements[0], 0)
 
     def last(self) -> Union["BrowserJQuery", str, None]:
         """Get the last element in the collection.
@@ -69,10 +281,7 @@ class BrowserJQueryCollection(Generic[T]):
         """
         if not self.elements:
             return None
-        element = self.elements[-1]
-        if isinstance(element, str):
-            return element
-        return BrowserJQuery(self.driver, default_element=element)
+        return self._wrap(self.elements[-1], len(self.elements) - 1)
 
     def items(self) -> list[Union["BrowserJQuery", str]]:
         """Get all elements in the collection.
@@ -80,7 +289,158 @@ class BrowserJQueryCollection(Generic[T]):
         Returns:
             List of elements wrapped in BrowserJQuery instances.
         """
-        return [BrowserJQuery(self.driver, default_element=e) if not isinstance(e, str) else e for e in self.elements]
+        return [self._wrap(element, index) for index, element in enumerate(self.elements)]
+
+    def extract(
+        self, fields: dict[str, str], *, columns: bool = False
+    ) -> list[dict[str, Any]] | dict[str, list[Any]]:
+        """Extract several fields from every element of the collection in a single round-trip.
+
+        Field specs are one of "text", "html", "val", "attr:<name>", "prop:<name>", "data:<name>"
+        or "is:<selector>", optionally prefixed with "find:<selector>|" to read the value from the
+        first matching descendant instead of the element itself (None if nothing matches).
+
+        Example:
+            rows.extract({"title": "text", "url": "attr:href", "price": "find:.price|text"})
+
+        Args:
+            fields: Mapping of field names to field specs.
+            columns: Return a dict of column lists instead of a list of records.
+
+        Returns:
+            A list of dicts, one per element, or a dict of lists when `columns` is True.
+        """
+        parsed = parse_extract_fields(fields)
+        if not self.elements:
+            return {name: [] for name in fields} if columns else []
+
+        browser = BrowserJQuery(self.driver, default_element=self.elements, session=self.session)
+        return browser.call("extract", parsed, columns)
+
+    def _wrap(self, element: T, index: int) -> Union["BrowserJQuery", str]:
+        """Wrap the element at `index` without any browser round-trip; text values are returned as is."""
+        if isinstance(element, str):
+            return element
+        return BrowserJQuery(
+            self.driver, default_element=element, session=self.session, recipe=recipe_at(self.origin, index)
+        )
+
+
+class LazyBrowserJQueryCollection(BrowserJQueryCollection):
+    """A collection whose elements stay in the page until they are accessed.
+
+    The match set is stored in the page when the collection is created, together with its size, so
+    `len()` is free and indexing, slicing, `first()` and `last()` only transfer the requested window.
+    Iteration pages through the elements `chunk_size` at a time.
+
+    The match set is held by the page until `release()` is called or the collection is used as a
+    context manager, and is lost on navigation.
+    """
+
+    def __init__(
+        self,
+        browser: "BrowserJQuery",
+        result_id: int,
+        count: int,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        origin: Origin | None = None,
+    ):
+        """Initialize a lazy collection over a match set stored in the page.
+
+        Args:
+            browser: The BrowserJQuery instance that produced the collection.
+            result_id: Id of the match set in the page.
+            count: Number of elements in the match set.
+            chunk_size: Number of elements fetched per round-trip when iterating.
+            origin: The query that produced the match set, to find its elements again once stale.
+        """
+        self.browser = browser
+        self.driver = browser.driver
+        self.session = browser.session
+        self.result_id = result_id
+        self.count = count
+        self.chunk_size = chunk_size
+        self.origin = origin
+
+    def __enter__(self) -> "LazyBrowserJQueryCollection":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+    @property
+    def elements(self) -> list[webelement.WebElement]:
+        """Fetch all elements of the collection."""
+        return self.fetch(0, self.count)
+
+    def fetch(self, start: int, stop: int) -> list[webelement.WebElement]:
+        """Fetch a window of the match set in a single round-trip.
+
+        Args:
+            start: Index of the first element.
+            stop: Index after the last element.
+
+        Returns:
+            The elements in the window.
+
+        Raises:
+            StaleElementReferenceException: If the match set is no longer available in the page.
+        """
+        if start >= stop:
+            return []
+        elements = self.browser.call("slice", self.result_id, start, stop)
+        if elements is None:
+            raise StaleElementReferenceException("Lazy result set is no longer available in the page")
+        return elements
+
+    def release(self):
+        """Drop the match set from the page."""
+        self.browser.call("release", self.result_id)
+
+    def __len__(self) -> int:
+        """Get the number of elements in the collection, without a round-trip."""
+        return self.count
+
+    def __iter__(self):
+        """Iterate over the elements, fetching them `chunk_size` at a time."""
+        for start in range(0, self.count, self.chunk_size):
+            for offset, element in enumerate(self.fetch(start, min(start + self.chunk_size, self.count))):
+                yield self._wrap(element, start + offset)
+
+    def __getitem__(self, index: int | slice) -> Union["BrowserJQuery", BrowserJQueryCollection]:
+        """Get an element by index, or an eager collection for a slice."""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.count)
+            if step < 0:
+                return BrowserJQueryCollection(self.driver, self.elements[index], session=self.session)
+            elements = self.fetch(start, max(start, stop))[::step]
+            return BrowserJQueryCollection(self.driver, elements, session=self.session)
+
+        position = index + self.count if index < 0 else index
+        if not 0 <= position < self.count:
+            raise IndexError("collection index out of range")
+        return self._wrap(self.fetch(position, position + 1)[0], position)
+
+    def first(self) -> Union["BrowserJQuery", None]:
+        """Get the first element in the collection, or None if empty."""
+        return self[0] if self.count else None
+
+    def last(self) -> Union["BrowserJQuery", None]:
+        """Get the last element in the collection, or None if empty."""
+        return self[-1] if self.count else None
+
+    def extract(
+        self, fields: dict[str, str], *, columns: bool = False
+    ) -> list[dict[str, Any]] | dict[str, list[Any]]:
+        """Extract several fields from every element in the page, without transferring the elements.
+
+        See `BrowserJQueryCollection.extract` for the field spec format.
+        """
+        parsed = parse_extract_fields(fields)
+        result = self.browser.call("extractStored", self.result_id, parsed, columns)
+        if result is None:
+            raise StaleElementReferenceException("Lazy result set is no longer available in the page")
+        return result
 
 
 def prepare_result(func: Callable[..., ResultType]) -> Callable[..., WrappedResultType]:
@@ -97,31 +457,81 @@ def prepare_result(func: Callable[..., ResultType]) -> Callable[..., WrappedResu
 
     @functools.wraps(func)
     def wrapper(self: "BrowserJQuery", *args: Any, **kwargs: Any) -> WrappedResultType:
+        self._last_origin = None
         result = func(self, *args, **kwargs)
+        origin = self._last_origin
 
-        if isinstance(result, list):
-            return BrowserJQueryCollection(self.driver, result)
+        if isinstance(result, Deferred):
+            return result.then(functools.partial(wrap_result, self, origin=origin))
 
-        if result is not None and not isinstance(result, str):
-            return BrowserJQuery(self.driver, default_element=result)
+        metrics = self.session.metrics
+        if metrics is None:
+            return wrap_result(self, result, origin)
 
-        return result
+        start = time.perf_counter()
+        wrapped = wrap_result(self, result, origin)
+        metrics.add_python_time(time.perf_counter() - start)
+        return wrapped
 
     return wrapper
 
 
+def wrap_result(browser: "BrowserJQuery", result: ResultType, origin: Origin | None = None) -> WrappedResultType:
+    """Wrap a raw query result in BrowserJQuery objects.
+
+    Args:
+        browser: The BrowserJQuery instance the result was obtained from.
+        result: The raw result returned by the page.
+        origin: The library call that produced the result, giving the wrapped elements their recipes.
+
+    Returns:
+        A BrowserJQueryCollection for lists, a BrowserJQuery for elements, other values as is.
+    """
+    if isinstance(result, BrowserJQueryCollection):
+        return result
+
+    if isinstance(result, list):
+        return BrowserJQueryCollection(browser.driver, result, session=browser.session, origin=origin)
+
+    if result is not None and not isinstance(result, str):
+        return browser._wrap(result, recipe_at(origin, 0))
+
+    return result
+
+
 class BrowserJQuery:
     """Main class for jQuery-based browser interactions."""
 
-    def __init__(self, driver: webdriver.Chrome | webdriver.Firefox, default_element=None):
+    def __init__(
+        self,
+        driver: webdriver.Chrome | webdriver.Firefox,
+        default_element=None,
+        session: BrowserSession | None = None,
+        recipe: Recipe | None = None,
+    ):
         """Initialize BrowserJQuery with a webdriver instance.
 
+        Wrapping an existing element is free: jQuery injection and the document lookup
+        only happen when no default element is given, and cost a single round-trip
+        while the page is still the document jQuery was injected into.
+
         Args:
             driver: A Chrome or Firefox webdriver instance.
+            default_element: The element queries run on. Defaults to the document.
+            session: Session to share with the new instance. Defaults to the driver's session.
+            recipe: Steps finding the default element again from the document once it is stale,
+                see `relocate()`. Empty for the document itself.
         """
         self.driver = driver
-        self.ensure_jquery()
-        self.default_element = default_element or self.document
+        self.session = session or BrowserSession.for_driver(driver)
+        self.recipe = () if default_element is None else recipe
+        # Document the recipe replays from, and its marker: a recipe is never replayed on another document.
+        self._recipe_document = self.session.document
+        self._recipe_marker = self.session.marker
+        self._last_origin: Origin | None = None
+        if default_element is None:
+            default_element = self._load_document()
+        self.default_element = default_element
 
     def __call__(self, *args, **kwargs):
         """Allow the class instance to be called directly, equivalent to find().
@@ -148,18 +558,31 @@ class BrowserJQuery:
 
         # Try to get the attribute from the default element
         try:
-            attr = getattr(self.default_element, name)
+            try:
+                attr = getattr(self.default_element, name)
+            except StaleElementReferenceException:
+                if not self.relocate():
+                    raise
+                attr = getattr(self.default_element, name)
             # If it's a method, wrap it to maintain the BrowserJQuery context
             if callable(attr):
 
                 def wrapper(*args, **kwargs):
-                    result = attr(*args, **kwargs)
+                    try:
+                        result = attr(*args, **kwargs)
+                    except StaleElementReferenceException:
+                        if not self.relocate():
+                            raise
+                        result = getattr(self.default_element, name)(*args, **kwargs)
+                    # Element methods such as click() and send_keys() may change the page
+                    if self.session.cache is not None:
+                        self.session.cache.clear()
                     # If the result is a WebElement, wrap it in a new BrowserJQuery instance
                     if hasattr(result, "tag_name"):  # Check if it's a WebElement
-                        return BrowserJQuery(self.driver, default_element=result)
+                        return self._wrap(result)
                     # If the result is a list of WebElements, wrap each element
                     elif isinstance(result, list) and result and hasattr(result[0], "tag_name"):
-                        return [BrowserJQuery(self.driver, default_element=item) for item in result]
+                        return [self._wrap(item) for item in result]
                     return result
 
                 return wrapper
@@ -167,48 +590,225 @@ class BrowserJQuery:
         except AttributeError:
             raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
 
+    def _lazy_collection(
+        self, result: list[int], chunk_size: int, origin: Origin | None = None
+    ) -> LazyBrowserJQueryCollection:
+        """Create a lazy collection from the [id, count] pair describing a match set stored in the page."""
+        result_id, count = result
+        return LazyBrowserJQueryCollection(self, result_id, count, chunk_size=chunk_size, origin=origin)
+
+    def _wrap(self, element: webelement.WebElement, recipe: Recipe | None = None) -> "BrowserJQuery":
+        """Wrap an element in a BrowserJQuery sharing this session, without any browser round-trip."""
+        return BrowserJQuery(self.driver, default_element=element, session=self.session, recipe=recipe)
+
+    def _origin(self, operation: str, args: tuple) -> Origin | None:
+        """Describe a library call on the default element, or None if its result cannot be replayed."""
+        if self.recipe is None or operation not in RESOLVABLE_OPERATIONS:
+            return None
+        return self.recipe, operation, args
+
+    def relocate(self) -> bool:
+        """Find the default element again after the page re-rendered it.
+
+        Elements carry a recipe: the chain of library calls that found them from the document, with
+        the index of the element in each result. The recipe is replayed in the page in a single
+        round-trip. This is done automatically when a query or an element method fails with a
+        StaleElementReferenceException.
+
+        Elements are only found again in the document they were found in: after a navigation, or
+        inside `batch()`, the element is not relocated.
+
+        Returns:
+            True if the element was found again, False if it has no recipe, nothing matches it anymore
+            or the page navigated to another document.
+        """
+        if not self.recipe or self.session.batch is not None:
+            return False
+        root = self.session.document
+        if root is None or root != self._recipe_document or self.session.marker != self._recipe_marker:
+            return False
+        # Run without the new-document recovery of queries, which would replay the recipe on another page.
+        try:
+            element = self.execute(jquery_scripts.LIBRARY_CALL, root, "resolve", self.recipe)
+        except (StaleElementReferenceException, JavascriptException):
+            return False
+        if element is None:
+            return False
+        logger.info("Relocated stale element with a recipe of %d steps", len(self.recipe))
+        self.default_element = element
+        return True
+
     # Core/Initialization methods
     def ensure_jquery(self):
         """Ensures that jQuery is injected into the page.
 
+        The page is only probed when the session has not yet marked the current document;
+        marking stamps a random token on `window` that identifies the document afterwards.
+        """
+        metrics = self.session.metrics
+        if self.session.jquery_injected:
+            if metrics is not None:
+                metrics.cache_hit("jquery_injection")
+            return
+
+        if metrics is not None:
+            metrics.cache_miss("jquery_injection")
+        marker = self.session.preinjection_marker or secrets.token_hex(8)
+        injected = self._mark_document(marker) or (self.inject_jquery() and self._mark_document(marker))
+        self.session.jquery_injected = injected
+        self.session.marker = marker if injected else None
+
+    def _mark_document(self, marker: str) -> bool:
+        """Stamp the current document with a marker if jQuery is available in it.
+
+        Args:
+            marker: Token identifying the document.
+
+        Returns:
+            bool: True if jQuery is available and the document was marked, False otherwise.
+        """
+        return bool(self.execute(jquery_scripts.DOCUMENT_MARK, marker))
+
+    def _load_document(self):
+        """Get the document element, re-injecting jQuery if the page navigated since the last call.
+
+        Returns:
+            The document element as a jQuery object.
+        """
+        document = None
+        if self.session.marker is not None:
+            document = self.execute(jquery_scripts.DOCUMENT_QUERY_IF_MARKED, self.session.marker)
+
+        if self.session.metrics is not None:
+            (self.session.metrics.cache_miss if document is None else self.session.metrics.cache_hit)("document")
+
+        if document is None:
+            self.session.invalidate()
+            self.ensure_jquery()
+            # Without jQuery (e.g. blocked by CSP) native selectors still work from the bare element.
+            document = self.document if self.session.jquery_injected else self.execute(jquery_scripts.DOCUMENT_ELEMENT)
+
+        self.session.document = document
+        return document
+
+    def _is_new_document_error(self, error: Exception, element) -> bool:
+        """Check whether a failed query signals that the page navigated to a new document.
+
+        Args:
+            error: The exception raised by the query.
+            element: The element the query ran on.
+
         Returns:
-            bool: True if jQuery is successfully injected, False otherwise.
+            bool: True if the query failed because of a navigation, False otherwise.
         """
-        if not self.is_jquery_injected:
-            self.inject_jquery()
+        if isinstance(error, StaleElementReferenceException):
+            if self._is_root(element):
+                return True
+            return self.session.document is not None and element == self.session.document
+        return any(message in str(error) for message in NEW_DOCUMENT_ERRORS)
+
+    def _is_root(self, element) -> bool:
+        """Check whether `element` is the document this instance was created on, rather than an element found in it."""
+        return element is self.default_element and self.recipe == ()
 
     def inject_jquery(self, by: str = "file", wait: int = 5) -> bool:
         """Inject jQuery into the current page.
 
+        Returns as soon as jQuery is usable instead of sleeping for a fixed time.
+
         Args:
             by: Method of injection, either "file" or "cdn".
-            wait: Time to wait after injection in seconds.
+            wait: Maximum time to wait for jQuery to become available, in seconds.
 
         Returns:
             bool: True if jQuery was successfully injected, False otherwise.
         """
         logger.info("Jquery being injected.")
-        self._inject_jquery_file(wait=wait) if by == "file" else self._inject_jquery_cdn(wait=wait)
-        return self.is_jquery_injected
+        return self._inject_jquery_file(wait=wait) if by == "file" else self._inject_jquery_cdn(wait=wait)
 
-    def _inject_jquery_cdn(self, wait: int = 2):
-        """Inject jQuery from CDN.
+    def _inject_jquery_cdn(self, wait: int = 2) -> bool:
+        """Inject jQuery from CDN, waiting for the script's load event.
 
         Args:
-            wait: Time to wait after injection in seconds.
+            wait: Maximum time to wait for the script to load, in seconds.
+
+        Returns:
+            bool: True if jQuery loaded within the timeout, False otherwise.
         """
-        self.driver.execute_script(jquery_scripts.JQUERY_INJECTION)
-        time.sleep(wait)
+        return bool(self.driver.execute_async_script(jquery_scripts.JQUERY_INJECTION, int(wait * 1000)))
 
-    def _inject_jquery_file(self, wait: int = 5):
+    def _inject_jquery_file(self, wait: int = 5) -> bool:
         """Inject jQuery from local file.
 
+        Executing the bundled source is synchronous, so jQuery is normally ready when the call returns;
+        otherwise readiness is polled until the timeout expires.
+
+        Args:
+            wait: Maximum time to wait for jQuery to become available, in seconds.
+
+        Returns:
+            bool: True if jQuery is available, False otherwise.
+        """
+        if self.execute(jquery_source() + jquery_scripts.JQUERY_FILE_INJECTION_SUFFIX):
+            return True
+        return self._wait_for_jquery(timeout=wait)
+
+    def enable_preinjection(self) -> bool:
+        """Inject jQuery into every new document before the page's own scripts run.
+
+        Uses the Chrome DevTools Protocol (`Page.addScriptToEvaluateOnNewDocument`), so it is only
+        available on Chromium-based drivers. Pre-injected documents are already marked, so no
+        post-load injection or probe is needed after a navigation.
+
+        Returns:
+            bool: True if pre-injection is active, False if the driver does not support it.
+        """
+        if self.session.preinjection_id is not None:
+            return True
+        if not hasattr(self.driver, "execute_cdp_cmd"):
+            logger.info("Driver does not support CDP, jQuery will be injected after page load.")
+            return False
+
+        marker = secrets.token_hex(8)
+        source = (
+            jquery_source() + jquery_scripts.LIBRARY + jquery_scripts.JQUERY_PREINJECTION_SUFFIX.format(marker=marker)
+        )
+        result = self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": source})
+        self.session.preinjection_id = result["identifier"]
+        self.session.preinjection_marker = marker
+
+        # The current document predates the registration: mark it with the same token.
+        self.session.jquery_injected = False
+        self.ensure_jquery()
+        return True
+
+    def disable_preinjection(self):
+        """Stop injecting jQuery into new documents; later pages fall back to post-load injection."""
+        if self.session.preinjection_id is None:
+            return
+        self.driver.execute_cdp_cmd(
+            "Page.removeScriptToEvaluateOnNewDocument", {"identifier": self.session.preinjection_id}
+        )
+        self.session.preinjection_id = None
+        self.session.preinjection_marker = None
+
+    def _wait_for_jquery(self, timeout: float, poll_interval: float = 0.05) -> bool:
+        """Poll the page until jQuery is available.
+
         Args:
-            wait: Time to wait after injection in seconds.
+            timeout: Maximum time to wait, in seconds.
+            poll_interval: Time between checks, in seconds.
+
+        Returns:
+            bool: True if jQuery became available before the timeout, False otherwise.
         """
-        with open(settings.JQUERY_INJECTION_FILE) as f:
-            self.execute(f.read())
-        time.sleep(wait)
+        deadline = time.monotonic() + timeout
+        while True:
+            if self.execute(jquery_scripts.JQUERY_READY_CHECK):
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(poll_interval)
 
     @property
     def is_jquery_injected(self) -> bool:
@@ -217,10 +817,103 @@ class BrowserJQuery:
         Returns:
             bool: True if jQuery is present, False otherwise.
         """
-        with contextlib.suppress(Exception):
-            self.execute(jquery_scripts.JQUERY_INJECTION_CHECK)
-            return True
-        return False
+        return bool(self.execute(jquery_scripts.JQUERY_READY_CHECK))
+
+    # Batching methods
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[QueryBatch]:
+        """Record queries and execute them together in a single round-trip.
+
+        While the context is active, every query issued through a BrowserJQuery bound to the same
+        driver returns a Deferred instead of its result. The recorded queries are sent to the browser
+        as one combined script when the context exits, after which `Deferred.value` holds the result.
+        Results of deferred queries cannot be chained on until the batch has been executed.
+
+        Nested calls join the outermost batch.
+
+        Yields:
+            The QueryBatch recording the queries.
+        """
+        if self.session.batch is not None:
+            yield self.session.batch
+            return
+
+        batch = self.session.batch = QueryBatch(self.driver)
+        try:
+            yield batch
+        finally:
+            self.session.batch = None
+
+        metrics = self.session.metrics
+        if metrics is None:
+            batch.flush()
+            return
+
+        start = time.perf_counter()
+        script_size = sum(len(script) + payload_size(args) for script, args, _ in batch.calls)
+        error = True
+        try:
+            batch.flush()
+            error = False
+        finally:
+            wall = time.perf_counter() - start
+            metrics.record(QueryRecord("batch", wall, 0.0, wall, None, script_size, 0, error))
+
+    # Instrumentation
+    def enable_metrics(self, collector: QueryMetrics | None = None) -> QueryMetrics:
+        """Record counts, timings and payload sizes of every query of this driver.
+
+        Wall time is split into Python overhead (argument and result handling), WebDriver transport
+        and in-page execution, measured with `performance.now()` for library operations. Hits and
+        misses of the caches saving round-trips are counted too. When disabled, queries only pay
+        for a single attribute check.
+
+        Args:
+            collector: Collector receiving the measurements. Defaults to a new QueryMetrics.
+
+        Returns:
+            The active collector; `collector.summary()` and `collector.report()` export the results.
+        """
+        self.session.metrics = collector or self.session.metrics or QueryMetrics()
+        return self.session.metrics
+
+    def disable_metrics(self):
+        """Stop recording query metrics."""
+        self.session.metrics = None
+
+    @property
+    def metrics(self) -> QueryMetrics | None:
+        """The active metrics collector, or None when metrics are disabled."""
+        return self.session.metrics
+
+    # Result caching
+    def enable_cache(self, size: int = DEFAULT_CACHE_SIZE, max_age: float | None = None) -> ResultCache:
+        """Cache the results of read-only queries (text, attributes, state checks, finding, traversal).
+
+        Repeated reads of the same element then cost no round-trip until the page changes. See
+        `ResultCache` for how changes are detected. The cache is shared by all wrappers of the driver.
+
+        Args:
+            size: Maximum number of cached results.
+            max_age: Seconds after the last round-trip during which cached results are served.
+                None to serve them until a change is detected.
+
+        Returns:
+            The cache; `cache.stats()` reports hits and misses.
+        """
+        self.session.cache = ResultCache(size, max_age)
+        self.session.watch_navigation()
+        return self.session.cache
+
+    def disable_cache(self):
+        """Stop caching query results and drop the cached ones."""
+        self.session.cache = None
+        self.session.unwatch_navigation()
+
+    @property
+    def cache(self) -> ResultCache | None:
+        """The active result cache, or None when caching is disabled."""
+        return self.session.cache
 
     # Document/Page methods
     @property
@@ -241,6 +934,109 @@ class BrowserJQuery:
         """
         return self.execute(jquery_scripts.PAGE_HTML)
 
+    def iter_html(self, chunk_size: int = HTML_CHUNK_SIZE, *, compress: bool = False) -> Iterator[str]:
+        """Yield the HTML of the page, the same as `page_html`, in slices.
+
+        The page is serialized once and kept in the page while it is transferred `chunk_size`
+        characters per round-trip, so no single response holds the whole document.
+
+        Args:
+            chunk_size: Number of characters per slice, or of compressed bytes when `compress` is True.
+            compress: Gzip the page in the browser and decompress it here as it arrives, to transfer
+                less data. Falls back to uncompressed slices on browsers without CompressionStream.
+
+        Yields:
+            Consecutive parts of the page HTML.
+        """
+        self._require_unbatched("Page captures")
+        if compress:
+            capture = self._capture_html_gzip()
+            if capture is not None:
+                decompressor = zlib.decompressobj(wbits=31)
+                decoder = codecs.getincrementaldecoder("utf-8")()
+                for data in self._read_capture(*capture, chunk_size, binary=True):
+                    if text := decoder.decode(decompressor.decompress(data)):
+                        yield text
+                if text := decoder.decode(decompressor.flush(), final=True):
+                    yield text
+                return
+
+        yield from self._read_capture(*self.call("captureHtml"), chunk_size, binary=False)
+
+    def save_html(self, path: str | Path, *, compress: bool = False, chunk_size: int = HTML_CHUNK_SIZE):
+        """Write the HTML of the page to a file, slice by slice, without holding it in memory.
+
+        Args:
+            path: Path of the file to write.
+            compress: Write a gzip file. The page is compressed in the browser, so the compressed
+                bytes are transferred and written as they are.
+            chunk_size: Number of characters per slice, or of compressed bytes when `compress` is True.
+        """
+        self._require_unbatched("Page captures")
+        path = Path(path)
+        if compress:
+            capture = self._capture_html_gzip()
+            if capture is not None:
+                with path.open("wb") as file:
+                    for data in self._read_capture(*capture, chunk_size, binary=True):
+                        file.write(data)
+                return
+
+        opener = gzip.open if compress else open
+        with opener(path, "wt", encoding="utf-8", newline="") as file:
+            for text in self.iter_html(chunk_size):
+                file.write(text)
+
+    def _capture_html_gzip(self) -> list[int] | None:
+        """Store the gzipped page in the page; returns [capture id, size in bytes], or None if unsupported."""
+        capture = self.call_async("captureHtmlGzip")
+        if capture is None:
+            logger.info("CompressionStream is not available, capturing the page uncompressed.")
+        return capture
+
+    def _read_capture(self, capture_id: int, size: int, chunk_size: int, *, binary: bool) -> Iterator[str | bytes]:
+        """Transfer a capture stored in the page slice by slice, then release it.
+
+        Text slices end before `chunk_size` rather than in the middle of a surrogate pair.
+
+        Raises:
+            StaleElementReferenceException: If the capture was lost, e.g. because the page navigated.
+        """
+        position = 0
+        try:
+            while position < size:
+                stop = position + chunk_size
+                result = self.call("bytesSlice" if binary else "htmlSlice", capture_id, position, stop)
+                if result is None:
+                    raise StaleElementReferenceException("Page capture is no longer available in the page")
+                if binary:
+                    position = stop
+                    yield base64.b64decode(result)
+                else:
+                    text, position = result
+                    yield text
+        finally:
+            self.call("release", capture_id)
+
+    def _require_unbatched(self, operation: str):
+        """Raise a RuntimeError if called inside `batch()`, for operations needing several round-trips."""
+        if self.session.batch is not None:
+            raise RuntimeError(f"{operation} cannot be batched")
+
+    def snapshot(self) -> "BrowserSnapshot":
+        """Capture the page and answer further queries locally, without WebDriver round-trips.
+
+        The page HTML is transferred once and parsed in Python. The returned BrowserSnapshot offers
+        the query API of BrowserJQuery (finding, traversal, attributes, text and text searches,
+        extraction) on the captured DOM; `live()` maps a snapshot element back to the live page.
+
+        Returns:
+            A BrowserSnapshot of the whole page, rooted at the document element.
+        """
+        from browserjquery.snapshot import BrowserSnapshot
+
+        return BrowserSnapshot.from_html(self.page_html, browser=self)
+
     # Core execution methods
     def execute(self, script, *args, **kwargs):
         """Execute JavaScript on the page.
@@ -252,39 +1048,343 @@ class BrowserJQuery:
         Returns:
             The result of the JavaScript execution.
         """
+        if self.session.cache is not None and script not in READ_ONLY_SCRIPTS:
+            self.session.cache.clear()
         return self.driver.execute_script(script, *args, **kwargs)
 
-    def query(self, script: str, element: webelement.WebElement | None = None, *args, **kwargs):
+    def execute_async(self, script, *args):
+        """Execute asynchronous JavaScript on the page.
+
+        The script receives a callback as its last argument and completes when the callback is called,
+        within the driver's script timeout.
+
+        Args:
+            script: The JavaScript code to execute.
+            *args: Additional arguments to pass to the script.
+
+        Returns:
+            The value passed to the callback.
+        """
+        return self.driver.execute_async_script(script, *args)
+
+    def query(
+        self,
+        script: str,
+        element: webelement.WebElement | None = None,
+        *args,
+        asynchronous: bool = False,
+        **kwargs,
+    ):
         """Execute jQuery script on an element.
 
         Args:
             script: The jQuery script to execute.
             element: The WebElement to execute the script on. If None, uses default_element.
             *args: Additional arguments to pass to the script.
+            asynchronous: Run the script with `execute_async`.
             **kwargs: Additional keyword arguments.
 
         Returns:
-            The result of the jQuery script execution.
+            The result of the jQuery script execution, or a Deferred when called inside `batch()`.
+
+        Raises:
+            RuntimeError: If an asynchronous script is run inside `batch()`.
         """
         element = element or self.default_element
-        logger.info(f"Executing script : {script} on element: {element}")
-        return self.execute(script, element, *args, **kwargs)
+
+        if self.session.batch is not None:
+            if asynchronous:
+                raise RuntimeError("Asynchronous queries cannot be batched")
+            return self.session.batch.add(script, element, *args)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            operation = args[0] if script == jquery_scripts.LIBRARY_CALL else "script"
+            logger.debug("Executing %s on element %s", operation, element)
+
+        cache = self.session.cache
+        track_epoch = cache is not None and script == jquery_scripts.LIBRARY_CALL and not asynchronous
+        if track_epoch:
+            script = jquery_scripts.LIBRARY_CALL_EPOCH
+
+        metrics = self.session.metrics
+        if metrics is not None:
+            result = self._measured_query(metrics, script, element, *args, asynchronous=asynchronous, **kwargs)
+        else:
+            result = self._execute_query(script, element, *args, asynchronous=asynchronous, **kwargs)
+
+        if track_epoch:
+            result, epoch = result
+            cache.sync(epoch)
+        return result
+
+    def _execute_query(self, script: str, element, *args, asynchronous: bool = False, **kwargs):
+        """Execute a query, recovering once if the page navigated to a new document."""
+        execute = self.execute_async if asynchronous else self.execute
+        try:
+            return execute(script, element, *args, **kwargs)
+        except StaleElementReferenceException as error:
+            if element is self.default_element and self.recipe and self.relocate():
+                return execute(script, self.default_element, *args, **kwargs)
+            if not self._is_new_document_error(error, element):
+                raise
+        except JavascriptException as error:
+            if not self._is_new_document_error(error, element):
+                raise
+
+        logger.info("New document detected, re-injecting jQuery.")
+        stale_document = self.session.document
+        if self._is_root(element) and element != stale_document:
+            # Another wrapper already followed the navigation; loading the document checks it is still current.
+            stale_document = element
+        else:
+            self.session.invalidate()
+        if element == stale_document:
+            element = self._load_document()
+            if self.default_element == stale_document:
+                self.default_element = element
+        else:
+            self.ensure_jquery()
+        return execute(script, element, *args, **kwargs)
+
+    def _measured_query(self, metrics: QueryMetrics, script: str, element, *args, asynchronous: bool = False, **kwargs):
+        """Execute a query and record its timings and payload sizes.
+
+        Synchronous library calls are run with the timed variant of their script, which also reports
+        the in-page execution time.
+        """
+        start = time.perf_counter()
+        library_call = script in TIMED_SCRIPTS
+        operation = args[0] if library_call else "script"
+        script_size = len(script) + payload_size([element, *args])
+
+        result, in_page, error = None, None, True
+        execute_start = time.perf_counter()
+        try:
+            if library_call and not asynchronous:
+                result, in_page_ms = self._execute_query(TIMED_SCRIPTS[script], element, *args, **kwargs)
+                in_page = in_page_ms / 1000
+            else:
+                result = self._execute_query(script, element, *args, asynchronous=asynchronous, **kwargs)
+            error = False
+        finally:
+            end = time.perf_counter()
+            transport = end - execute_start - (in_page or 0.0)
+            metrics.record(
+                QueryRecord(
+                    operation,
+                    wall=end - start,
+                    python=execute_start - start,
+                    transport=transport,
+                    in_page=in_page,
+                    script_size=script_size,
+                    result_size=payload_size(result),
+                    error=error,
+                )
+            )
+        return result
+
+    def call(self, operation: str, *args, element: webelement.WebElement | None = None):
+        """Call an operation of the in-page function library.
+
+        The library is installed once per document, so only the operation name and its arguments
+        are sent instead of a full script. Selectors and texts travel as arguments and need no quoting.
+
+        Args:
+            operation: Name of the library operation.
+            *args: Arguments of the operation.
+            element: The element the operation runs on. If None, uses default_element.
+
+        Returns:
+            The result of the operation, or a Deferred when called inside `batch()`.
+        """
+        origin = self._origin(operation, args) if element is None or element is self.default_element else None
+        result = self._cached_call(operation, args, element)
+        # Set after the call, which may relocate a stale element with library calls of its own.
+        self._last_origin = origin
+        return result
+
+    def _cached_call(self, operation: str, args: tuple, element: webelement.WebElement | None):
+        """Run a library call, serving read-only operations from the result cache when it is enabled."""
+        cache = self.session.cache
+        if cache is None or self.session.batch is not None:
+            return self.query(jquery_scripts.LIBRARY_CALL, element, operation, *args)
+
+        key = cache.key(element or self.default_element, operation, args)
+        if key is None:
+            return self.query(jquery_scripts.LIBRARY_CALL, element, operation, *args)
+
+        metrics = self.session.metrics
+        hit, result = cache.lookup(key)
+        if metrics is not None:
+            (metrics.cache_hit if hit else metrics.cache_miss)("results")
+        if not hit:
+            result = self.query(jquery_scripts.LIBRARY_CALL, element, operation, *args)
+            cache.store(key, result)
+        return result
+
+    def call_async(self, operation: str, *args, element: webelement.WebElement | None = None):
+        """Call an asynchronous operation of the in-page function library.
+
+        Args:
+            operation: Name of the library operation, which receives a completion callback.
+            *args: Arguments of the operation.
+            element: The element the operation runs on. If None, uses default_element.
+
+        Returns:
+            The value the operation completed with.
+        """
+        return self.query(jquery_scripts.LIBRARY_CALL, element, operation, *args, asynchronous=True)
 
     # Element finding methods
     @prepare_result
-    def find(self, selector: str) -> list[webelement.WebElement] | webelement.WebElement | None:
+    def find(
+        self, selector: str, *, lazy: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> list[webelement.WebElement] | webelement.WebElement | LazyBrowserJQueryCollection | None:
         """Find elements using jQuery selector.
 
+        Standard CSS selectors are evaluated with the browser's native selector engine and only
+        selectors using jQuery extensions (`:visible`, `:contains()`, `:eq()`...) go through jQuery.
+
         Args:
             selector: jQuery selector to find elements.
+            lazy: Keep the matches in the page and return a LazyBrowserJQueryCollection that only
+                transfers the elements that are accessed.
+            chunk_size: Number of elements fetched per round-trip when iterating a lazy collection.
 
         Returns:
             A BrowserJQueryCollection of matching elements.
         """
-        method = ".first()" if selector.startswith("#") else ""
-        return self.query(
-            script=jquery_scripts.FIND_ELEMENTS.format(selector=selector, method=method),
-        )
+        scoped = native_selector(selector)
+        first = selector.startswith("#")
+        if lazy:
+            result = self.call("storeFind", selector, scoped, first)
+            origin = self._origin("find", (selector, scoped, first))
+            create = functools.partial(self._lazy_collection, chunk_size=chunk_size, origin=origin)
+            return result.then(create) if isinstance(result, Deferred) else create(result)
+
+        if classify_selector(selector) == "id":
+            return self.call("findById", selector[1:])
+        return self.call("find", selector, scoped, first)
+
+    def extract(
+        self, selector: str, fields: dict[str, str], *, columns: bool = False
+    ) -> list[dict[str, Any]] | dict[str, list[Any]]:
+        """Find elements and extract several fields from each of them in a single round-trip.
+
+        Equivalent to `find(selector).extract(fields)` without transferring the elements.
+        See `BrowserJQueryCollection.extract` for the field spec format.
+
+        Args:
+            selector: jQuery selector to find elements.
+            fields: Mapping of field names to field specs.
+            columns: Return a dict of column lists instead of a list of records.
+
+        Returns:
+            A list of dicts, one per element, or a dict of lists when `columns` is True.
+        """
+        return self.call("findAndExtract", selector, native_selector(selector), parse_extract_fields(fields), columns)
+
+    def find_handles(self, selector: str) -> "HandleCollection":
+        """Find elements and keep them in the page's registry, returning compact integer handles.
+
+        Use for large match sets: only integer ids are transferred and stored, instead of one
+        WebDriver element reference and WebElement per element. See HandleCollection.
+
+        Args:
+            selector: jQuery selector to find elements.
+
+        Returns:
+            A HandleCollection of the matching elements, or a Deferred when called inside `batch()`.
+        """
+        from browserjquery.handles import HandleCollection
+
+        result = self.call("register", selector, native_selector(selector), selector.startswith("#"))
+        create = functools.partial(HandleCollection, self)
+        return result.then(create) if isinstance(result, Deferred) else create(result)
+
+    def release_handles(self) -> int:
+        """Drop all elements from the page's registry, invalidating every handle.
+
+        Returns:
+            The number of registry entries dropped.
+        """
+        return self.call("unregister", None)
+
+    def evict_handles(self) -> int:
+        """Drop the registry entries of elements that are no longer in the document.
+
+        Returns:
+            The number of registry entries dropped.
+        """
+        return self.call("evictRegistered")
+
+    def chain(self, selector: str | None = None) -> "QueryChain":
+        """Start a deferred jQuery chain, run in a single round-trip by a terminal operation.
+
+        Example:
+            browser.chain("ul").first().children("li").filter(".active").attr("data-id")
+
+        Args:
+            selector: jQuery selector of the descendants the chain starts from. None to start from
+                this element.
+
+        Returns:
+            A QueryChain; see its terminals `get()`, `count()`, `values()`, `attr()`, `text()` and `extract()`.
+        """
+        from browserjquery.chain import QueryChain
+
+        chain = QueryChain(self)
+        return chain.find(selector) if selector is not None else chain
+
+    def stream(
+        self, selector: str, fields: dict[str, str] | None = None, *, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[Union["BrowserJQuery", dict[str, Any]]]:
+        """Find elements and yield them, or records extracted from them, one chunk per round-trip.
+
+        The match set stays in the page behind a cursor and only `chunk_size` results are in flight at
+        a time, so memory stays bounded in the driver and in Python for very large result sets, and
+        the first results can be processed before the last ones are transferred. Elements are dropped
+        from the page once sent; the rest of the set is released when the generator is closed.
+
+        Args:
+            selector: jQuery selector to find elements.
+            fields: Mapping of field names to field specs, see `BrowserJQueryCollection.extract`.
+                None to yield the elements themselves.
+            chunk_size: Number of results transferred per round-trip.
+
+        Yields:
+            A BrowserJQuery per element, or a dict per element when `fields` is given.
+        """
+        for chunk in self.stream_chunks(selector, fields, chunk_size=chunk_size):
+            yield from chunk
+
+    def stream_chunks(
+        self, selector: str, fields: dict[str, str] | None = None, *, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[list[Union["BrowserJQuery", dict[str, Any]]]]:
+        """Same as `stream`, yielding whole chunks.
+
+        Raises:
+            RuntimeError: If called inside `batch()`.
+            StaleElementReferenceException: If the match set was lost, e.g. because the page navigated.
+        """
+        self._require_unbatched("Streams")
+        parsed = parse_extract_fields(fields) if fields is not None else None
+        args = (selector, native_selector(selector), selector.startswith("#"))
+        origin = self._origin("find", args)
+        result_id, count = self.call("storeFind", *args)
+        sent = 0
+        try:
+            while sent < count:
+                chunk = self.call("streamNext", result_id, chunk_size, parsed)
+                if chunk is None:
+                    raise StaleElementReferenceException("Streamed result set is no longer available in the page")
+                if parsed is None:
+                    chunk = [self._wrap(element, recipe_at(origin, sent + i)) for i, element in enumerate(chunk)]
+                sent += len(chunk)
+                yield chunk
+        finally:
+            if sent < count:
+                self.call("release", result_id)
 
     @prepare_result
     def find_closest_ancestor(self, selector: str) -> webelement.WebElement | None:
@@ -296,7 +1396,7 @@ class BrowserJQuery:
         Returns:
             The closest matching ancestor WebElement or None if not found.
         """
-        return self.query(script=jquery_scripts.GET_CLOSEST.format(selector=selector))
+        return self.call("closest", selector)
 
     # Element traversal methods
     def parent(self) -> webelement.WebElement:
@@ -305,9 +1405,7 @@ class BrowserJQuery:
         Returns:
             The parent WebElement.
         """
-        return self.query(
-            script=jquery_scripts.GET_PARENT,
-        )
+        return self.call("parent")
 
     def parents(self) -> list[webelement.WebElement]:
         """Get all parent elements.
@@ -315,9 +1413,7 @@ class BrowserJQuery:
         Returns:
             List of parent WebElements.
         """
-        return self.query(
-            script=jquery_scripts.GET_PARENTS,
-        )
+        return self.call("parents")
 
     def children(self, selector: str | None = None) -> list[webelement.WebElement]:
         """Get direct children of element.
@@ -328,10 +1424,7 @@ class BrowserJQuery:
         Returns:
             List of child WebElements.
         """
-        script = jquery_scripts.GET_CHILDREN.format(selector=selector) if selector else jquery_scripts.GET_CHILDREN_ALL
-        return self.query(
-            script=script,
-        )
+        return self.call("children", selector or None)
 
     def siblings(self, selector: str | None = None) -> list[webelement.WebElement]:
         """Get sibling elements.
@@ -342,10 +1435,7 @@ class BrowserJQuery:
         Returns:
             List of sibling WebElements.
         """
-        script = jquery_scripts.GET_SIBLINGS.format(selector=selector) if selector else jquery_scripts.GET_SIBLINGS_ALL
-        return self.query(
-            script=script,
-        )
+        return self.call("siblings", selector or None)
 
     @prepare_result
     def next(self, selector: str | None = None) -> webelement.WebElement | None:
@@ -357,10 +1447,7 @@ class BrowserJQuery:
         Returns:
             The next sibling WebElement or None if not found.
         """
-        script = jquery_scripts.GET_NEXT.format(selector=selector) if selector else jquery_scripts.GET_NEXT_ALL
-        return self.query(
-            script=script,
-        )
+        return self.call("next", selector or None)
 
     @prepare_result
     def prev(self, selector: str | None = None) -> webelement.WebElement | None:
@@ -372,10 +1459,7 @@ class BrowserJQuery:
         Returns:
             The previous sibling WebElement or None if not found.
         """
-        script = jquery_scripts.GET_PREV.format(selector=selector) if selector else jquery_scripts.GET_PREV_ALL
-        return self.query(
-            script=script,
-        )
+        return self.call("prev", selector or None)
 
     def items(self) -> list[webelement.WebElement]:
         """Get all child elements of the default element.
@@ -383,9 +1467,7 @@ class BrowserJQuery:
         Returns:
             List of child WebElements.
         """
-        return self.query(
-            script=jquery_scripts.GET_CHILDREN_ALL,
-        )
+        return self.call("children", None)
 
     @prepare_result
     def first(self) -> webelement.WebElement | None:
@@ -394,9 +1476,7 @@ class BrowserJQuery:
         Returns:
             The first child WebElement or None if no children exist.
         """
-        return self.query(
-            script=jquery_scripts.GET_FIRST,
-        )
+        return self.call("first")
 
     @prepare_result
     def last(self) -> webelement.WebElement | None:
@@ -405,9 +1485,7 @@ class BrowserJQuery:
         Returns:
             The last child WebElement or None if no children exist.
         """
-        return self.query(
-            script=jquery_scripts.GET_LAST,
-        )
+        return self.call("last")
 
     # Element state/attribute methods
     def has_class(self, class_name: str) -> bool:
@@ -419,9 +1497,7 @@ class BrowserJQuery:
         Returns:
             bool: True if element has the class, False otherwise.
         """
-        return self.query(
-            script=jquery_scripts.HAS_CLASS.format(class_name=class_name),
-        )
+        return self.call("hasClass", class_name)
 
     def matches_selector(self, selector: str) -> bool:
         """Check if element matches a selector.
@@ -432,9 +1508,7 @@ class BrowserJQuery:
         Returns:
             bool: True if element matches selector, False otherwise.
         """
-        return self.query(
-            script=jquery_scripts.MATCHES_SELECTOR.format(selector=selector),
-        )
+        return self.call("matches", selector)
 
     def has(self, selector: str) -> bool:
         """Check if element has descendants matching selector.
@@ -445,9 +1519,7 @@ class BrowserJQuery:
         Returns:
             bool: True if element has matching descendants, False otherwise.
         """
-        return self.query(
-            script=jquery_scripts.HAS_DESCENDANTS.format(selector=selector),
-        )
+        return self.call("has", selector)
 
     def attr(self, attribute_name: str) -> str | None:
         """Get attribute value of element.
@@ -458,9 +1530,7 @@ class BrowserJQuery:
         Returns:
             The attribute value or None if not found.
         """
-        return self.query(
-            script=jquery_scripts.GET_ATTR.format(attribute_name=attribute_name),
-        )
+        return self.call("attr", attribute_name)
 
     def text(self) -> str:
         """Get text content of element.
@@ -468,9 +1538,7 @@ class BrowserJQuery:
         Returns:
             The text content of the element.
         """
-        return self.query(
-            script=jquery_scripts.GET_TEXT,
-        )
+        return self.call("text")
 
     def html(self) -> str:
         """Get HTML content of element.
@@ -478,9 +1546,7 @@ class BrowserJQuery:
         Returns:
             The HTML content of the element.
         """
-        return self.query(
-            script=jquery_scripts.GET_HTML,
-        )
+        return self.call("html")
 
     def is_visible(self) -> bool:
         """Check if element is visible.
@@ -488,9 +1554,7 @@ class BrowserJQuery:
         Returns:
             bool: True if element is visible, False otherwise.
         """
-        return self.query(
-            script=jquery_scripts.IS_VISIBLE,
-        )
+        return self.call("isVisible")
 
     def is_checked(self) -> bool:
         """Check if checkbox/radio is checked.
@@ -498,9 +1562,7 @@ class BrowserJQuery:
         Returns:
             bool: True if element is checked, False otherwise.
         """
-        return self.query(
-            script=jquery_scripts.IS_CHECKED,
-        )
+        return self.call("isChecked")
 
     def is_disabled(self) -> bool:
         """Check if element is disabled.
@@ -508,71 +1570,255 @@ class BrowserJQuery:
         Returns:
             bool: True if element is disabled, False otherwise.
         """
-        return self.query(
-            script=jquery_scripts.IS_DISABLED,
-        )
+        return self.call("isDisabled")
 
     # Text-based search methods
+    def enable_text_index(self):
+        """Answer text searches from an in-page text index instead of re-reading every element's text.
+
+        The index is built on the first search by a single walk over the document's text nodes and
+        maps every element to the range of its text, so a search costs one scan of the page text
+        plus a lookup per candidate. A MutationObserver marks the index dirty on DOM changes and it
+        is rebuilt on the next search. The index is dropped on navigation and rebuilt on demand.
+        """
+        self.session.text_index = True
+
+    def disable_text_index(self):
+        """Stop using the in-page text index and release it, along with its MutationObserver."""
+        self.session.text_index = False
+        self.call("disableTextIndex")
+
+    def _search_text(
+        self,
+        text: str | re.Pattern,
+        selector: str,
+        *,
+        mode: str,
+        order: str,
+        limit: int | None,
+    ) -> list[webelement.WebElement] | Deferred:
+        """Run the in-page text search engine.
+
+        Args:
+            text: Text to search for, or a compiled pattern for regex searches.
+            selector: jQuery selector to filter elements.
+            mode: One of TEXT_SEARCH_MODES.
+            order: "document" for document order or "deepest" for deepest elements first.
+            limit: Maximum number of elements to return, or None for all of them.
+
+        Returns:
+            The matching WebElements.
+
+        Raises:
+            ValueError: If the mode is unknown.
+        """
+        flags = ""
+        if isinstance(text, re.Pattern):
+            mode = "regex"
+            flags = "".join(flag for re_flag, flag in REGEX_FLAGS.items() if text.flags & re_flag)
+            text = text.pattern
+        if mode not in TEXT_SEARCH_MODES:
+            raise ValueError(f"Unknown text search mode '{mode}', expected one of {TEXT_SEARCH_MODES}")
+
+        return self.call(
+            "textSearch",
+            selector,
+            native_selector(selector),
+            text,
+            mode,
+            flags,
+            order,
+            limit,
+            self.session.text_index,
+        )
+
     @prepare_result
     def find_elements_with_text(
-        self, text: str, selector: str = "*"
+        self, text: str | re.Pattern, selector: str = "*", *, mode: str = "contains", limit: int | None = None
     ) -> list[webelement.WebElement] | webelement.WebElement | None:
         """Find elements containing specific text.
 
         Args:
-            text: Text to search for.
+            text: Text to search for, or a compiled pattern for regex searches.
             selector: jQuery selector to filter elements.
+            mode: How text is matched: "contains", "exact" (whole trimmed text), "regex" (JavaScript
+                regular expression), "casefold" (case-insensitive contains) or "normalized" (contains,
+                with runs of whitespace collapsed).
+            limit: Stop after this many matches, in document order.
 
         Returns:
             A BrowserJQueryCollection of matching elements.
         """
-        script = jquery_scripts.FIND_ELEMENTS_WITH_TEXT.format(selector=selector, text=text, method="")
-        return self.query(script=script)
+        return self._search_text(text, selector, mode=mode, order="document", limit=limit)
+
+    @prepare_result
+    def find_deepest_elements_with_text(
+        self, text: str | re.Pattern, selector: str = "*", *, mode: str = "contains", limit: int | None = None
+    ) -> list[webelement.WebElement] | webelement.WebElement | None:
+        """Find elements containing specific text, deepest in the DOM tree first.
+
+        Args:
+            text: Text to search for, or a compiled pattern for regex searches.
+            selector: jQuery selector to filter elements.
+            mode: How text is matched, see `find_elements_with_text`.
+            limit: Return only the `limit` deepest matches.
+
+        Returns:
+            A BrowserJQueryCollection of matching elements, deepest first.
+        """
+        return self._search_text(text, selector, mode=mode, order="deepest", limit=limit)
 
     @prepare_result
     def find_lowest_element_with_text(
-        self, text: str, selector: str = "*", *, exact_match: bool = False
+        self, text: str | re.Pattern, selector: str = "*", *, exact_match: bool = False, mode: str = "contains"
     ) -> webelement.WebElement | None:
         """Find the lowest element in the DOM tree containing specific text.
 
         Args:
-            text: Text to search for.
+            text: Text to search for, or a compiled pattern for regex searches.
             selector: jQuery selector to filter elements.
-            exact_match: Whether to require an exact text match.
+            exact_match: Whether to require an exact text match, same as `mode="exact"`.
+            mode: How text is matched, see `find_elements_with_text`.
 
         Returns:
             The lowest matching WebElement or None if not found.
         """
-        script = (
-            jquery_scripts.FIND_LOWEST_ELEMENT_WITH_EXACT_TEXT
-            if exact_match
-            else jquery_scripts.FIND_LOWEST_ELEMENT_WITH_TEXT
-        ).format(selector=selector, text=text)
-
-        return self.query(script=script)
+        mode = "exact" if exact_match else mode
+        result = self._search_text(text, selector, mode=mode, order="deepest", limit=1)
+        if isinstance(result, Deferred):
+            return result.then(first_or_none)
+        return first_or_none(result)
 
     @prepare_result
     def find_elements_with_selector_and_text(
         self,
         selector: str,
-        text: str,
+        text: str | re.Pattern,
         *,
         exact_match: bool = False,
+        mode: str = "contains",
+        limit: int | None = None,
     ) -> list[webelement.WebElement] | webelement.WebElement | None:
         """Find elements matching both selector and text criteria.
 
         Args:
             selector: jQuery selector to filter elements.
-            text: Text to search for.
-            exact_match: Whether to require an exact text match.
+            text: Text to search for, or a compiled pattern for regex searches.
+            exact_match: Whether to require an exact text match, same as `mode="exact"`.
+            mode: How text is matched, see `find_elements_with_text`.
+            limit: Stop after this many matches, in document order.
 
         Returns:
             A BrowserJQueryCollection of matching elements.
         """
-        script = (
-            jquery_scripts.FIND_ELEMENTS_WITH_SELECTOR_AND_EXACT_TEXT
-            if exact_match
-            else jquery_scripts.FIND_ELEMENTS_WITH_SELECTOR_AND_TEXT
-        ).format(selector=selector, text=text, method="")
+        mode = "exact" if exact_match else mode
+        return self._search_text(text, selector, mode=mode, order="document", limit=limit)
 
-        return self.query(script=script)
+    # Change observation methods
+    def observe(
+        self,
+        selector: str | None = None,
+        *,
+        attributes: bool = True,
+        text: bool = True,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> DomChangeFeed:
+        """Record the DOM changes of a region of the page with a MutationObserver.
+
+        Args:
+            selector: jQuery selector of the elements to observe, with their descendants.
+                None to observe this element.
+            attributes: Record attribute changes.
+            text: Record changes of text nodes.
+            buffer_size: Maximum number of changes kept in the page between two `changes()` calls;
+                the oldest are dropped beyond that.
+
+        Returns:
+            A DomChangeFeed whose `changes()` drains the recorded changes.
+        """
+        self._require_unbatched("Observers")
+        scoped = native_selector(selector) if selector is not None else None
+        feed_id, targets = self.call("observe", selector, scoped, attributes, text, buffer_size)
+        if not targets:
+            logger.warning("No element matches '%s', the change feed is empty", selector)
+        return DomChangeFeed(self, feed_id, targets)
+
+    # Waiting methods
+    @prepare_result
+    def wait_for(
+        self, selector: str, *, text: str | None = None, visible: bool = False, timeout: float = DEFAULT_WAIT_TIMEOUT
+    ) -> list[webelement.WebElement] | webelement.WebElement | None:
+        """Wait until elements matching a selector are in the page.
+
+        The condition is checked in the page on every DOM mutation, so the call returns as soon as it
+        holds, in a single round-trip, instead of polling `find()` from Python.
+
+        Args:
+            selector: jQuery selector of the elements to wait for.
+            text: Only count elements whose text contains this string.
+            visible: Only count visible elements.
+            timeout: Maximum time to wait, in seconds.
+
+        Returns:
+            A BrowserJQueryCollection of the matching elements.
+
+        Raises:
+            TimeoutException: If no element matched before the timeout.
+        """
+        return self._wait(selector, text=text, visible=visible, gone=False, timeout=timeout)
+
+    def wait_until_gone(
+        self, selector: str, *, text: str | None = None, visible: bool = False, timeout: float = DEFAULT_WAIT_TIMEOUT
+    ):
+        """Wait until no element matches a selector, without polling.
+
+        Args:
+            selector: jQuery selector of the elements to wait for.
+            text: Only count elements whose text contains this string.
+            visible: Only count visible elements, so hidden elements are considered gone.
+            timeout: Maximum time to wait, in seconds.
+
+        Raises:
+            TimeoutException: If elements still matched after the timeout.
+        """
+        self._wait(selector, text=text, visible=visible, gone=True, timeout=timeout)
+
+    def _wait(
+        self, selector: str, *, text: str | None, visible: bool, gone: bool, timeout: float
+    ) -> list[webelement.WebElement]:
+        """Run the in-page wait operation.
+
+        Returns:
+            The matching elements, empty when waiting for them to be gone.
+
+        Raises:
+            TimeoutException: If the condition did not hold before the timeout.
+            JavascriptException: If checking the condition failed in the page.
+        """
+        with self._script_timeout(timeout + SCRIPT_TIMEOUT_MARGIN):
+            done, result = self.call_async(
+                "waitFor", selector, native_selector(selector), text, visible, gone, int(timeout * 1000)
+            )
+        if done is None:
+            raise JavascriptException(result)
+        if not done:
+            state = "gone" if gone else "present"
+            raise TimeoutException(f"Elements matching '{selector}' were not {state} after {timeout} seconds")
+        return result
+
+    @contextlib.contextmanager
+    def _script_timeout(self, seconds: float):
+        """Raise the driver's asynchronous script timeout to at least `seconds` within the block.
+
+        The driver's current timeout is read on each call, and only changed when it is too short, in
+        which case it is restored on exit.
+        """
+        previous = self.driver.timeouts.script
+        if previous >= seconds:
+            yield
+            return
+        self.driver.set_script_timeout(seconds)
+        try:
+            yield
+        finally:
+            self.driver.set_script_timeout(previous)
@@ -1,12 +1,30 @@
 JQUERY_INJECTION = """
+    var timeout = arguments[0];
+    var done = arguments[arguments.length - 1];
+    if (typeof window.jQuery === 'function') return done(true);
+
+    var timer = setTimeout(function() { done(false); }, timeout);
     var script = document.createElement( 'script' );
     script.type = 'text/javascript';
     script.src =  'https://code.jquery.com/jquery-3.7.1.min.js';
+    script.onload = function() {
+        clearTimeout(timer);
+        done(typeof window.jQuery === 'function');
+    };
+    script.onerror = function() {
+        clearTimeout(timer);
+        done(false);
+    };
     document.head.appendChild(script);
+"""
 
-    script.onload = function() {
-        var $ = window.jQuery;
-    }
+JQUERY_READY_CHECK = """
+    return typeof window.jQuery === 'function'
+"""
+
+# Appended to the bundled jQuery source so injection and readiness check share one round-trip
+JQUERY_FILE_INJECTION_SUFFIX = """
+;return typeof window.jQuery === 'function';
 """
 
 PAGE_HTML = """
@@ -17,99 +35,672 @@ JQUERY_INJECTION_CHECK = """
     return $
 """
 
+# Registered with Page.addScriptToEvaluateOnNewDocument after the bundled jQuery source
+JQUERY_PREINJECTION_SUFFIX = """
+;window.__bjqMarker = '{marker}';
+"""
+
 # Document and element queries
 DOCUMENT_QUERY = """return $(document.documentElement)"""
+DOCUMENT_ELEMENT = """return document.documentElement"""
+DOCUMENT_QUERY_IF_MARKED = """
+    return window.__bjqMarker === arguments[0] ? $(document.documentElement) : null
+"""
 
-# Element state checks
-MATCHES_SELECTOR = """return $(arguments[0]).is('{selector}')"""
-HAS_DESCENDANTS = """return $(arguments[0]).has('{selector}').length > 0"""
-IS_VISIBLE = """return $(arguments[0]).is(':visible')"""
-IS_CHECKED = """return $(arguments[0]).is(':checked')"""
-IS_DISABLED = """return $(arguments[0]).is(':disabled')"""
-HAS_CLASS = """return $(arguments[0]).hasClass('{class_name}')"""
-
-# Content queries
-GET_ATTR = """return $(arguments[0]).attr('{attribute_name}')"""
-GET_TEXT = """return $(arguments[0]).text()"""
-GET_HTML = """return $(arguments[0]).html()"""
-
-# Traversal queries
-GET_PARENT = """return $(arguments[0]).parent()"""
-GET_PARENTS = """return $(arguments[0]).parents()"""
-GET_CHILDREN = """return $(arguments[0]).children('{selector}')"""
-GET_CHILDREN_ALL = """return $(arguments[0]).children()"""
-GET_SIBLINGS = """return $(arguments[0]).siblings('{selector}')"""
-GET_SIBLINGS_ALL = """return $(arguments[0]).siblings()"""
-GET_NEXT = """return $(arguments[0]).next('{selector}').first()[0]"""
-GET_NEXT_ALL = """return $(arguments[0]).next().first()[0]"""
-GET_PREV = """return $(arguments[0]).prev('{selector}').first()[0]"""
-GET_PREV_ALL = """return $(arguments[0]).prev().first()[0]"""
-GET_CLOSEST = """return $(arguments[0]).closest('{selector}')"""
-GET_FIRST = """return $(arguments[0]).children().first()"""
-GET_LAST = """return $(arguments[0]).children().last()"""
-
-# Find elements
-FIND_ELEMENTS = """return $(arguments[0]).find("{selector}"){method};"""
-
-FIND_ELEMENTS_WITH_TEXT = """
-    return $(arguments[0])
-        .find('{selector}')
-        .filter(function() {{
-            return $(this).text().indexOf('{text}') !== -1;
-        }}){method}.get();
-"""
-
-
-FIND_LOWEST_ELEMENT_WITH_TEXT = """
-    var elements = $(arguments[0]).find('{selector}').filter(function() {{
-        return $(this).text().indexOf('{text}') !== -1;
-    }}).get();
-    if (elements.length === 0) return null;
-
-    // Find the element with the most parents (deepest in DOM)
-    var deepest = elements[0];
-    var maxDepth = $(deepest).parents().length;
-
-    for (var i = 1; i < elements.length; i++) {{
-        var depth = $(elements[i]).parents().length;
-        if (depth > maxDepth) {{
-            maxDepth = depth;
-            deepest = elements[i];
-        }}
-    }}
-    return deepest;
+# In-page function library.
+# Every operation is defined once per document on window.__bjq and invoked with LIBRARY_CALL, which only
+# ships the operation name and its arguments. The library is assembled from the fragments below; each one
+# registers its operations on `ops`. Operations take the element they run on as first argument, which may
+# be a single-element list as returned by DOCUMENT_QUERY.
+_LIBRARY_CORE = """
+    // Resolved on every call: jQuery may be injected after the library, or removed by the page.
+    function $(selector) {
+        if (typeof window.jQuery !== 'function') throw new ReferenceError('jQuery is not defined');
+        return window.jQuery(selector);
+    }
+
+    function rootElement(element) {
+        return element.nodeType ? element : element[0];
+    }
+
+    // Selects the elements under `root` matching `selector`, natively when a scoped CSS selector is given.
+    function select(root, selector, scoped) {
+        root = rootElement(root);
+        if (scoped !== null) {
+            try {
+                return Array.prototype.slice.call(root.querySelectorAll(scoped));
+            } catch (e) {}
+        }
+        return $(root).find(selector).get();
+    }
+
+    function depth(element) {
+        var count = 0;
+        while ((element = element.parentElement)) count++;
+        return count;
+    }
+
+    // Element finding; plain CSS selectors do not need jQuery on the page.
+    ops.find = function(root, selector, scoped, first) {
+        if (scoped === null) {
+            var elements = $(root).find(selector);
+            return (first ? elements.first() : elements).get();
+        }
+        if (first) {
+            try {
+                var element = rootElement(root).querySelector(scoped);
+                return element ? [element] : [];
+            } catch (e) {
+                return $(root).find(selector).first().get();
+            }
+        }
+        return select(root, selector, scoped);
+    };
+
+    ops.findById = function(root, id) {
+        root = rootElement(root);
+        var element = document.getElementById(id);
+        return element && element !== root && root.contains(element) ? [element] : [];
+    };
+
+    // Element state checks
+    ops.matches = function(element, selector) { return $(element).is(selector); };
+    ops.has = function(element, selector) { return $(element).has(selector).length > 0; };
+    ops.isVisible = function(element) { return $(element).is(':visible'); };
+    ops.isChecked = function(element) { return $(element).is(':checked'); };
+    ops.isDisabled = function(element) { return $(element).is(':disabled'); };
+    ops.hasClass = function(element, className) { return $(element).hasClass(className); };
+
+    // Content queries
+    ops.attr = function(element, name) { return $(element).attr(name); };
+    ops.text = function(element) { return $(element).text(); };
+    ops.html = function(element) { return $(element).html(); };
+
+    // Traversal queries; a null selector means no filtering.
+    function filtered(elements, selector) {
+        return selector === null ? elements : elements.filter(selector);
+    }
+
+    ops.parent = function(element) { return $(element).parent().get(); };
+    ops.parents = function(element) { return $(element).parents().get(); };
+    ops.children = function(element, selector) { return filtered($(element).children(), selector).get(); };
+    ops.siblings = function(element, selector) { return filtered($(element).siblings(), selector).get(); };
+    ops.next = function(element, selector) { return filtered($(element).next(), selector).get(0) || null; };
+    ops.prev = function(element, selector) { return filtered($(element).prev(), selector).get(0) || null; };
+    ops.closest = function(element, selector) { return $(element).closest(selector).get(); };
+    ops.first = function(element) { return $(element).children().first().get(); };
+    ops.last = function(element) { return $(element).children().last().get(); };
+
+    // Snapshot elements are mapped back by their element child path from the document element.
+    ops.elementsAtPaths = function(element, paths, tags) {
+        return paths.map(function(path, i) {
+            var node = document.documentElement;
+            for (var j = 0; node && j < path.length; j++) node = node.children[path[j]];
+            return node && node.tagName.toLowerCase() === tags[i] ? node : null;
+        });
+    };
+
+    // Re-resolution of stale elements: replays [operation, arguments, index] steps from the root.
+    ops.resolve = function(root, steps) {
+        var element = rootElement(root);
+        for (var i = 0; i < steps.length && element; i++) {
+            var result = ops[steps[i][0]].apply(null, [element].concat(steps[i][1]));
+            element = Array.isArray(result) ? result[steps[i][2]] : steps[i][2] === 0 ? result : null;
+        }
+        return element || null;
+    };
 """
 
+# Text search engine.
+# A text view is built by a single walk over the text nodes below a root: their (optionally case-folded
+# or whitespace-collapsed) contents are concatenated and every element maps to the [start, end, depth]
+# range of its text in it, so "contains" checks become range lookups instead of per-element text reads.
+# With the text index enabled, document-wide views are cached on window and a MutationObserver marks
+# them dirty, so they are rebuilt on the next search after a DOM change.
+_LIBRARY_TEXT_SEARCH = """
+    function foldText(kind, text) {
+        if (kind === 'casefold') return text.toLowerCase();
+        if (kind === 'normalized') return text.replace(/\\s+/g, ' ');
+        return text;
+    }
+
+    function buildTextView(root, kind) {
+        var chunks = [], offset = 0, ranges = new WeakMap(), elements = [], lastSpace = true;
+        function visit(node, level) {
+            if (node.nodeType === 3 || node.nodeType === 4) {
+                var data = foldText(kind, node.data);
+                if (kind === 'normalized' && lastSpace && data.charAt(0) === ' ') data = data.slice(1);
+                if (data) {
+                    chunks.push(data);
+                    offset += data.length;
+                    lastSpace = data.charAt(data.length - 1) === ' ';
+                }
+                return;
+            }
+            var start = offset;
+            elements.push(node);
+            for (var child = node.firstChild; child; child = child.nextSibling) {
+                if (child.nodeType === 1 || child.nodeType === 3 || child.nodeType === 4) visit(child, level + 1);
+            }
+            ranges.set(node, [start, offset, level]);
+        }
+        visit(root, 0);
+        return {kind: kind, text: chunks.join(''), ranges: ranges, elements: elements};
+    }
+
+    function indexedTextView(kind) {
+        var index = window.__bjqTextIndex;
+        if (!index) {
+            index = window.__bjqTextIndex = {dirty: true};
+            index.observer = new MutationObserver(function() { index.dirty = true; });
+            index.observer.observe(document, {childList: true, characterData: true, subtree: true});
+        }
+        if (index.dirty) {
+            index.views = {};
+            index.dirty = false;
+        }
+        return index.views[kind] || (index.views[kind] = buildTextView(document.documentElement, kind));
+    }
+
+    function occurrences(text, needle) {
+        var positions = [], position = text.indexOf(needle);
+        while (position !== -1) {
+            positions.push(position);
+            position = text.indexOf(needle, position + 1);
+        }
+        return positions;
+    }
+
+    function covers(positions, range, length) {
+        var low = 0, high = positions.length;
+        while (low < high) {
+            var middle = (low + high) >> 1;
+            if (positions[middle] < range[0]) low = middle + 1; else high = middle;
+        }
+        return low < positions.length && positions[low] + length <= range[1];
+    }
 
-FIND_LOWEST_ELEMENT_WITH_EXACT_TEXT = """
-    var elements = $(arguments[0]).find('{selector}').filter(function() {{
-        return $(this).text().trim() === '{text}';
-    }}).get();
+    function textMatcher(view, needle, mode, flags) {
+        function elementText(element) {
+            var range = view.ranges.get(element);
+            return range ? view.text.slice(range[0], range[1]) : foldText(view.kind, element.textContent);
+        }
 
-    if (elements.length === 0) return null;
+        if (mode === 'regex') {
+            var pattern = new RegExp(needle, flags);
+            return function(element) { return pattern.test(elementText(element)); };
+        }
 
-    // Find the element with the most parents (deepest in DOM)
-    var deepest = elements[0];
-    var maxDepth = $(deepest).parents().length;
+        needle = foldText(view.kind, needle);
+        if (mode === 'normalized') needle = needle.trim();
+        var exact = mode === 'exact';
+        var positions = needle === '' ? null : occurrences(view.text, needle);
 
-    for (var i = 1; i < elements.length; i++) {{
-        var depth = $(elements[i]).parents().length;
-        if (depth > maxDepth) {{
-            maxDepth = depth;
-            deepest = elements[i];
-        }}
-    }}
-    return deepest;
+        return function(element) {
+            var range = view.ranges.get(element);
+            if (!range) {
+                var text = elementText(element);
+                return exact ? text.trim() === needle : text.indexOf(needle) !== -1;
+            }
+            if (positions !== null && !covers(positions, range, needle.length)) return false;
+            return !exact || view.text.slice(range[0], range[1]).trim() === needle;
+        };
+    }
+
+    function searchText(root, selector, scoped, needle, mode, flags, order, limit, useIndex) {
+        root = rootElement(root);
+        var kind = mode === 'casefold' || mode === 'normalized' ? mode : 'raw';
+        var view = useIndex ? indexedTextView(kind) : buildTextView(root, kind);
+        var candidates = selector === '*' && !useIndex ? view.elements.slice(1) : select(root, selector, scoped);
+        var matches = textMatcher(view, needle, mode, flags);
+        var results = [], i;
+
+        if (order === 'document') {
+            for (i = 0; i < candidates.length && (limit === null || results.length < limit); i++) {
+                if (matches(candidates[i])) results.push(candidates[i]);
+            }
+            return results;
+        }
+
+        // Deepest first; ties keep document order.
+        for (i = 0; i < candidates.length; i++) {
+            if (matches(candidates[i])) {
+                var range = view.ranges.get(candidates[i]);
+                results.push([candidates[i], range ? range[2] : depth(candidates[i]), i]);
+            }
+        }
+        results.sort(function(a, b) { return b[1] - a[1] || a[2] - b[2]; });
+        if (limit !== null) results = results.slice(0, limit);
+        return results.map(function(result) { return result[0]; });
+    }
+
+    ops.textSearch = searchText;
+
+    ops.disableTextIndex = function() {
+        var index = window.__bjqTextIndex;
+        if (index) index.observer.disconnect();
+        delete window.__bjqTextIndex;
+    };
 """
 
-FIND_ELEMENTS_WITH_SELECTOR_AND_TEXT = """
-    return $(arguments[0]).find('{selector}').filter(function() {{
-        return $(this).text().indexOf('{text}') !== -1;
-    }}){method}.get();
+# Bulk field extraction
+# Each field is [name, sub-selector or null, operation, argument or null].
+_LIBRARY_EXTRACT = """
+    function extractValue(element, op, arg) {
+        var $element = $(element), value;
+        switch (op) {
+            case 'text': value = $element.text(); break;
+            case 'html': value = $element.html(); break;
+            case 'val': value = $element.val(); break;
+            case 'attr': value = $element.attr(arg); break;
+            case 'prop': value = $element.prop(arg); break;
+            case 'data': value = $element.data(arg); break;
+            case 'is': value = $element.is(arg); break;
+        }
+        return value === undefined ? null : value;
+    }
+
+    function extract(elements, fields, columns) {
+        var records = [], table = {};
+        fields.forEach(function(field) { table[field[0]] = []; });
+        for (var i = 0; i < elements.length; i++) {
+            var record = {};
+            for (var j = 0; j < fields.length; j++) {
+                var field = fields[j];
+                var target = field[1] === null ? elements[i] : $(elements[i]).find(field[1]).get(0);
+                var value = target ? extractValue(target, field[2], field[3]) : null;
+                if (columns) table[field[0]].push(value); else record[field[0]] = value;
+            }
+            if (!columns) records.push(record);
+        }
+        return columns ? table : records;
+    }
+
+    ops.extract = extract;
+
+    ops.findAndExtract = function(root, selector, scoped, fields, columns) {
+        return extract(select(root, selector, scoped), fields, columns);
+    };
 """
 
-FIND_ELEMENTS_WITH_SELECTOR_AND_EXACT_TEXT = """
-    return $(arguments[0]).find('{selector}').filter(function() {{
-        return $(this).text().trim() === '{text}';
-    }}){method}.get();
+# Deferred query chains: jQuery traversal methods applied in turn from the root, then a terminal reading
+# the final set, so a whole chain costs one round-trip. Only methods selecting elements are allowed.
+_LIBRARY_CHAIN = """
+    var chainMethods = {
+        find: true, filter: true, not: true, has: true, first: true, last: true, eq: true, slice: true,
+        children: true, parent: true, parents: true, closest: true, siblings: true,
+        next: true, nextAll: true, prev: true, prevAll: true
+    };
+
+    ops.chain = function(root, steps, terminal, fields) {
+        var elements = $(rootElement(root));
+        for (var i = 0; i < steps.length; i++) {
+            if (chainMethods[steps[i][0]] !== true) throw new TypeError('Unsupported chain method: ' + steps[i][0]);
+            elements = elements[steps[i][0]].apply(elements, steps[i][1]);
+        }
+        switch (terminal) {
+            case 'count': return elements.length;
+            case 'extract': return extract(elements.get(), fields[0], fields[1]);
+            default: return elements.get();
+        }
+    };
 """
+
+# Lazy result sets: matches stay in the page and are fetched in windows.
+# The element argument of the stored-set operations is unused.
+_LIBRARY_RESULT_STORE = """
+    var resultSets = {next: 1, sets: {}, cursors: {}};
+
+    function storedResults(id) {
+        return resultSets.sets[id] || null;
+    }
+
+    ops.storeFind = function(root, selector, scoped, first) {
+        var elements = ops.find(root, selector, scoped, first), id = resultSets.next++;
+        resultSets.sets[id] = elements;
+        return [id, elements.length];
+    };
+
+    ops.slice = function(element, id, start, stop) {
+        var elements = storedResults(id);
+        return elements === null ? null : elements.slice(start, stop);
+    };
+
+    ops.release = function(element, id) {
+        delete resultSets.sets[id];
+        delete resultSets.cursors[id];
+    };
+
+    ops.extractStored = function(element, id, fields, columns) {
+        var elements = storedResults(id);
+        return elements === null ? null : extract(elements, fields, columns);
+    };
+
+    // Streaming: returns the next `count` elements of a set, or their extracted records when fields are
+    // given. Returned elements are dropped from the page and the set is released once exhausted.
+    ops.streamNext = function(element, id, count, fields) {
+        var elements = storedResults(id);
+        if (elements === null) return null;
+        var start = resultSets.cursors[id] || 0, stop = Math.min(start + count, elements.length);
+        var chunk = elements.slice(start, stop);
+        for (var i = start; i < stop; i++) elements[i] = null;
+        if (stop < elements.length) {
+            resultSets.cursors[id] = stop;
+        } else {
+            delete resultSets.sets[id];
+            delete resultSets.cursors[id];
+        }
+        return fields === null ? chunk : extract(chunk, fields, false);
+    };
+"""
+
+# Element registry: elements are handed to Python as small integer ids instead of WebDriver references.
+# Entries hold WeakRefs where supported, so elements removed from the page can still be collected.
+# The element argument of the registry operations is unused.
+_LIBRARY_REGISTRY = """
+    var registry = {next: 1, entries: new Map(), weak: typeof WeakRef === 'function'};
+
+    function registered(id) {
+        var entry = registry.entries.get(id);
+        if (entry === undefined) return null;
+        return registry.weak ? entry.deref() || null : entry;
+    }
+
+    ops.register = function(root, selector, scoped, first) {
+        return ops.find(root, selector, scoped, first).map(function(element) {
+            var id = registry.next++;
+            registry.entries.set(id, registry.weak ? new WeakRef(element) : element);
+            return id;
+        });
+    };
+
+    ops.registered = function(element, ids) {
+        return ids.map(registered);
+    };
+
+    ops.extractRegistered = function(element, ids, fields, columns) {
+        return extract(ids.map(registered), fields, columns);
+    };
+
+    // Drops the given ids, or every entry when ids is null; returns the number of entries dropped.
+    ops.unregister = function(element, ids) {
+        var size = registry.entries.size;
+        if (ids === null) registry.entries.clear();
+        else ids.forEach(function(id) { registry.entries.delete(id); });
+        return size - registry.entries.size;
+    };
+
+    // Drops the entries of collected elements and of elements no longer in the document.
+    ops.evictRegistered = function(element) {
+        var size = registry.entries.size;
+        registry.entries.forEach(function(entry, id) {
+            var node = registry.weak ? entry.deref() : entry;
+            if (!node || !node.isConnected) registry.entries.delete(id);
+        });
+        return size - registry.entries.size;
+    };
+"""
+
+# Waits: asynchronous operations, called with a completion callback as last argument.
+# The condition is checked on every DOM mutation instead of being polled from Python.
+_LIBRARY_WAIT = """
+    // Same definition of visibility as jQuery's :visible, without requiring jQuery.
+    function isRendered(element) {
+        return !!(element.offsetWidth || element.offsetHeight || element.getClientRects().length);
+    }
+
+    // Calls done([true, elements]) once the condition holds, [false, null] on timeout
+    // and [null, message] if checking the condition fails.
+    ops.waitFor = function(root, selector, scoped, text, visible, gone, timeout, done) {
+        var observer = null, timer = null;
+
+        function check() {
+            var elements = select(root, selector, scoped).filter(function(element) {
+                return (text === null || element.textContent.indexOf(text) !== -1) && (!visible || isRendered(element));
+            });
+            return (gone ? elements.length === 0 : elements.length > 0) ? elements : null;
+        }
+
+        function finish(result) {
+            if (observer) observer.disconnect();
+            clearTimeout(timer);
+            done(result);
+        }
+
+        function update() {
+            try {
+                var elements = check();
+                if (elements !== null) finish([true, elements]);
+            } catch (e) {
+                finish([null, String(e)]);
+            }
+        }
+
+        var elements = check();
+        if (elements !== null) return done([true, elements]);
+        observer = new MutationObserver(update);
+        observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+        timer = setTimeout(function() { finish([false, null]); }, timeout);
+    };
+"""
+
+# Page capture: the serialized page is stored with the result sets and transferred in slices.
+_LIBRARY_CAPTURE = """
+    function storeResult(value) {
+        var id = resultSets.next++;
+        resultSets.sets[id] = value;
+        return id;
+    }
+
+    function documentHtml() {
+        return '<html>' + document.documentElement.innerHTML + '</html>';
+    }
+
+    ops.captureHtml = function(element) {
+        var html = documentHtml();
+        return [storeResult(html), html.length];
+    };
+
+    // Asynchronous: calls done([id, byte length]) with the gzipped UTF-8 page, or null without CompressionStream.
+    ops.captureHtmlGzip = function(element, done) {
+        if (typeof CompressionStream !== 'function') return done(null);
+        var stream = new Blob([documentHtml()]).stream().pipeThrough(new CompressionStream('gzip'));
+        new Response(stream).arrayBuffer().then(
+            function(buffer) { done([storeResult(new Uint8Array(buffer)), buffer.byteLength]); },
+            function() { done(null); }
+        );
+    };
+
+    // Returns [text, stop], ending the slice early rather than between the halves of a surrogate pair.
+    ops.htmlSlice = function(element, id, start, stop) {
+        var html = storedResults(id);
+        if (html === null) return null;
+        stop = Math.min(stop, html.length);
+        var code = html.charCodeAt(stop - 1);
+        if (stop < html.length && stop - 1 > start && code >= 0xD800 && code <= 0xDBFF) stop--;
+        return [html.slice(start, stop), stop];
+    };
+
+    // Returns a slice of captured bytes, base64-encoded.
+    ops.bytesSlice = function(element, id, start, stop) {
+        var bytes = storedResults(id);
+        if (bytes === null) return null;
+        stop = Math.min(stop, bytes.length);
+        var binary = '';
+        for (var i = start; i < stop; i += 0x8000) {
+            binary += String.fromCharCode.apply(null, bytes.subarray(i, Math.min(i + 0x8000, stop)));
+        }
+        return btoa(binary);
+    };
+"""
+
+# Change feeds: a MutationObserver buffers compact records [type, element, tag, name, value] until drained.
+_LIBRARY_OBSERVE = """
+    var feeds = {next: 1, feeds: {}};
+
+    function tagName(element) {
+        return element ? element.tagName.toLowerCase() : null;
+    }
+
+    ops.observe = function(root, selector, scoped, attributes, characterData, limit) {
+        var targets = selector === null ? [rootElement(root)] : select(root, selector, scoped);
+        var feed = {records: [], dropped: 0}, id = feeds.next++;
+
+        function push(record) {
+            if (feed.records.length >= limit) {
+                feed.records.shift();
+                feed.dropped++;
+            }
+            feed.records.push(record);
+        }
+
+        feed.handle = function(mutations) {
+            mutations.forEach(function(mutation) {
+                var target = mutation.target;
+                if (mutation.type === 'childList') {
+                    mutation.addedNodes.forEach(function(node) {
+                        if (node.nodeType === 1) push(['added', node, tagName(node), null, null]);
+                        else if (node.nodeType === 3) push(['text', target, tagName(target), null, node.data]);
+                    });
+                    mutation.removedNodes.forEach(function(node) {
+                        if (node.nodeType === 1) push(['removed', null, tagName(node), null, null]);
+                    });
+                } else if (mutation.type === 'attributes') {
+                    var name = mutation.attributeName;
+                    push(['attribute', target, tagName(target), name, target.getAttribute(name)]);
+                } else {
+                    push(['text', target.parentElement, tagName(target.parentElement), null, target.data]);
+                }
+            });
+        };
+        feed.observer = new MutationObserver(feed.handle);
+        targets.forEach(function(target) {
+            feed.observer.observe(target, {
+                childList: true, subtree: true, attributes: attributes, characterData: characterData
+            });
+        });
+        feeds.feeds[id] = feed;
+        return [id, targets.length];
+    };
+
+    // Returns [records, number of records dropped from the full buffer], or null for an unknown feed.
+    // Elements detached since their change was recorded are replaced by null.
+    ops.drainChanges = function(element, id) {
+        var feed = feeds.feeds[id];
+        if (!feed) return null;
+        feed.handle(feed.observer.takeRecords());
+        var records = feed.records, dropped = feed.dropped;
+        feed.records = [];
+        feed.dropped = 0;
+        records.forEach(function(record) {
+            if (record[1] && !record[1].isConnected) record[1] = null;
+        });
+        return [records, dropped];
+    };
+
+    ops.disconnect = function(element, id) {
+        var feed = feeds.feeds[id];
+        if (feed) feed.observer.disconnect();
+        delete feeds.feeds[id];
+    };
+"""
+
+# Mutation epoch for result caching: changes on every DOM mutation, and between documents.
+_LIBRARY_EPOCH = """
+    var epoch = {token: Math.random().toString(36).slice(2), value: 0, observer: null};
+
+    function currentEpoch() {
+        if (!epoch.observer) {
+            epoch.observer = new MutationObserver(function() { epoch.value++; });
+            epoch.observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+        }
+        if (epoch.observer.takeRecords().length) epoch.value++;
+        return epoch.token + ':' + epoch.value;
+    }
+"""
+
+LIBRARY = (
+    """
+    if (!window.__bjq) (function() {
+        var ops = {};
+"""
+    + _LIBRARY_CORE
+    + _LIBRARY_TEXT_SEARCH
+    + _LIBRARY_EXTRACT
+    + _LIBRARY_CHAIN
+    + _LIBRARY_RESULT_STORE
+    + _LIBRARY_REGISTRY
+    + _LIBRARY_CAPTURE
+    + _LIBRARY_OBSERVE
+    + _LIBRARY_EPOCH
+    + _LIBRARY_WAIT
+    + """
+        window.__bjq = {
+            ops: ops,
+            call: function(args) {
+                return ops[args[1]].apply(null, [args[0]].concat(Array.prototype.slice.call(args, 2)));
+            },
+            epoch: currentEpoch
+        };
+    })();
+"""
+)
+
+# Arguments: [element, operation name, operation arguments...]
+# Run with execute_async_script for asynchronous operations, which receive the callback as last argument.
+LIBRARY_CALL = """
+    if (!window.__bjq) throw new Error('BrowserJQuery library is not installed');
+    return window.__bjq.call(arguments);
+"""
+
+# Document marker: stamped on injection so a known document needs no jQuery probe.
+# Marking also installs the function library, which needs no jQuery for its native operations.
+DOCUMENT_MARK = (
+    LIBRARY
+    + """
+    if (typeof window.jQuery !== 'function') return false;
+    window.__bjqMarker = arguments[0];
+    return true;
+"""
+)
+
+# Same as LIBRARY_CALL, returning [result, in-page execution time in milliseconds] for metrics.
+LIBRARY_CALL_TIMED = """
+    if (!window.__bjq) throw new Error('BrowserJQuery library is not installed');
+    var start = performance.now();
+    var result = window.__bjq.call(arguments);
+    return [result, performance.now() - start];
+"""
+
+# Same as LIBRARY_CALL, returning [result, mutation epoch] for result caching.
+LIBRARY_CALL_EPOCH = """
+    if (!window.__bjq) throw new Error('BrowserJQuery library is not installed');
+    var result = window.__bjq.call(arguments);
+    return [result, window.__bjq.epoch()];
+"""
+
+# Same as LIBRARY_CALL_EPOCH, returning [[result, mutation epoch], in-page execution time in milliseconds].
+LIBRARY_CALL_EPOCH_TIMED = """
+    if (!window.__bjq) throw new Error('BrowserJQuery library is not installed');
+    var start = performance.now();
+    var result = [window.__bjq.call(arguments), window.__bjq.epoch()];
+    return [result, performance.now() - start];
+"""
+
+# Batched execution
+BATCH_WRAPPER = """
+    var calls = arguments;
+    return [
+        {calls}
+    ];
+"""
+
+BATCH_CALL = """(function() {{
+        try {{
+            return [true, (function() {{
+                {script}
+            }}).apply(null, calls[{index}])];
+        }} catch (e) {{
+            return [false, String(e)];
+        }}
+    }})()"""
@@ -0,0 +1,197 @@
+import json
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from browserjquery import settings
+
+logger = settings.getLogger(__name__)
+
+# Key under which WebDriver serializes element references.
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+
+def payload_size(value: Any) -> int:
+    """Approximate the size in bytes of a value as serialized on the WebDriver wire."""
+
+    def element_reference(element: Any) -> dict[str, str]:
+        return {ELEMENT_KEY: str(getattr(element, "id", ""))}
+
+    try:
+        return len(json.dumps(value, default=element_reference).encode())
+    except (TypeError, ValueError):
+        return 0
+
+
+class QueryRecord:
+    """Measurements of a single query.
+
+    Times are in seconds. `in_page` is measured with `performance.now()` for library calls and is
+    None for raw scripts, in which case `transport` includes the in-page execution.
+    """
+
+    __slots__ = ("operation", "wall", "python", "transport", "in_page", "script_size", "result_size", "error")
+
+    def __init__(
+        self,
+        operation: str,
+        wall: float,
+        python: float,
+        transport: float,
+        in_page: float | None,
+        script_size: int,
+        result_size: int,
+        error: bool,
+    ):
+        self.operation = operation
+        self.wall = wall
+        self.python = python
+        self.transport = transport
+        self.in_page = in_page
+        self.script_size = script_size
+        self.result_size = result_size
+        self.error = error
+
+    def __repr__(self) -> str:
+        return f"<QueryRecord {self.operation} {self.wall * 1000:.2f} ms>"
+
+
+class OperationStats:
+    """Aggregated measurements of one operation."""
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.wall = 0.0
+        self.python = 0.0
+        self.transport = 0.0
+        # None until a call reports its in-page time, which raw scripts and asynchronous calls do not
+        self.in_page: float | None = None
+        self.script_bytes = 0
+        self.result_bytes = 0
+
+    def add(self, record: QueryRecord):
+        self.count += 1
+        self.errors += record.error
+        self.wall += record.wall
+        self.python += record.python
+        self.transport += record.transport
+        if record.in_page is not None:
+            self.in_page = (self.in_page or 0.0) + record.in_page
+        self.script_bytes += record.script_size
+        self.result_bytes += record.result_size
+
+    def as_dict(self) -> dict[str, float | int]:
+        """Get the totals, with times in milliseconds, and the mean wall time per call.
+
+        "in_page_ms" is only present when calls reported their in-page time.
+        """
+        stats = {
+            "count": self.count,
+            "errors": self.errors,
+            "wall_ms": self.wall * 1000,
+            "python_ms": self.python * 1000,
+            "transport_ms": self.transport * 1000,
+            "mean_ms": self.wall * 1000 / self.count if self.count else 0.0,
+            "script_bytes": self.script_bytes,
+            "result_bytes": self.result_bytes,
+        }
+        if self.in_page is not None:
+            stats["in_page_ms"] = self.in_page * 1000
+        return stats
+
+
+class QueryMetrics:
+    """Default collector of query measurements, enabled with `BrowserJQuery.enable_metrics()`.
+
+    Any object with the same `record`, `add_python_time`, `cache_hit` and `cache_miss` methods can be
+    used as a collector instead, e.g. to forward measurements to a tracing system. Listeners added
+    with `subscribe` receive every QueryRecord as it is recorded.
+    """
+
+    def __init__(self):
+        """Initialize an empty collector."""
+        self.operations: dict[str, OperationStats] = {}
+        self.caches: dict[str, list[int]] = {}
+        self.listeners: list[Callable[[QueryRecord], Any]] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def subscribe(self, listener: Callable[[QueryRecord], Any]):
+        """Call `listener` with every recorded QueryRecord."""
+        self.listeners.append(listener)
+
+    def record(self, record: QueryRecord):
+        """Add the measurements of a query."""
+        with self._lock:
+            stats = self.operations.get(record.operation)
+            if stats is None:
+                stats = self.operations[record.operation] = OperationStats()
+            stats.add(record)
+        self._local.last = record.operation
+        for listener in self.listeners:
+            listener(record)
+
+    def add_python_time(self, seconds: float):
+        """Add time spent wrapping the result of the last query of the current thread."""
+        operation = getattr(self._local, "last", None)
+        if operation is None:
+            return
+        with self._lock:
+            stats = self.operations[operation]
+            stats.python += seconds
+            stats.wall += seconds
+
+    def cache_hit(self, cache: str):
+        """Count a hit of a cache avoiding a round-trip."""
+        with self._lock:
+            self.caches.setdefault(cache, [0, 0])[0] += 1
+
+    def cache_miss(self, cache: str):
+        """Count a miss of a cache avoiding a round-trip."""
+        with self._lock:
+            self.caches.setdefault(cache, [0, 0])[1] += 1
+
+    def reset(self):
+        """Drop all measurements."""
+        with self._lock:
+            self.operations.clear()
+            self.caches.clear()
+
+    def summary(self) -> dict[str, Any]:
+        """Get all measurements as a JSON-serializable dict.
+
+        Returns:
+            Per-operation totals under "operations", their sum under "total" and cache hit/miss
+            counts under "caches".
+        """
+        with self._lock:
+            total = OperationStats()
+            for stats in self.operations.values():
+                for name in ("count", "errors", "wall", "python", "transport"):
+                    setattr(total, name, getattr(total, name) + getattr(stats, name))
+                if stats.in_page is not None:
+                    total.in_page = (total.in_page or 0.0) + stats.in_page
+                total.script_bytes += stats.script_bytes
+                total.result_bytes += stats.result_bytes
+            return {
+                "operations": {name: stats.as_dict() for name, stats in sorted(self.operations.items())},
+                "total": total.as_dict(),
+                "caches": {name: {"hits": hits, "misses": misses} for name, (hits, misses) in self.caches.items()},
+            }
+
+    def report(self) -> str:
+        """Format the summary as a text table, slowest operations first."""
+        summary = self.summary()
+        columns = ("count", "wall_ms", "python_ms", "transport_ms", "in_page_ms", "script_bytes", "result_bytes")
+        rows = sorted(summary["operations"].items(), key=lambda item: -item[1]["wall_ms"])
+        lines = [f"{'operation':<24}" + "".join(f"{column:>14}" for column in columns)]
+        for name, stats in rows + [("TOTAL", summary["total"])]:
+            cells = (
+                f"{'-':>14}" if c not in stats else f"{stats[c]:>14.2f}" if c.endswith("_ms") else f"{stats[c]:>14}"
+                for c in columns
+            )
+            lines.append(f"{name:<24}" + "".join(cells))
+        for name, counts in summary["caches"].items():
+            lines.append(f"cache {name}: {counts['hits']} hits, {counts['misses']} misses")
+        return "\n".join(lines)
@@ -0,0 +1,287 @@
+import contextlib
+import multiprocessing.util
+import queue
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from browserjquery import settings
+from browserjquery.jquery import BrowserJQuery
+
+logger = settings.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DriverFactory = Callable[[], Any]
+
+
+def launch_browser(factory: DriverFactory, preinject: bool = True) -> BrowserJQuery:
+    """Launch a driver and warm it up: inject jQuery and register pre-injection for later documents.
+
+    Args:
+        factory: Callable creating a new webdriver instance.
+        preinject: Register jQuery pre-injection, on drivers supporting it.
+
+    Returns:
+        A BrowserJQuery bound to the new driver.
+    """
+    driver = factory()
+    try:
+        browser = BrowserJQuery(driver)
+        if preinject:
+            browser.enable_preinjection()
+    except Exception:
+        driver.quit()
+        raise
+    return browser
+
+
+def quit_browser(browser: BrowserJQuery):
+    """Quit the driver of a browser, ignoring the errors of an already dead session."""
+    with contextlib.suppress(Exception):
+        browser.driver.quit()
+
+
+def is_alive(browser: BrowserJQuery) -> bool:
+    """Check whether the driver session of a browser still answers commands.
+
+    A dead driver process surfaces as connection errors of the HTTP client rather than WebDriver
+    errors, so any failure counts as a dead session.
+    """
+    try:
+        browser.execute("return 1")
+    except Exception:
+        return False
+    return True
+
+
+class PooledBrowser:
+    """A browser owned by a pool, with its usage count."""
+
+    def __init__(self, browser: BrowserJQuery):
+        """Initialize a pool entry.
+
+        Args:
+            browser: The warmed-up browser.
+        """
+        self.browser = browser
+        self.uses = 0
+
+
+class BrowserJQueryPool:
+    """A fixed-size pool of warmed-up browsers for parallel scraping.
+
+    Browsers are leased one caller at a time. Sessions whose driver crashed, and sessions that
+    reached `max_uses` leases (to bound the memory growth of long-lived browsers), are replaced
+    by fresh ones when they are returned.
+
+    Usage:
+        with BrowserJQueryPool(size=4, factory=make_driver) as pool:
+            titles = pool.map(scrape_title, urls)
+    """
+
+    def __init__(
+        self,
+        size: int,
+        factory: DriverFactory,
+        *,
+        max_uses: int | None = None,
+        preinject: bool = True,
+    ):
+        """Initialize a pool; browsers are launched by `start()` or on entering the context.
+
+        Args:
+            size: Number of browsers.
+            factory: Callable creating a new webdriver instance. Must be picklable (e.g. a module-level
+                function) to use `map(..., processes=True)`.
+            max_uses: Recycle a browser after this many leases. None to never recycle healthy browsers.
+            preinject: Register jQuery pre-injection on each browser, on drivers supporting it.
+        """
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+        self.size = size
+        self.factory = factory
+        self.max_uses = max_uses
+        self.preinject = preinject
+        self.recycled = 0
+        # None wakes up waiting leases once no browser will be returned anymore
+        self._idle: "queue.Queue[PooledBrowser | None]" = queue.Queue()
+        self._entries: list[PooledBrowser] = []
+        self._lock = threading.Lock()
+        self._started = False
+        self._closed = False
+
+    def __enter__(self) -> "BrowserJQueryPool":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _launch(self) -> BrowserJQuery:
+        return launch_browser(self.factory, self.preinject)
+
+    def start(self):
+        """Launch and warm up all browsers in parallel."""
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            futures = [executor.submit(self._launch) for _ in range(self.size)]
+        browsers = []
+        errors = []
+        for future in futures:
+            try:
+                browsers.append(future.result())
+            except Exception as error:
+                errors.append(error)
+        if errors:
+            for browser in browsers:
+                quit_browser(browser)
+            raise errors[0]
+
+        for browser in browsers:
+            entry = PooledBrowser(browser)
+            self._entries.append(entry)
+            self._idle.put(entry)
+        logger.info("Started browser pool of %d browsers", self.size)
+
+    def close(self):
+        """Quit all browsers. Browsers leased at that time are quit when they are returned."""
+        with self._lock:
+            self._closed = True
+            entries, self._entries = self._entries, []
+        self._idle.put(None)
+        for entry in entries:
+            quit_browser(entry.browser)
+        logger.info("Closed browser pool")
+
+    @contextlib.contextmanager
+    def lease(self, timeout: float | None = None) -> Iterator[BrowserJQuery]:
+        """Borrow a browser for the duration of a `with` block.
+
+        An error raised in the block triggers a health check, and a browser whose session died is
+        replaced by a new one.
+
+        Args:
+            timeout: Seconds to wait for a free browser. None to wait indefinitely.
+
+        Yields:
+            A BrowserJQuery for exclusive use within the block.
+
+        Raises:
+            RuntimeError: If the pool is closed, or has no browsers left after failing to replace them.
+            TimeoutError: If no browser became available in time.
+        """
+        if self._closed:
+            raise RuntimeError("Browser pool is closed")
+        self.start()
+        try:
+            entry = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No browser available in the pool after {timeout} seconds") from None
+        if entry is None:
+            self._idle.put(None)
+            raise RuntimeError("Browser pool is closed" if self._closed else "Browser pool has no browsers left")
+
+        entry.uses += 1
+        healthy = True
+        try:
+            yield entry.browser
+        except Exception:
+            healthy = is_alive(entry.browser)
+            raise
+        finally:
+            self._return(entry, healthy)
+
+    def _return(self, entry: PooledBrowser, healthy: bool):
+        """Put a leased browser back, replacing it first if it is dead or worn out."""
+        if self._closed:
+            quit_browser(entry.browser)
+            return
+
+        if not healthy or (self.max_uses is not None and entry.uses >= self.max_uses):
+            reason = "crashed" if not healthy else f"reached {entry.uses} uses"
+            logger.info("Recycling pooled browser: %s", reason)
+            quit_browser(entry.browser)
+            try:
+                replacement = PooledBrowser(self._launch())
+            except Exception:
+                logger.exception("Could not replace pooled browser, the pool shrinks by one")
+                with self._lock:
+                    self._entries.remove(entry)
+                    empty = not self._entries
+                if empty:
+                    logger.error("Browser pool has no browsers left")
+                    self._idle.put(None)
+                return
+            with self._lock:
+                self._entries[self._entries.index(entry)] = replacement
+                self.recycled += 1
+            entry = replacement
+        self._idle.put(entry)
+
+    def map(
+        self,
+        fn: Callable[[BrowserJQuery, T], R],
+        items: Iterable[T],
+        *,
+        processes: bool = False,
+        timeout: float | None = None,
+    ) -> list[R]:
+        """Apply `fn(browser, item)` to every item, one browser per concurrent call.
+
+        With threads, the pool's browsers are leased for each call. WebDriver calls spend most of
+        their time waiting on the browser, so threads are enough unless `fn` does heavy processing
+        in Python: `processes=True` runs the calls in `size` worker processes, each launching and
+        owning its own browser with the pool's factory, so that processing scales across cores.
+        `fn` and the factory must then be picklable.
+
+        Args:
+            fn: Function called with a browser and an item.
+            items: Items to process, e.g. URLs.
+            processes: Run the calls in worker processes instead of threads.
+            timeout: Seconds to wait for a free browser, for each call with threads.
+
+        Returns:
+            The results, in the order of the items.
+        """
+        items = list(items)
+        if processes:
+            with ProcessPoolExecutor(
+                max_workers=self.size, initializer=_init_worker, initargs=(self.factory, self.preinject)
+            ) as executor:
+                return list(executor.map(_run_in_worker, [fn] * len(items), items))
+
+        def run(item: T) -> R:
+            with self.lease(timeout=timeout) as browser:
+                return fn(browser, item)
+
+        self.start()
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            return list(executor.map(run, items))
+
+
+# Browser of the current worker process for map(..., processes=True), with what is needed to replace it.
+_WORKER: dict[str, Any] = {}
+
+
+def _init_worker(factory: DriverFactory, preinject: bool):
+    _WORKER.update(factory=factory, preinject=preinject, browser=launch_browser(factory, preinject))
+    # Worker processes exit without running atexit handlers, multiprocessing finalizers do run.
+    multiprocessing.util.Finalize(None, lambda: quit_browser(_WORKER["browser"]), exitpriority=10)
+
+
+def _run_in_worker(fn: Callable[[BrowserJQuery, T], R], item: T) -> R:
+    try:
+        return fn(_WORKER["browser"], item)
+    except Exception:
+        if not is_alive(_WORKER["browser"]):
+            logger.info("Recycling crashed browser of worker process")
+            quit_browser(_WORKER["browser"])
+            _WORKER["browser"] = launch_browser(_WORKER["factory"], _WORKER["preinject"])
+        raise
@@ -0,0 +1,125 @@
+import weakref
+from typing import Any
+
+from selenium.webdriver.remote.command import Command
+
+from browserjquery import settings
+from browserjquery.batch import QueryBatch
+
+logger = settings.getLogger(__name__)
+
+# One session per driver, dropped together with the driver: sessions only hold weak references to their driver.
+_SESSIONS: "weakref.WeakKeyDictionary[Any, BrowserSession]" = weakref.WeakKeyDictionary()
+
+# WebDriver commands loading another document, or making scripts run in another one.
+NAVIGATION_COMMANDS = frozenset(
+    {
+        Command.GET,
+        Command.REFRESH,
+        Command.GO_BACK,
+        Command.GO_FORWARD,
+        Command.NEW_WINDOW,
+        Command.CLOSE,
+        Command.SWITCH_TO_WINDOW,
+        Command.SWITCH_TO_FRAME,
+        Command.SWITCH_TO_PARENT_FRAME,
+    }
+)
+
+
+class BrowserSession:
+    """State shared by every BrowserJQuery bound to the same driver.
+
+    Holding the injection state and the document handle here lets child wrappers
+    (collection items, traversal results) be created without touching the browser.
+    """
+
+    def __init__(self, driver):
+        """Initialize an empty session.
+
+        Args:
+            driver: The webdriver instance the session belongs to.
+        """
+        self._driver = weakref.ref(driver)
+        self.jquery_injected = False
+        self.marker: str | None = None
+        self.preinjection_marker: str | None = None
+        self.preinjection_id: str | None = None
+        self.document = None
+        self.text_index = False
+        self.batch: QueryBatch | None = None
+        self.metrics = None
+        self.cache = None
+        # Wrapper set as the driver's `execute` by `watch_navigation()`, and the `execute` it replaced.
+        self._watched_execute = None
+        self._own_execute = None
+        # Per event loop locks serializing AsyncBrowserJQuery calls: a WebDriver session runs one command at a time.
+        self.async_locks: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    @property
+    def driver(self):
+        """The webdriver instance the session belongs to, or None once it has been garbage collected."""
+        return self._driver()
+
+    @classmethod
+    def for_driver(cls, driver) -> "BrowserSession":
+        """Get the session for a driver, creating it on first use.
+
+        Args:
+            driver: The webdriver instance.
+
+        Returns:
+            The BrowserSession shared by all wrappers of this driver.
+        """
+        session = _SESSIONS.get(driver)
+        if session is None:
+            session = _SESSIONS[driver] = cls(driver)
+        return session
+
+    def watch_navigation(self):
+        """Clear the result cache after every navigation command sent through the driver.
+
+        Cached results are served without contacting the page, so a `driver.get()` would otherwise go
+        unnoticed by wrappers holding elements of the previous document until their next round-trip.
+        The driver's `execute` is wrapped until `unwatch_navigation()`; watching twice wraps it once.
+        """
+        driver = self.driver
+        if self._watched_execute is not None or driver is None or not hasattr(driver, "execute"):
+            return
+        execute = driver.execute
+
+        def execute_watching_navigation(driver_command, params=None):
+            try:
+                return execute(driver_command, params)
+            finally:
+                if driver_command in NAVIGATION_COMMANDS and self.cache is not None:
+                    self.cache.clear()
+
+        # None when `execute` is the driver class' own method rather than set on the instance.
+        self._own_execute = getattr(driver, "__dict__", {}).get("execute")
+        driver.execute = self._watched_execute = execute_watching_navigation
+
+    def unwatch_navigation(self):
+        """Give the driver back the `execute` it had before `watch_navigation()`."""
+        driver = self.driver
+        watched, self._watched_execute = self._watched_execute, None
+        # Leave the wrapper in place if something wrapped `execute` again since, it only calls through.
+        if driver is None or watched is None or getattr(driver, "__dict__", {}).get("execute") is not watched:
+            return
+        if self._own_execute is None:
+            del driver.execute
+        else:
+            driver.execute = self._own_execute
+        self._own_execute = None
+
+    def invalidate(self):
+        """Forget the injection state and document handle, e.g. after a navigation.
+
+        Pre-injection stays registered, so the next document is already marked.
+        """
+        logger.debug("Invalidating browser session state")
+        self.jquery_injected = False
+        self.marker = None
+        self.document = None
+        if self.cache is not None:
+            self.cache.clear()
@@ -1,11 +1,9 @@
 # https://github.com/pjialin/django-environ
 
-import logging.config
+import functools
+import logging
 from pathlib import Path
 
-import environ
-import yaml
-
 BASE_DIR = Path(__file__).parent
 
 LOG_CONF_FILE = "log_config/log_config.yaml"
@@ -20,9 +18,8 @@ ENV_FILE = "../.env"
 # logger = get_logger(__name__)
 # logger.log("message")
 
-with open(BASE_DIR / LOG_CONF_FILE) as f:
-    config = yaml.safe_load(f.read())
-    logging.config.dictConfig(config)
+# Importing the package leaves logging to the application; records are dropped unless it configures logging.
+logging.getLogger(__package__).addHandler(logging.NullHandler())
 
 
 def getLogger(name):  # noqa
@@ -31,20 +28,57 @@ def getLogger(name):  # noqa
 
 get_logger = getLogger
 
+
+def configure_logging(path: str | Path | None = None):
+    """Apply a logging configuration file with `logging.config.dictConfig`.
+
+    This replaces the application's logging configuration, so it is never done implicitly.
+
+    Args:
+        path: YAML dictConfig file. Defaults to the configuration shipped with the package.
+    """
+    import logging.config
+
+    import yaml
+
+    with open(path or BASE_DIR / LOG_CONF_FILE) as f:
+        logging.config.dictConfig(yaml.safe_load(f.read()))
+
+
 # ===========================
 # ENVIRONMENT VARIABLE UTILS
 # ===========================
 
-env = environ.Env()
 
-env_file = BASE_DIR / Path(ENV_FILE)
-env.read_env(env_file=env_file)
+@functools.cache
+def get_env():
+    """Get the environment, reading the .env file on first use."""
+    import environ
+
+    env = environ.Env()
+    env.read_env(env_file=BASE_DIR / Path(ENV_FILE))
+    return env
+
 
 # ============================
 # GLOBAL ENVIRONMENT VARIABLES
 # ============================
 
-# ENV_VAR = env("ENV_VAR")
+# Read from the environment on first access (PEP 562), not at import time.
+# ENV_VAR = get_env()("ENV_VAR")
+ENV_SETTINGS = {
+    # Size of the thread pool running WebDriver calls for AsyncBrowserJQuery
+    "ASYNC_MAX_WORKERS": lambda env: env.int("BROWSERJQUERY_ASYNC_MAX_WORKERS", default=8),
+}
+
+
+def __getattr__(name):
+    if name == "env":
+        return get_env()
+    if name in ENV_SETTINGS:
+        return ENV_SETTINGS[name](get_env())
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # ============================
 # JQUERY INJECTION FILE
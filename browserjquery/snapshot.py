@@ -0,0 +1,1108 @@
+import json
+import re
+import time
+from collections.abc import Callable, Iterator
+from functools import lru_cache
+from html.parser import HTMLParser
+from typing import Any, Union
+
+from selenium.common.exceptions import StaleElementReferenceException
+
+from browserjquery import settings
+from browserjquery.jquery import (
+    TEXT_SEARCH_MODES,
+    BrowserJQuery,
+    BrowserJQueryCollection,
+    first_or_none,
+    parse_extract_fields,
+)
+
+logger = settings.getLogger(__name__)
+
+VOID_ELEMENTS = frozenset("area base br col embed hr img input link meta param source track wbr".split())
+RAW_TEXT_ELEMENTS = frozenset(("script", "style", "xmp", "iframe", "noembed", "noframes", "noscript"))
+
+# Tag of the node holding the contents of a <template>.
+TEMPLATE_CONTENT = "#document-fragment"
+
+# Attributes for which jQuery's attr() returns the attribute name when present.
+BOOLEAN_ATTRIBUTES = frozenset(
+    "checked selected async autofocus autoplay controls defer disabled hidden ismap loop multiple open readonly "
+    "required scoped".split()
+)
+FORM_ELEMENTS = frozenset(("button", "input", "select", "textarea", "option", "optgroup", "fieldset"))
+
+# Pseudo-classes that need layout or interaction state, which a serialized DOM does not carry.
+LIVE_ONLY_PSEUDOS = frozenset(("visible", "hidden", "hover", "focus", "active", "animated", "focus-within"))
+
+# jQuery positional filters: applied to the whole match set, not to single elements.
+POSITIONAL_PSEUDOS = frozenset(("first", "last", "eq", "gt", "lt", "even", "odd"))
+
+
+class SnapshotNode:
+    """An element of a parsed page snapshot."""
+
+    __slots__ = (
+        "tag",
+        "attrs",
+        "parent",
+        "contents",
+        "children",
+        "position",
+        "index",
+        "end",
+        "depth",
+        "text_cache",
+        "content",
+    )
+
+    def __init__(self, tag: str, attrs: dict[str, str], parent: Union["SnapshotNode", None]):
+        """Initialize an element and append it to its parent.
+
+        Args:
+            tag: Lower-case tag name, "#document" for the document node.
+            attrs: Attributes of the element.
+            parent: The parent node, None for the document node.
+        """
+        self.tag = tag
+        self.attrs = attrs
+        self.parent = parent
+        self.contents: list[SnapshotNode | str] = []
+        self.children: list[SnapshotNode] = []
+        self.position = 0  # Index among the parent's element children
+        self.index = 0  # Position in document order
+        self.end = 0  # Document order index after the last descendant
+        self.depth = -1 if parent is None else parent.depth + 1
+        self.text_cache: str | None = None
+        # Contents of a <template>, kept out of the tree like the DOM's template content fragment
+        self.content: SnapshotNode | None = None
+        if parent is not None:
+            self.position = len(parent.children)
+            parent.children.append(self)
+            parent.contents.append(self)
+
+    @property
+    def is_element(self) -> bool:
+        """Whether the node is an element, as opposed to the document node."""
+        return self.depth >= 0
+
+    def __repr__(self) -> str:
+        return f"<SnapshotNode {self.tag} #{self.index}>"
+
+
+class SnapshotTreeBuilder(HTMLParser):
+    """Builds a SnapshotNode tree from serialized HTML.
+
+    The input is HTML serialized by the browser, so it is well-formed apart from void elements and
+    needs none of the error recovery of a full HTML5 parser. As in the DOM, the content of raw text
+    elements (`script`, `noscript`...) is a single text node and template contents are not part of
+    the tree.
+    """
+
+    # Elements whose content is kept as text up to their end tag, see HTMLParser.set_cdata_mode().
+    CDATA_CONTENT_ELEMENTS = tuple(sorted(RAW_TEXT_ELEMENTS))
+
+    def __init__(self):
+        """Initialize a builder with an empty document."""
+        super().__init__(convert_charrefs=True)
+        self.document = SnapshotNode("#document", {}, None)
+        self.stack = [self.document]
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]):
+        node = SnapshotNode(tag, {name: "" if value is None else value for name, value in attrs}, self.stack[-1])
+        if tag == "template":
+            node.content = SnapshotNode(TEMPLATE_CONTENT, {}, None)
+            self.stack.append(node.content)
+        elif tag not in VOID_ELEMENTS:
+            self.stack.append(node)
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]):
+        SnapshotNode(tag, {name: "" if value is None else value for name, value in attrs}, self.stack[-1])
+
+    def handle_endtag(self, tag: str):
+        for position in range(len(self.stack) - 1, 0, -1):
+            if self.stack[position].tag == tag or (tag == "template" and self.stack[position].tag == TEMPLATE_CONTENT):
+                del self.stack[position:]
+                return
+
+    def handle_data(self, data: str):
+        contents = self.stack[-1].contents
+        if contents and isinstance(contents[-1], str):
+            contents[-1] += data
+        else:
+            contents.append(data)
+
+
+class SnapshotDocument:
+    """A page parsed into SnapshotNodes, with the indexes queries run on."""
+
+    def __init__(self, page_html: str, browser: Union["BrowserJQuery", None] = None):
+        """Parse a page.
+
+        Args:
+            page_html: The serialized page.
+            browser: The live browser the page was captured from, used to map nodes back to live elements.
+        """
+        start = time.perf_counter()
+        builder = SnapshotTreeBuilder()
+        builder.feed(page_html)
+        builder.close()
+
+        self.html = page_html
+        self.browser = browser
+        self.document = builder.document
+        self.elements = self._number(self.document)
+        self.root = next((node for node in self.document.children if node.tag == "html"), self.document)
+        self.ids: dict[str, SnapshotNode] = {}
+        for node in reversed(self.elements):
+            if "id" in node.attrs:
+                self.ids[node.attrs["id"]] = node
+        elapsed = (time.perf_counter() - start) * 1000
+        logger.debug("Parsed snapshot of %d elements in %.1f ms", len(self.elements), elapsed)
+
+    @staticmethod
+    def _number(document: SnapshotNode) -> list[SnapshotNode]:
+        """Assign document order indexes and subtree ends to every node."""
+        elements: list[SnapshotNode] = []
+        stack = [document]
+        while stack:
+            node = stack.pop()
+            node.index = len(elements)
+            elements.append(node)
+            stack.extend(reversed(node.children))
+        for node in reversed(elements):
+            node.end = node.children[-1].end if node.children else node.index + 1
+        return elements
+
+    def descendants(self, node: SnapshotNode) -> list[SnapshotNode]:
+        """Get the descendants of a node in document order."""
+        return self.elements[node.index + 1 : node.end]
+
+    def path(self, node: SnapshotNode) -> list[int]:
+        """Get the element child indexes leading from the document element to a node."""
+        path = []
+        while node.depth > 0:
+            path.append(node.position)
+            node = node.parent
+        return path[::-1]
+
+
+# Selector engine
+# A selector list compiles to Complex selectors, matched right to left. Each compound selector is a tuple
+# of predicates; the combinator stored with a compound relates it to the compound on its left (for the
+# first compound, to the scope element queries run on).
+class ComplexSelector:
+    """A sequence of compound selectors joined by combinators."""
+
+    def __init__(self, compounds: list[tuple[Callable[[SnapshotNode], bool], ...]], combinators: list[str]):
+        """Initialize a complex selector.
+
+        Args:
+            compounds: Predicates of each compound selector, left to right.
+            combinators: Combinator before each compound; the first one relates to the scope element.
+        """
+        self.compounds = compounds
+        self.combinators = combinators
+        self.positional: list[tuple[str, int]] = []
+
+    def match(self, node: SnapshotNode, scope: SnapshotNode | None, index: int | None = None) -> bool:
+        """Check whether a node matches the selector up to the compound at `index`."""
+        index = len(self.compounds) - 1 if index is None else index
+        if not all(test(node) for test in self.compounds[index]):
+            return False
+
+        combinator = self.combinators[index]
+        if index == 0:
+            return scope is None or related(node, scope, combinator)
+        return any(self.match(candidate, scope, index - 1) for candidate in relatives(node, combinator))
+
+    def filter(self, nodes: list[SnapshotNode], scope: SnapshotNode | None) -> list[SnapshotNode]:
+        """Get the nodes matching the selector, with positional filters applied to the match set."""
+        matched = [node for node in nodes if self.match(node, scope)]
+        for name, argument in self.positional:
+            matched = apply_positional(matched, name, argument)
+        return matched
+
+
+class SelectorList:
+    """A compiled, comma separated selector list."""
+
+    def __init__(self, selectors: list[ComplexSelector]):
+        """Initialize a selector list.
+
+        Args:
+            selectors: The complex selectors of the list.
+        """
+        self.selectors = selectors
+
+    def filter(self, nodes: list[SnapshotNode], scope: SnapshotNode | None = None) -> list[SnapshotNode]:
+        """Get the nodes matching any of the selectors, in document order."""
+        if len(self.selectors) == 1:
+            return self.selectors[0].filter(nodes, scope)
+        matched = {node.index: node for selector in self.selectors for node in selector.filter(nodes, scope)}
+        return [matched[index] for index in sorted(matched)]
+
+    def matches(self, node: SnapshotNode) -> bool:
+        """Check whether a single node matches the selector list."""
+        return bool(self.filter([node]))
+
+    @property
+    def leading_combinator(self) -> str:
+        """The combinator relating the first compound to the scope, when it is the same for all selectors."""
+        combinators = {selector.combinators[0] for selector in self.selectors}
+        return combinators.pop() if len(combinators) == 1 else " "
+
+
+def related(node: SnapshotNode, scope: SnapshotNode, combinator: str) -> bool:
+    """Check whether a node stands in the combinator's relation to the scope element."""
+    if combinator == " ":
+        return scope.index < node.index < scope.end
+    if combinator == ">":
+        return node.parent is scope
+    if node.parent is not scope.parent or scope.parent is None:
+        return False
+    if combinator == "+":
+        return node.position == scope.position + 1
+    return node.position > scope.position
+
+
+def relatives(node: SnapshotNode, combinator: str) -> Iterator[SnapshotNode]:
+    """Get the elements that can match the compound on the left of a combinator."""
+    parent = node.parent
+    if combinator == " ":
+        while parent is not None and parent.is_element:
+            yield parent
+            parent = parent.parent
+    elif combinator == ">":
+        if parent is not None and parent.is_element:
+            yield parent
+    elif parent is not None and node.position:
+        if combinator == "+":
+            yield parent.children[node.position - 1]
+        else:
+            yield from reversed(parent.children[: node.position])
+
+
+def apply_positional(nodes: list[SnapshotNode], name: str, argument: int) -> list[SnapshotNode]:
+    """Apply a jQuery positional filter (`:first`, `:eq(2)`...) to a match set."""
+    if name == "first":
+        return nodes[:1]
+    if name == "last":
+        return nodes[-1:]
+    if name == "even":
+        return nodes[::2]
+    if name == "odd":
+        return nodes[1::2]
+    if name == "eq":
+        return nodes[argument : argument + 1] if argument != -1 else nodes[-1:]
+    if name == "gt":
+        return nodes[argument + 1 :] if argument >= 0 else nodes[len(nodes) + argument + 1 :]
+    return nodes[:argument] if argument >= 0 else nodes[: len(nodes) + argument]
+
+
+NTH_EXPRESSION = re.compile(r"^([+-]?\d*)n\s*(?:([+-])\s*(\d+))?$")
+
+
+def parse_nth(expression: str) -> tuple[int, int]:
+    """Parse an `an+b` expression of :nth-child() and friends into (a, b)."""
+    expression = expression.strip().lower()
+    if expression == "odd":
+        return 2, 1
+    if expression == "even":
+        return 2, 0
+    if re.fullmatch(r"[+-]?\d+", expression):
+        return 0, int(expression)
+    match = NTH_EXPRESSION.match(expression)
+    if not match:
+        raise ValueError(f"Invalid nth expression '{expression}'")
+    step, sign, offset = match.groups()
+    step = int(step) if step not in ("", "+", "-") else (-1 if step == "-" else 1)
+    offset = int(offset or 0) * (-1 if sign == "-" else 1)
+    return step, offset
+
+
+def nth_matcher(step: int, offset: int) -> Callable[[int], bool]:
+    """Get a predicate checking 1-based positions against an `an+b` expression."""
+    if step == 0:
+        return lambda position: position == offset
+    return lambda position: (position - offset) % step == 0 and (position - offset) // step >= 0
+
+
+def of_type(node: SnapshotNode) -> list[SnapshotNode]:
+    """Get the siblings of a node sharing its tag name, including the node."""
+    return [sibling for sibling in node.parent.children if sibling.tag == node.tag]
+
+
+class SelectorParser:
+    """Recursive descent parser turning a selector string into a SelectorList."""
+
+    IDENTIFIER = re.compile(r"(?:\\.|[\w\-\u00a0-\uffff])+")
+    ATTRIBUTE = re.compile(
+        r"\[\s*((?:\\.|[\w\-:\u00a0-\uffff])+)\s*(?:([~|^$*!]?=)\s*(?:\"((?:\\.|[^\"\\])*)\"|'((?:\\.|[^'\\])*)'|"
+        r"((?:\\.|[^\]\s])+))\s*([iIsS])?\s*)?\]"
+    )
+
+    def __init__(self, selector: str):
+        """Initialize a parser.
+
+        Args:
+            selector: The selector to parse.
+        """
+        self.selector = selector
+        self.pos = 0
+
+    def error(self, message: str) -> ValueError:
+        return ValueError(f"{message} at position {self.pos} in selector '{self.selector}'")
+
+    def skip_whitespace(self) -> bool:
+        start = self.pos
+        while self.pos < len(self.selector) and self.selector[self.pos].isspace():
+            self.pos += 1
+        return self.pos > start
+
+    def parse(self) -> SelectorList:
+        """Parse the whole selector as a selector list."""
+        selectors = self.parse_list()
+        if self.pos < len(self.selector):
+            raise self.error("Unexpected character")
+        return selectors
+
+    def parse_list(self) -> SelectorList:
+        selectors = [self.parse_complex()]
+        self.skip_whitespace()
+        while self.pos < len(self.selector) and self.selector[self.pos] == ",":
+            self.pos += 1
+            selectors.append(self.parse_complex())
+            self.skip_whitespace()
+        return SelectorList(selectors)
+
+    def parse_combinator(self) -> str | None:
+        had_whitespace = self.skip_whitespace()
+        if self.pos < len(self.selector) and self.selector[self.pos] in ">+~":
+            combinator = self.selector[self.pos]
+            self.pos += 1
+            self.skip_whitespace()
+            return combinator
+        return " " if had_whitespace else None
+
+    def parse_complex(self) -> ComplexSelector:
+        combinator = self.parse_combinator() or " "
+        compounds, combinators, positional = [], [], []
+        while True:
+            if positional:
+                raise self.error("Positional filters are only supported in the last compound selector")
+            tests, positional = self.parse_compound()
+            compounds.append(tests)
+            combinators.append(combinator)
+            start = self.pos
+            combinator = self.parse_combinator()
+            if combinator is None or self.pos >= len(self.selector) or self.selector[self.pos] in ",)":
+                self.pos = start
+                break
+
+        selector = ComplexSelector(compounds, combinators)
+        selector.positional = positional
+        return selector
+
+    def parse_compound(self) -> tuple[tuple[Callable[[SnapshotNode], bool], ...], list[tuple[str, int]]]:
+        tests: list[Callable[[SnapshotNode], bool]] = []
+        positional: list[tuple[str, int]] = []
+        start = self.pos
+
+        if self.selector.startswith("*", self.pos):
+            self.pos += 1
+        else:
+            match = self.IDENTIFIER.match(self.selector, self.pos)
+            if match:
+                tag = unescape(match.group()).lower()
+                tests.append(lambda node: node.tag == tag)
+                self.pos = match.end()
+
+        while self.pos < len(self.selector):
+            char = self.selector[self.pos]
+            if char in "#.":
+                match = self.IDENTIFIER.match(self.selector, self.pos + 1)
+                if not match:
+                    raise self.error(f"Expected a name after '{char}'")
+                name = unescape(match.group())
+                self.pos = match.end()
+                if char == "#":
+                    tests.append(lambda node: node.attrs.get("id") == name)
+                else:
+                    tests.append(lambda node: name in node.attrs.get("class", "").split())
+            elif char == "[":
+                tests.append(self.parse_attribute())
+            elif char == ":":
+                test = self.parse_pseudo(positional)
+                if test is not None:
+                    tests.append(test)
+            else:
+                break
+
+        if self.pos == start:
+            raise self.error("Expected a selector")
+        return tuple(tests), positional
+
+    def parse_attribute(self) -> Callable[[SnapshotNode], bool]:
+        match = self.ATTRIBUTE.match(self.selector, self.pos)
+        if not match:
+            raise self.error("Invalid attribute selector")
+        self.pos = match.end()
+        name, operator, double_quoted, single_quoted, bare, case = match.groups()
+        name = unescape(name).lower()
+        if operator is None:
+            return lambda node: name in node.attrs
+
+        expected = unescape(next(value for value in (double_quoted, single_quoted, bare) if value is not None))
+        fold = (lambda value: value.lower()) if case in ("i", "I") else (lambda value: value)
+        expected = fold(expected)
+        compare: Callable[[str], bool] = {
+            "=": lambda value: value == expected,
+            "!=": lambda value: value != expected,
+            "~=": lambda value: expected in value.split(),
+            "|=": lambda value: value == expected or value.startswith(expected + "-"),
+            "^=": lambda value: bool(expected) and value.startswith(expected),
+            "$=": lambda value: bool(expected) and value.endswith(expected),
+            "*=": lambda value: bool(expected) and expected in value,
+        }[operator]
+
+        if operator == "!=":
+            return lambda node: name not in node.attrs or compare(fold(node.attrs[name]))
+        return lambda node: name in node.attrs and compare(fold(node.attrs[name]))
+
+    def parse_argument(self) -> str:
+        """Parse a parenthesized pseudo-class argument, keeping nested parentheses and quotes."""
+        depth, quote, start = 0, None, self.pos + 1
+        for position in range(self.pos, len(self.selector)):
+            char = self.selector[position]
+            if quote:
+                if char == quote and self.selector[position - 1] != "\\":
+                    quote = None
+            elif char in "\"'":
+                quote = char
+            elif char == "(":
+                depth += 1
+            elif char == ")":
+                depth -= 1
+                if depth == 0:
+                    self.pos = position + 1
+                    return self.selector[start:position].strip()
+        raise self.error("Unbalanced parentheses")
+
+    def parse_pseudo(self, positional: list[tuple[str, int]]) -> Callable[[SnapshotNode], bool] | None:
+        self.pos += 1
+        if self.selector.startswith(":", self.pos):
+            raise self.error("Pseudo-elements are not supported")
+        match = self.IDENTIFIER.match(self.selector, self.pos)
+        if not match:
+            raise self.error("Expected a pseudo-class name")
+        name = match.group().lower()
+        self.pos = match.end()
+        argument = self.parse_argument() if self.selector.startswith("(", self.pos) else None
+
+        if name in LIVE_ONLY_PSEUDOS:
+            raise ValueError(f"':{name}' depends on the live page and is not available in snapshots, use live()")
+        if name in POSITIONAL_PSEUDOS:
+            positional.append((name, int(argument) if argument is not None else 0))
+            return None
+        return pseudo_class(name, argument, self.error)
+
+
+def unescape(value: str) -> str:
+    """Remove CSS backslash escapes from an identifier or string."""
+    return re.sub(r"\\(.)", r"\1", value)
+
+
+def strip_quotes(value: str) -> str:
+    """Remove the quotes around a pseudo-class string argument."""
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        return unescape(value[1:-1])
+    return value
+
+
+def pseudo_class(name: str, argument: str | None, error: Callable[[str], ValueError]) -> Callable[[SnapshotNode], bool]:
+    """Get the predicate implementing a pseudo-class."""
+    if name in ("not", "is", "where", "matches", "has") and argument is None:
+        raise error(f"':{name}()' requires an argument")
+
+    if name == "not":
+        selectors = compile_selector(argument)
+        return lambda node: not selectors.matches(node)
+    if name in ("is", "where", "matches"):
+        selectors = compile_selector(argument)
+        return selectors.matches
+    if name == "has":
+        selectors = compile_selector(argument)
+        if selectors.leading_combinator in "+~":
+            return lambda node: node.parent is not None and bool(selectors.filter(following(node), node))
+        return lambda node: bool(selectors.filter(node_descendants(node), node))
+    if name == "contains":
+        text = strip_quotes(argument or "")
+        return lambda node: text in node_text(node)
+
+    if name == "first-child":
+        return lambda node: node.position == 0
+    if name == "last-child":
+        return lambda node: node.parent is not None and node.position == len(node.parent.children) - 1
+    if name == "only-child":
+        return lambda node: node.parent is not None and len(node.parent.children) == 1
+    if name in ("nth-child", "nth-last-child", "nth-of-type", "nth-last-of-type"):
+        if argument is None:
+            raise error(f"':{name}()' requires an argument")
+        matches = nth_matcher(*parse_nth(argument))
+        if name == "nth-child":
+            return lambda node: matches(node.position + 1)
+        if name == "nth-last-child":
+            return lambda node: matches(len(node.parent.children) - node.position)
+        if name == "nth-of-type":
+            return lambda node: matches(of_type(node).index(node) + 1)
+        return lambda node: matches(len(of_type(node)) - of_type(node).index(node))
+    if name == "first-of-type":
+        return lambda node: of_type(node)[0] is node
+    if name == "last-of-type":
+        return lambda node: of_type(node)[-1] is node
+    if name == "only-of-type":
+        return lambda node: len(of_type(node)) == 1
+    if name == "root":
+        return lambda node: node.depth == 0
+    if name == "empty":
+        return lambda node: not any(part for part in node.contents)
+    if name == "parent":
+        return lambda node: any(part for part in node.contents)
+
+    if name == "checked":
+        return lambda node: ("checked" in node.attrs and node.tag == "input") or (
+            "selected" in node.attrs and node.tag == "option"
+        )
+    if name == "selected":
+        return lambda node: "selected" in node.attrs and node.tag == "option"
+    if name == "disabled":
+        return lambda node: node.tag in FORM_ELEMENTS and "disabled" in node.attrs
+    if name == "enabled":
+        return lambda node: node.tag in FORM_ELEMENTS and "disabled" not in node.attrs
+    if name == "header":
+        return lambda node: node.tag in ("h1", "h2", "h3", "h4", "h5", "h6")
+    if name == "input":
+        return lambda node: node.tag in ("input", "select", "textarea", "button")
+    if name == "button":
+        return lambda node: node.tag == "button" or (node.tag == "input" and input_type(node) == "button")
+    if name in ("text", "checkbox", "radio", "file", "password", "image", "submit", "reset"):
+        return lambda node: node.tag == "input" and input_type(node) == name
+
+    raise error(f"Unsupported pseudo-class ':{name}'")
+
+
+def input_type(node: SnapshotNode) -> str:
+    """Get the type of an input element, defaulting to text."""
+    return node.attrs.get("type", "text").lower()
+
+
+def node_descendants(node: SnapshotNode) -> list[SnapshotNode]:
+    """Get the descendants of a node in document order, without access to its document."""
+    result, stack = [], list(reversed(node.children))
+    while stack:
+        current = stack.pop()
+        result.append(current)
+        stack.extend(reversed(current.children))
+    return result
+
+
+def following(node: SnapshotNode) -> list[SnapshotNode]:
+    """Get the following siblings of a node and their descendants, in document order."""
+    result = []
+    for sibling in node.parent.children[node.position + 1 :]:
+        result.append(sibling)
+        result.extend(node_descendants(sibling))
+    return result
+
+
+def node_text(node: SnapshotNode) -> str:
+    """Get the text content of a node, computing the texts of its whole subtree bottom-up once."""
+    if node.text_cache is None:
+        for current in reversed([node] + node_descendants(node)):
+            if current.text_cache is None:
+                current.text_cache = "".join(
+                    part if isinstance(part, str) else part.text_cache for part in current.contents
+                )
+    return node.text_cache
+
+
+@lru_cache(maxsize=512)
+def compile_selector(selector: str) -> SelectorList:
+    """Compile a CSS/jQuery selector for snapshot queries.
+
+    Supports type, id, class and attribute selectors (including jQuery's `!=`), all combinators, the
+    structural and form pseudo-classes, `:not()`, `:is()`, `:has()`, `:contains()` and jQuery's
+    positional filters. Pseudo-classes depending on layout, such as `:visible`, are not available.
+
+    Raises:
+        ValueError: If the selector is invalid or not supported in snapshots.
+    """
+    return SelectorParser(selector).parse()
+
+
+SIMPLE_ID_SELECTOR = re.compile(r"^#([\w\-]+)$")
+
+
+def read_data(node: SnapshotNode, key: str) -> Any:
+    """Read a data-* attribute with jQuery's data() conversions."""
+    name = "data-" + re.sub(r"[A-Z]", lambda match: "-" + match.group().lower(), key)
+    value = node.attrs.get(name)
+    if value is None:
+        return None
+    if value in ("true", "false"):
+        return value == "true"
+    if value == "null":
+        return None
+    try:
+        number = float(value)
+    except ValueError:
+        number = None
+    if number is not None and re.fullmatch(r"-?\d+(\.\d+)?", value):
+        return int(value) if number.is_integer() and "." not in value else number
+    if re.fullmatch(r"\{[\s\S]*\}|\[[\s\S]*\]", value):
+        try:
+            return json.loads(value)
+        except ValueError:
+            pass
+    return value
+
+
+def template_contents(node: SnapshotNode) -> list[Union[SnapshotNode, str]]:
+    """Get the contents of a node, or of its template content for a <template>, which the browser serializes."""
+    return node.content.contents if node.content is not None else node.contents
+
+
+def serialize(part: Union[SnapshotNode, str], parent_tag: str) -> str:
+    """Serialize a node or text the way the browser's innerHTML does."""
+    if isinstance(part, str):
+        if parent_tag in RAW_TEXT_ELEMENTS:
+            return part
+        return part.replace("&", "&amp;").replace("\xa0", "&nbsp;").replace("<", "&lt;").replace(">", "&gt;")
+
+    attrs = "".join(
+        f' {name}="{value.replace("&", "&amp;").replace(chr(0xa0), "&nbsp;").replace(chr(34), "&quot;")}"'
+        for name, value in part.attrs.items()
+    )
+    if part.tag in VOID_ELEMENTS:
+        return f"<{part.tag}{attrs}>"
+    inner = "".join(serialize(child, part.tag) for child in template_contents(part))
+    return f"<{part.tag}{attrs}>{inner}</{part.tag}>"
+
+
+class SnapshotCollection:
+    """A collection of snapshot elements, mirroring BrowserJQueryCollection."""
+
+    def __init__(self, snapshot: SnapshotDocument, elements: list[SnapshotNode]):
+        """Initialize a collection.
+
+        Args:
+            snapshot: The document the elements belong to.
+            elements: The elements of the collection.
+        """
+        self.snapshot = snapshot
+        self.elements = elements
+
+    def __len__(self) -> int:
+        """Get the number of elements in the collection."""
+        return len(self.elements)
+
+    def __iter__(self) -> Iterator["BrowserSnapshot"]:
+        """Iterate over the elements in the collection."""
+        return (self._wrap(element) for element in self.elements)
+
+    def __getitem__(self, index: int) -> "BrowserSnapshot":
+        """Get an element by index."""
+        return self._wrap(self.elements[index])
+
+    def first(self) -> Union["BrowserSnapshot", None]:
+        """Get the first element in the collection, or None if empty."""
+        return self._wrap(self.elements[0]) if self.elements else None
+
+    def last(self) -> Union["BrowserSnapshot", None]:
+        """Get the last element in the collection, or None if empty."""
+        return self._wrap(self.elements[-1]) if self.elements else None
+
+    def items(self) -> list["BrowserSnapshot"]:
+        """Get all elements in the collection."""
+        return [self._wrap(element) for element in self.elements]
+
+    def extract(
+        self, fields: dict[str, str], *, columns: bool = False
+    ) -> list[dict[str, Any]] | dict[str, list[Any]]:
+        """Extract several fields from every element, see `BrowserJQueryCollection.extract`."""
+        parsed = parse_extract_fields(fields)
+        records = [element.extract_fields(parsed) for element in self]
+        if columns:
+            return {name: [record[name] for record in records] for name in fields}
+        return records
+
+    def live(self) -> "BrowserJQueryCollection":
+        """Map the elements back to the live page in a single round-trip.
+
+        Raises:
+            StaleElementReferenceException: If an element no longer exists in the page.
+        """
+        browser = self.snapshot.browser
+        if browser is None:
+            raise ValueError("Snapshot was not captured from a browser")
+        return resolve_paths(self.snapshot, self.elements)
+
+    def _wrap(self, element: SnapshotNode) -> "BrowserSnapshot":
+        return BrowserSnapshot(self.snapshot, element)
+
+
+def resolve_paths(snapshot: SnapshotDocument, elements: list[SnapshotNode]) -> "BrowserJQueryCollection":
+    """Find the live elements at the positions of snapshot elements.
+
+    The live elements keep their paths as recipes, to be relocated if they become stale.
+    """
+    browser = snapshot.browser
+    args = ([snapshot.path(element) for element in elements], [element.tag for element in elements])
+    found = browser.call("elementsAtPaths", *args) if elements else []
+    if any(element is None for element in found):
+        raise StaleElementReferenceException("Snapshot element no longer exists in the page")
+    # Paths are resolved from the document element whatever the browser's default element is.
+    return BrowserJQueryCollection(browser.driver, found, session=browser.session, origin=((), "elementsAtPaths", args))
+
+
+class BrowserSnapshot:
+    """The BrowserJQuery API evaluated locally on a captured page.
+
+    A snapshot is taken with `BrowserJQuery.snapshot()`, which transfers the page HTML once; every
+    query on it is then answered in Python without a WebDriver round-trip. Snapshots do not follow
+    later changes of the page, and carry attributes but not layout or interaction state: properties
+    changed by the user (e.g. a ticked checkbox) and visibility are only available on the live page,
+    through `live()`.
+    """
+
+    def __init__(self, snapshot: SnapshotDocument, default_element: SnapshotNode | None = None):
+        """Initialize a snapshot wrapper.
+
+        Args:
+            snapshot: The parsed page.
+            default_element: The element queries run on. Defaults to the document element.
+        """
+        self.snapshot = snapshot
+        self.default_element = default_element or snapshot.root
+
+    @classmethod
+    def from_html(cls, page_html: str, browser: Union["BrowserJQuery", None] = None) -> "BrowserSnapshot":
+        """Parse serialized HTML into a snapshot.
+
+        Args:
+            page_html: The HTML to parse.
+            browser: The live browser the HTML was captured from, needed by `live()`.
+
+        Returns:
+            A BrowserSnapshot rooted at the document element.
+        """
+        return cls(SnapshotDocument(page_html, browser))
+
+    def __call__(self, selector: str) -> SnapshotCollection:
+        """Equivalent to find()."""
+        return self.find(selector)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, BrowserSnapshot) and other.default_element is self.default_element
+
+    def __hash__(self) -> int:
+        return hash(id(self.default_element))
+
+    def __repr__(self) -> str:
+        return f"<BrowserSnapshot {self.tag_name}>"
+
+    def _wrap(self, element: SnapshotNode | None) -> Union["BrowserSnapshot", None]:
+        return None if element is None else BrowserSnapshot(self.snapshot, element)
+
+    def _wrap_all(self, elements: list[SnapshotNode]) -> list["BrowserSnapshot"]:
+        return [BrowserSnapshot(self.snapshot, element) for element in elements]
+
+    def _filter(self, elements: list[SnapshotNode], selector: str | None) -> list[SnapshotNode]:
+        return elements if selector is None else compile_selector(selector).filter(elements)
+
+    def live(self) -> "BrowserJQuery":
+        """Map the element back to the live page, at the cost of a single round-trip.
+
+        The element is found by its position in the document, so the page must not have changed
+        structurally since the snapshot was taken.
+
+        Returns:
+            A BrowserJQuery wrapping the live element.
+
+        Raises:
+            StaleElementReferenceException: If the element no longer exists in the page.
+        """
+        browser = self.snapshot.browser
+        if browser is None:
+            raise ValueError("Snapshot was not captured from a browser")
+        return resolve_paths(self.snapshot, [self.default_element])[0]
+
+    # WebElement-like accessors
+    @property
+    def tag_name(self) -> str:
+        """Get the lower-case tag name of the element."""
+        return self.default_element.tag
+
+    def get_attribute(self, name: str) -> str | None:
+        """Get an attribute of the element, or None if it is not set."""
+        return self.default_element.attrs.get(name.lower())
+
+    @property
+    def page_html(self) -> str:
+        """Get the HTML the snapshot was parsed from."""
+        return self.snapshot.html
+
+    # Element finding methods
+    def find(self, selector: str) -> SnapshotCollection:
+        """Find elements using a CSS/jQuery selector.
+
+        Args:
+            selector: Selector to find elements, see `compile_selector` for the supported syntax.
+
+        Returns:
+            A SnapshotCollection of matching elements.
+        """
+        match = SIMPLE_ID_SELECTOR.match(selector)
+        if match:
+            element = self.snapshot.ids.get(match.group(1))
+            root = self.default_element
+            found = element is not None and root.index < element.index < root.end
+            return SnapshotCollection(self.snapshot, [element] if found else [])
+
+        selectors = compile_selector(selector)
+        elements = selectors.filter(self.snapshot.descendants(self.default_element), self.default_element)
+        if selector.startswith("#"):
+            elements = elements[:1]
+        return SnapshotCollection(self.snapshot, elements)
+
+    def extract(
+        self, selector: str, fields: dict[str, str], *, columns: bool = False
+    ) -> list[dict[str, Any]] | dict[str, list[Any]]:
+        """Find elements and extract several fields from each of them, see `BrowserJQuery.extract`."""
+        return self.find(selector).extract(fields, columns=columns)
+
+    def find_closest_ancestor(self, selector: str) -> Union["BrowserSnapshot", None]:
+        """Find the closest element matching the selector, starting with the element itself."""
+        selectors = compile_selector(selector)
+        element = self.default_element
+        while element is not None and element.is_element:
+            if selectors.matches(element):
+                return self._wrap(element)
+            element = element.parent
+        return None
+
+    # Element traversal methods
+    def parent(self) -> Union["BrowserSnapshot", None]:
+        """Get the parent element, or None for the document element."""
+        parent = self.default_element.parent
+        return self._wrap(parent) if parent is not None and parent.is_element else None
+
+    def parents(self) -> list["BrowserSnapshot"]:
+        """Get all ancestor elements, closest first."""
+        return self._wrap_all(list(relatives(self.default_element, " ")))
+
+    def children(self, selector: str | None = None) -> list["BrowserSnapshot"]:
+        """Get direct children of the element, optionally filtered by a selector."""
+        return self._wrap_all(self._filter(self.default_element.children, selector))
+
+    def siblings(self, selector: str | None = None) -> list["BrowserSnapshot"]:
+        """Get sibling elements, optionally filtered by a selector."""
+        parent = self.default_element.parent
+        siblings = [sibling for sibling in parent.children if sibling is not self.default_element] if parent else []
+        return self._wrap_all(self._filter(siblings, selector))
+
+    def next(self, selector: str | None = None) -> Union["BrowserSnapshot", None]:
+        """Get the next sibling element if it matches the optional selector."""
+        element, parent = self.default_element, self.default_element.parent
+        following_sibling = parent.children[element.position + 1 : element.position + 2] if parent else []
+        return self._wrap(first_or_none(self._filter(following_sibling, selector)))
+
+    def prev(self, selector: str | None = None) -> Union["BrowserSnapshot", None]:
+        """Get the previous sibling element if it matches the optional selector."""
+        element, parent = self.default_element, self.default_element.parent
+        previous = parent.children[element.position - 1 : element.position] if parent and element.position else []
+        return self._wrap(first_or_none(self._filter(previous, selector)))
+
+    def items(self) -> list["BrowserSnapshot"]:
+        """Get all child elements."""
+        return self._wrap_all(self.default_element.children)
+
+    def first(self) -> Union["BrowserSnapshot", None]:
+        """Get the first child element, or None if there are no children."""
+        return self._wrap(first_or_none(self.default_element.children))
+
+    def last(self) -> Union["BrowserSnapshot", None]:
+        """Get the last child element, or None if there are no children."""
+        children = self.default_element.children
+        return self._wrap(children[-1] if children else None)
+
+    # Element state/attribute methods
+    def has_class(self, class_name: str) -> bool:
+        """Check if the element has a specific class."""
+        return class_name in self.default_element.attrs.get("class", "").split()
+
+    def matches_selector(self, selector: str) -> bool:
+        """Check if the element matches a selector."""
+        return compile_selector(selector).matches(self.default_element)
+
+    def has(self, selector: str) -> bool:
+        """Check if the element has descendants matching a selector."""
+        return len(self.find(selector)) > 0
+
+    def attr(self, attribute_name: str) -> str | None:
+        """Get an attribute value like jQuery's attr(), or None if it is not set."""
+        name = attribute_name.lower()
+        value = self.default_element.attrs.get(name)
+        if value is not None and name in BOOLEAN_ATTRIBUTES:
+            return name
+        return value
+
+    def text(self) -> str:
+        """Get the text content of the element."""
+        return node_text(self.default_element)
+
+    def html(self) -> str:
+        """Get the inner HTML of the element."""
+        element = self.default_element
+        return "".join(serialize(part, element.tag) for part in template_contents(element))
+
+    def is_checked(self) -> bool:
+        """Check if the checkbox/radio was checked in the markup when the snapshot was taken."""
+        return compile_selector(":checked").matches(self.default_element)
+
+    def is_disabled(self) -> bool:
+        """Check if the element is disabled."""
+        return compile_selector(":disabled").matches(self.default_element)
+
+    def val(self) -> Any:
+        """Get the value of a form element like jQuery's val(), from the markup."""
+        element = self.default_element
+        if element.tag == "textarea":
+            return self.text()
+        if element.tag == "select":
+            options = compile_selector("option").filter(self.snapshot.descendants(element))
+            selected = [option for option in options if "selected" in option.attrs]
+            values = [option.attrs.get("value", node_text(option).strip()) for option in selected]
+            if "multiple" in element.attrs:
+                return values
+            if values:
+                return values[-1]
+            return options[0].attrs.get("value", node_text(options[0]).strip()) if options else None
+        if element.tag == "option":
+            return element.attrs.get("value", self.text().strip())
+        if element.tag == "input" and input_type(element) in ("checkbox", "radio"):
+            return element.attrs.get("value", "on")
+        return element.attrs.get("value", "" if element.tag in ("input", "button") else None)
+
+    def prop(self, name: str) -> Any:
+        """Get a property of the element, derived from its markup."""
+        if name in BOOLEAN_ATTRIBUTES:
+            return name in self.default_element.attrs
+        if name in ("tagName", "nodeName"):
+            return self.default_element.tag.upper()
+        if name == "className":
+            return self.default_element.attrs.get("class", "")
+        if name == "value":
+            return self.val()
+        return self.default_element.attrs.get(name.lower())
+
+    def data(self, key: str) -> Any:
+        """Get a data-* attribute with jQuery's type conversions."""
+        return read_data(self.default_element, key)
+
+    def extract_fields(self, fields: list[list[str | None]]) -> dict[str, Any]:
+        """Extract parsed fields (see `parse_extract_fields`) from the element."""
+        record = {}
+        for name, selector, operation, argument in fields:
+            target = self if selector is None else self.find(selector).first()
+            if target is None:
+                record[name] = None
+            elif operation in ("text", "html", "val"):
+                record[name] = getattr(target, operation)()
+            elif operation == "is":
+                record[name] = target.matches_selector(argument)
+            else:
+                record[name] = getattr(target, operation)(argument)
+        return record
+
+    # Text-based search methods
+    def _search_text(
+        self, text: str | re.Pattern, selector: str, *, mode: str, order: str, limit: int | None
+    ) -> list[SnapshotNode]:
+        """Search elements by text with the semantics of `BrowserJQuery._search_text`."""
+        if isinstance(text, re.Pattern):
+            mode = "regex"
+        if mode not in TEXT_SEARCH_MODES:
+            raise ValueError(f"Unknown text search mode '{mode}', expected one of {TEXT_SEARCH_MODES}")
+
+        if selector == "*":
+            candidates = self.snapshot.descendants(self.default_element)
+        else:
+            candidates = self.find(selector).elements
+        matches = self._text_matcher(text, mode)
+
+        if order == "document":
+            results = []
+            for candidate in candidates:
+                if matches(candidate):
+                    results.append(candidate)
+                    if limit is not None and len(results) >= limit:
+                        break
+            return results
+
+        results = sorted((node for node in candidates if matches(node)), key=lambda node: (-node.depth, node.index))
+        return results if limit is None else results[:limit]
+
+    def _text_matcher(self, text: str | re.Pattern, mode: str) -> Callable[[SnapshotNode], bool]:
+        element_text = node_text
+        if mode == "regex":
+            pattern = text if isinstance(text, re.Pattern) else re.compile(text)
+            return lambda node: pattern.search(element_text(node)) is not None
+        if mode == "exact":
+            return lambda node: element_text(node).strip() == text
+        if mode == "casefold":
+            needle = text.lower()
+            return lambda node: needle in element_text(node).lower()
+        if mode == "normalized":
+            needle = re.sub(r"\s+", " ", text).strip()
+            return lambda node: needle in re.sub(r"\s+", " ", element_text(node))
+        return lambda node: text in element_text(node)
+
+    def find_elements_with_text(
+        self, text: str | re.Pattern, selector: str = "*", *, mode: str = "contains", limit: int | None = None
+    ) -> SnapshotCollection:
+        """Find elements containing specific text, see `BrowserJQuery.find_elements_with_text`."""
+        return SnapshotCollection(
+            self.snapshot, self._search_text(text, selector, mode=mode, order="document", limit=limit)
+        )
+
+    def find_deepest_elements_with_text(
+        self, text: str | re.Pattern, selector: str = "*", *, mode: str = "contains", limit: int | None = None
+    ) -> SnapshotCollection:
+        """Find elements containing specific text, deepest in the DOM tree first."""
+        return SnapshotCollection(
+            self.snapshot, self._search_text(text, selector, mode=mode, order="deepest", limit=limit)
+        )
+
+    def find_lowest_element_with_text(
+        self, text: str | re.Pattern, selector: str = "*", *, exact_match: bool = False, mode: str = "contains"
+    ) -> Union["BrowserSnapshot", None]:
+        """Find the lowest element in the DOM tree containing specific text."""
+        mode = "exact" if exact_match else mode
+        return self._wrap(first_or_none(self._search_text(text, selector, mode=mode, order="deepest", limit=1)))
+
+    def find_elements_with_selector_and_text(
+        self,
+        selector: str,
+        text: str | re.Pattern,
+        *,
+        exact_match: bool = False,
+        mode: str = "contains",
+        limit: int | None = None,
+    ) -> SnapshotCollection:
+        """Find elements matching both selector and text criteria."""
+        mode = "exact" if exact_match else mode
+        return SnapshotCollection(
+            self.snapshot, self._search_text(text, selector, mode=mode, order="document", limit=limit)
+        )
@@ -19,7 +19,7 @@ def driver():
     """Create a Chrome WebDriver instance."""
     logger.debug("Setting up Chrome WebDriver")
     options = Options()
-    # options.add_argument("--headless")  # Run in headless mode
+    options.add_argument("--headless=new")
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
 
@@ -58,3 +58,20 @@ def browser(driver, test_page_path):
     browser = BrowserJQuery(driver)
 
     return browser
+
+
+@pytest.fixture
+def round_trips(browser, monkeypatch):
+    """Record every script sent to the browser through `execute_script` and `execute_async_script`."""
+    calls = []
+
+    def counting(execute):
+        def counting_execute(script, *args):
+            calls.append(script)
+            return execute(script, *args)
+
+        return counting_execute
+
+    monkeypatch.setattr(browser.driver, "execute_script", counting(browser.driver.execute_script))
+    monkeypatch.setattr(browser.driver, "execute_async_script", counting(browser.driver.execute_async_script))
+    return calls
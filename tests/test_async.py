@@ -0,0 +1,41 @@
+import asyncio
+
+from browserjquery.async_jquery import AsyncBrowserJQuery, AsyncBrowserJQueryCollection
+
+
+def test_async_find_and_iterate(browser):
+    async def collect():
+        async_browser = AsyncBrowserJQuery(browser)
+        links = await async_browser.find("a.nav-link")
+        assert isinstance(links, AsyncBrowserJQueryCollection)
+        return [await link.text() async for link in links]
+
+    assert asyncio.run(collect()) == ["Sign in", "Home"]
+
+
+def test_async_create_and_text_search(driver, browser):
+    async def search():
+        async_browser = await AsyncBrowserJQuery.create(driver)
+        element = await async_browser.find_lowest_element_with_text("nested")
+        return await element.run(lambda: element.browser.tag_name)
+
+    assert asyncio.run(search()) == "span"
+
+
+def test_async_gather_on_one_driver(browser):
+    async def gather():
+        async_browser = AsyncBrowserJQuery(browser)
+        items = await async_browser.find("li")
+        return await asyncio.gather(*[item.text() async for item in items])
+
+    assert asyncio.run(gather()) == ["Item 1", "Item 2", "Item 3"], "Concurrent queries on a driver are serialized"
+
+
+def test_async_lazy_collection_iterates_in_chunks(browser, round_trips):
+    async def iterate():
+        items = await AsyncBrowserJQuery(browser).find("li", lazy=True, chunk_size=2)
+        texts = [await item.text() async for item in items]
+        await items.release()
+        return len(items), texts
+
+    assert asyncio.run(iterate()) == (3, ["Item 1", "Item 2", "Item 3"])
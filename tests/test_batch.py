@@ -0,0 +1,54 @@
+import pytest
+from selenium.common.exceptions import JavascriptException
+
+from browserjquery.batch import Deferred
+
+
+def test_batch_returns_deferred_results(browser):
+    element = browser.find("a").first()
+    assert element, "Should find an anchor element"
+
+    with browser.batch() as batch:
+        text = element.text()
+        href = element.attr("href")
+        assert isinstance(text, Deferred), "Queries inside a batch should be deferred"
+        assert len(batch) == 2, "Both queries should be recorded"
+
+    assert text.value == "Sign in", "Deferred text should resolve after the batch"
+    assert href.value == "#", "Deferred attribute should resolve after the batch"
+
+
+def test_batch_uses_single_round_trip(browser, round_trips):
+    element = browser.find("a").first()
+    round_trips.clear()
+
+    with browser.batch():
+        results = [element.text(), element.attr("href"), element.is_visible(), element.has_class("nav-link")]
+
+    assert len(round_trips) == 1, "Batch should be executed in a single round-trip"
+    assert [r.value for r in results] == ["Sign in", "#", True, True]
+
+
+def test_batch_wraps_element_results(browser):
+    with browser.batch():
+        links = browser.find("a.nav-link")
+
+    assert len(links.value) == 2, "Deferred find should resolve to a collection"
+    assert links.value.first().text() == "Sign in", "Collection elements should be wrapped"
+
+
+def test_batch_value_before_flush_raises(browser):
+    with browser.batch():
+        text = browser.text()
+        with pytest.raises(RuntimeError):
+            text.value
+
+
+def test_batch_reports_errors_per_query(browser):
+    with browser.batch() as batch:
+        ok = browser.text()
+        failing = batch.add("throw new Error('boom');")
+
+    assert ok.value, "Successful queries should still resolve"
+    with pytest.raises(JavascriptException):
+        failing.value
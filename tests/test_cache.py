@@ -0,0 +1,58 @@
+import pytest
+
+from browserjquery.cache import ResultCache
+
+
+@pytest.fixture
+def cache(browser):
+    cache = browser.enable_cache()
+    yield cache
+    browser.disable_cache()
+
+
+def test_repeated_reads_are_cached(browser, cache, round_trips):
+    item = browser.find("li").first()
+    round_trips.clear()
+    assert [item.text() for _ in range(3)] == ["Item 1"] * 3
+    assert item.attr("class") == item.attr("class")
+    assert len(round_trips) == 2, "Repeated reads should only reach the browser once"
+    assert cache.stats()["hits"] == 3
+
+
+def test_dom_mutation_invalidates(browser, cache):
+    item = browser.find("li").first()
+    assert item.text() == "Item 1"
+    browser.execute("document.querySelector('li').textContent = 'Changed'")
+    assert item.text() == "Changed", "Raw scripts may change the page and should invalidate the cache"
+
+    browser.driver.execute_script("document.querySelector('li').textContent = 'Item 1'")
+    browser.find("p")
+    assert item.text() == "Item 1", "A round-trip seeing a new mutation epoch should invalidate the cache"
+    assert cache.invalidations >= 2
+
+
+def test_max_age_and_stats(browser):
+    cache = browser.enable_cache(size=1, max_age=0)
+    try:
+        item = browser.find("li").first()
+        item.text()
+        item.text()
+        assert cache.stats()["hits"] == 0, "Results older than max_age should not be served"
+        assert len(cache) == 1
+    finally:
+        browser.disable_cache()
+
+
+def test_cache_size_must_be_positive():
+    with pytest.raises(ValueError):
+        ResultCache(size=0)
+
+
+def test_navigation_invalidates(browser, cache, test_page_path):
+    assert browser.chain("li").text() == ["Item 1", "Item 2", "Item 3"]
+    try:
+        browser.driver.get("data:text/html,<ul><li>Other page</li></ul>")
+        assert browser.chain("li").text() == ["Other page"], "Results of the previous document should not be served"
+    finally:
+        browser.driver.get(f"file:///{test_page_path}")
+    assert browser.chain("li").text() == ["Item 1", "Item 2", "Item 3"]
@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+from selenium.common.exceptions import JavascriptException
+
+from browserjquery.async_jquery import AsyncBrowserJQuery
+
+
+def test_chain_runs_in_one_round_trip(browser, round_trips):
+    chain = browser.chain("ul").first().children("li").not_(":first-child").next()
+    assert round_trips == [], "Building a chain does not touch the browser"
+
+    assert chain.text() == ["Item 3"]
+    assert len(round_trips) == 1
+
+
+def test_chain_terminals(browser):
+    items = browser.chain("aside").find("li")
+    assert items.count() == 3
+    assert items.eq(-1).text() == ["Item 3"]
+    assert browser.chain("nav").children("a").attr("href") == ["#", "#"]
+    assert browser.chain("footer p").filter(":visible").values("text") == ["Visible footer text"]
+    assert browser.chain(".form-group").has("button").find("button").extract({"type": "attr:type"}) == [
+        {"type": "submit"},
+        {"type": "reset"},
+    ]
+
+    elements = items.slice(1).get()
+    assert [element.text() for element in elements] == ["Item 2", "Item 3"]
+
+
+def test_chain_is_immutable(browser):
+    links = browser.chain("nav a")
+    assert links.first().text() == ["Sign in"]
+    assert links.last().text() == ["Home"]
+    assert links.count() == 2
+
+
+def test_chain_in_batch(browser, round_trips):
+    with browser.batch():
+        count = browser.chain("li").count()
+        texts = browser.chain("li").text()
+    assert len(round_trips) == 1
+    assert count.value == 3
+    assert texts.value == ["Item 1", "Item 2", "Item 3"]
+
+
+def test_chain_rejects_other_jquery_methods(browser):
+    chain = browser.chain("li")._then("remove")
+    with pytest.raises(JavascriptException, match="Unsupported chain method"):
+        chain.count()
+    assert browser.chain("li").count() == 3
+
+
+def test_async_chain(browser):
+    async def run():
+        chain = AsyncBrowserJQuery(browser).chain("ul").children()
+        return await chain.count(), await chain.last().text()
+
+    assert asyncio.run(run()) == (3, ["Item 3"])
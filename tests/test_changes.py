@@ -0,0 +1,39 @@
+import pytest
+
+from browserjquery.changes import DomChangeFeed
+
+
+def test_observe_reports_deltas(browser):
+    with browser.observe("ul") as feed:
+        assert isinstance(feed, DomChangeFeed)
+        browser.execute(
+            """
+            var li = document.createElement('li');
+            li.textContent = 'Item 4';
+            document.querySelector('ul').appendChild(li);
+            document.querySelector('ul li').setAttribute('data-seen', 'yes');
+            """
+        )
+        changes = feed.changes()
+        assert [(change.type, change.tag) for change in changes] == [("added", "li"), ("attribute", "li")]
+        assert changes[0].element.text() == "Item 4", "Added elements should be wrapped"
+        assert (changes[1].name, changes[1].value) == ("data-seen", "yes")
+        assert feed.changes() == [], "Draining should clear the buffer"
+
+        browser.execute("document.querySelector('ul').lastElementChild.remove()")
+        browser.execute("document.querySelector('ul li').removeAttribute('data-seen')")
+        assert [change.type for change in feed.changes()] == ["removed", "attribute"]
+
+
+def test_observe_buffer_limit(browser, caplog):
+    with browser.observe("ul", text=False, buffer_size=2) as feed:
+        browser.execute("for (var i = 0; i < 5; i++) document.querySelector('ul').setAttribute('data-i', i)")
+        changes = feed.changes()
+    assert [change.value for change in changes] == ["3", "4"], "The oldest changes should be dropped"
+    assert "3 changes were dropped" in caplog.text
+    browser.execute("document.querySelector('ul').removeAttribute('data-i')")
+
+
+def test_changes_not_batched(browser):
+    with browser.observe("ul") as feed, browser.batch(), pytest.raises(RuntimeError):
+        feed.changes()
@@ -0,0 +1,39 @@
+import pytest
+
+
+def test_collection_extract_records(browser):
+    links = browser.find("a.nav-link")
+    records = links.extract({"title": "text", "url": "attr:href", "missing": "attr:data-missing"})
+    assert records == [
+        {"title": "Sign in", "url": "#", "missing": None},
+        {"title": "Home", "url": "#", "missing": None},
+    ]
+
+
+def test_collection_extract_columns(browser):
+    links = browser.find("a.nav-link")
+    columns = links.extract({"title": "text", "link": "is:a"}, columns=True)
+    assert columns == {"title": ["Sign in", "Home"], "link": [True, True]}
+
+
+def test_extract_single_round_trip(browser, round_trips):
+    records = browser.extract("li", {"text": "text", "parent": "is:ul li"})
+    assert [r["text"] for r in records] == ["Item 1", "Item 2", "Item 3"]
+    assert len(round_trips) == 1, "Extraction should take a single round-trip"
+
+
+def test_extract_from_descendants(browser):
+    records = browser.extract(".form-group", {"first_input": "find:input|attr:id", "label": "find:label|text"})
+    assert records[0] == {"first_input": "username", "label": "Remember me"}
+    assert records[2] == {"first_input": None, "label": None}
+
+
+def test_extract_empty_collection(browser):
+    assert browser.find(".does-not-exist").extract({"title": "text"}) == []
+    assert browser.find(".does-not-exist").extract({"title": "text"}, columns=True) == {"title": []}
+
+
+@pytest.mark.parametrize("spec", ["attr", "text:x", "find:|text", "unknown"])
+def test_extract_rejects_invalid_specs(browser, spec):
+    with pytest.raises(ValueError):
+        browser.extract("a", {"field": spec})
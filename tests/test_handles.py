@@ -0,0 +1,61 @@
+from array import array
+
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+
+from browserjquery.handles import ElementHandle, HandleCollection
+
+
+def test_find_handles_transfers_integer_ids(browser):
+    with browser.find_handles("li") as items:
+        assert isinstance(items, HandleCollection)
+        assert isinstance(items.ids, array)
+        assert len(items) == 3
+        assert all(isinstance(handle, ElementHandle) for handle in items)
+
+        assert items[1].jquery().text() == "Item 2"
+        assert [element.text for element in items[1:].materialize().elements] == ["Item 2", "Item 3"]
+        assert items.extract({"text": "text"}, columns=True) == {"text": ["Item 1", "Item 2", "Item 3"]}
+
+
+def test_handles_do_not_hold_web_elements(browser, round_trips):
+    items = browser.find_handles("li")
+    first, tail = items[0], items[1:]
+    assert len(round_trips) == 1, "Indexing and slicing handles needs no round-trip"
+    assert first.extract({"text": "text"}) == {"text": "Item 1"}
+    assert len(tail) == 2
+    items.release()
+
+
+def test_released_handles_are_stale(browser):
+    items = browser.find_handles("a.nav-link")
+    items[0].release()
+    with pytest.raises(StaleElementReferenceException):
+        items[0].element()
+    assert items[1].element().text == "Home"
+    assert items.extract({"text": "text"}) == [{"text": None}, {"text": "Home"}]
+
+    assert browser.release_handles() >= 1
+    with pytest.raises(StaleElementReferenceException):
+        items.materialize()
+
+
+def test_evict_handles_of_removed_elements(browser):
+    browser.release_handles()
+    browser.execute("var div = document.createElement('div'); div.className = 'transient'; document.body.append(div);")
+    handles = browser.find_handles("div.transient")
+    browser.execute("document.querySelector('div.transient').remove();")
+    assert browser.evict_handles() == 1
+    with pytest.raises(StaleElementReferenceException):
+        handles[0].element()
+
+
+def test_handle_extract_in_batch(browser, round_trips):
+    with browser.find_handles("li") as items:
+        round_trips.clear()
+        with browser.batch():
+            first = items[0].extract({"text": "text"})
+            rows = items.extract({"text": "text"})
+        assert len(round_trips) == 1
+        assert first.value == {"text": "Item 1"}
+        assert len(rows.value) == 3
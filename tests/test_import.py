@@ -0,0 +1,37 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+IMPORT_CHECK = """
+import json, logging, sys
+root_handlers = list(logging.getLogger().handlers)
+import browserjquery
+print(json.dumps({
+    "modules": [name for name in ("selenium", "yaml", "environ", "browserjquery.jquery") if name in sys.modules],
+    "root_handlers_changed": logging.getLogger().handlers != root_handlers,
+}))
+"""
+
+
+def run_python(code: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=Path(__file__).parent.parent
+    )
+    return result.stdout
+
+
+def test_import_is_lazy_and_side_effect_free():
+    result = json.loads(run_python(IMPORT_CHECK))
+    assert result["modules"] == [], "Importing the package should only load the package itself"
+    assert not result["root_handlers_changed"], "Importing the package should not configure logging"
+
+
+def test_public_names_are_loaded_on_access():
+    output = run_python("import browserjquery; print(browserjquery.BrowserJQuery.__module__)")
+    assert output.strip() == "browserjquery.jquery"
+
+
+def test_settings_are_read_on_access():
+    output = run_python("from browserjquery import settings; print(settings.ASYNC_MAX_WORKERS > 0)")
+    assert output.strip() == "True"
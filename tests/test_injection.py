@@ -0,0 +1,70 @@
+import time
+
+from browserjquery import BrowserJQuery
+
+
+def test_inject_jquery_file_returns_when_ready(browser):
+    start = time.monotonic()
+    assert browser.inject_jquery(by="file"), "File injection should report success"
+    assert time.monotonic() - start < 2, "File injection should not sleep"
+    assert browser.is_jquery_injected, "jQuery should be available after injection"
+
+
+def test_inject_jquery_cdn_times_out(browser, monkeypatch):
+    monkeypatch.setattr(browser.driver, "execute_async_script", lambda script, timeout: False)
+    assert browser.inject_jquery(by="cdn", wait=0.1) is False, "Failed CDN injection should report failure"
+
+
+def test_wait_for_jquery_polls_until_timeout(browser, monkeypatch):
+    monkeypatch.setattr(browser, "execute", lambda script: False)
+    start = time.monotonic()
+    assert browser._wait_for_jquery(timeout=0.2, poll_interval=0.05) is False
+    assert time.monotonic() - start < 1, "Polling should stop at the timeout"
+
+
+def test_document_is_marked_on_injection(browser):
+    assert browser.session.marker, "Session should remember the document marker"
+    assert browser.execute("return window.__bjqMarker") == browser.session.marker
+
+
+def test_new_wrapper_on_known_document_costs_one_round_trip(browser, round_trips):
+    BrowserJQuery(browser.driver)
+    assert len(round_trips) == 1, "A marked document should not be probed for jQuery"
+
+
+def test_queries_survive_page_reload(browser):
+    browser.driver.refresh()
+    assert browser.execute("return window.__bjqMarker") is None, "Reload should drop the marker"
+
+    element = browser.find("a").first()
+    assert element.text() == "Sign in", "Queries should transparently re-inject jQuery"
+    assert browser.execute("return window.__bjqMarker") == browser.session.marker
+
+
+def test_preinjection_marks_new_documents(browser, round_trips):
+    assert browser.enable_preinjection(), "Chrome should support pre-injection"
+    try:
+        browser.driver.refresh()
+        assert browser.execute("return typeof window.jQuery") == "function", "jQuery should be pre-injected"
+        assert browser.execute("return window.__bjqMarker") == browser.session.marker
+
+        round_trips.clear()
+        assert BrowserJQuery(browser.driver).find("a").first().text() == "Sign in"
+        assert len(round_trips) == 3, "Pre-injected documents should need no injection or probe"
+    finally:
+        browser.disable_preinjection()
+
+
+def test_preinjection_falls_back_without_cdp(browser, monkeypatch):
+    monkeypatch.delattr(type(browser.driver), "execute_cdp_cmd")
+    assert browser.enable_preinjection() is False, "Drivers without CDP should fall back"
+
+
+def test_queries_survive_page_reload_seen_by_another_wrapper(browser):
+    other = BrowserJQuery(browser.driver)
+    browser.driver.refresh()
+    assert other.find("a").first().text() == "Sign in"
+    assert browser.session.document != browser.default_element, "The other wrapper loaded the new document"
+
+    assert browser.find("a").first().text() == "Sign in", "Outdated root wrappers should load the new document"
+    assert browser.default_element == browser.session.document
@@ -1,3 +1,6 @@
+import gzip
+
+
 def test_document_property(browser):
     doc = browser.document
     assert doc is not None, "Should get document element"
@@ -8,6 +11,19 @@ def test_page_html_property(browser):
     assert html is not None and "<html" in html, "Should get page HTML"
 
 
+def test_iter_html_matches_page_html(browser):
+    assert "".join(browser.iter_html(chunk_size=100)) == browser.page_html, "Slices should add up to the page"
+    assert "".join(browser.iter_html(chunk_size=100, compress=True)) == browser.page_html
+
+
+def test_save_html(browser, tmp_path):
+    browser.save_html(tmp_path / "page.html", chunk_size=100)
+    assert (tmp_path / "page.html").read_text(encoding="utf-8") == browser.page_html
+
+    browser.save_html(tmp_path / "page.html.gz", compress=True)
+    assert gzip.decompress((tmp_path / "page.html.gz").read_bytes()).decode() == browser.page_html
+
+
 def test_find_with_selector(browser):
     element = browser.find("a.nav-link").first()
     assert element is not None, "Should find anchor with nav-link class"
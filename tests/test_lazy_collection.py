@@ -0,0 +1,61 @@
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+
+from browserjquery.jquery import LazyBrowserJQueryCollection
+
+
+def test_lazy_find_counts_in_page(browser, round_trips):
+    items = browser.find("li", lazy=True)
+    assert isinstance(items, LazyBrowserJQueryCollection)
+    assert len(items) == 3
+    assert len(round_trips) == 1, "Creating and counting a lazy collection should take one round-trip"
+    items.release()
+
+
+def test_lazy_indexing_and_slicing(browser):
+    with browser.find("li", lazy=True) as items:
+        assert items[1].text() == "Item 2"
+        assert items[-1].text() == "Item 3"
+        assert items.first().text() == "Item 1"
+        assert items.last().text() == "Item 3"
+        assert [item.text() for item in items[1:]] == ["Item 2", "Item 3"]
+        with pytest.raises(IndexError):
+            items[3]
+
+
+def test_lazy_iteration_pages_through_chunks(browser, round_trips):
+    with browser.find("*", lazy=True, chunk_size=10) as elements:
+        round_trips.clear()
+        wrapped = list(elements)
+        assert len(wrapped) == len(elements)
+        assert len(round_trips) == -(-len(elements) // 10), "Iteration should fetch one chunk per round-trip"
+
+
+def test_lazy_extract(browser):
+    with browser.find("a.nav-link", lazy=True) as links:
+        assert links.extract({"title": "text"}, columns=True) == {"title": ["Sign in", "Home"]}
+
+
+def test_released_collection_is_stale(browser):
+    items = browser.find("li", lazy=True)
+    items.release()
+    with pytest.raises(StaleElementReferenceException):
+        items.first()
+
+
+def test_stream_yields_chunks(browser, round_trips):
+    texts = [item.text() for item in browser.stream("li", chunk_size=2)]
+    assert texts == ["Item 1", "Item 2", "Item 3"]
+
+    round_trips.clear()
+    records = list(browser.stream("li", {"text": "text"}, chunk_size=2))
+    assert records == [{"text": "Item 1"}, {"text": "Item 2"}, {"text": "Item 3"}]
+    assert len(round_trips) == 3, "Streaming should take one round-trip to find and one per chunk"
+
+
+def test_closed_stream_releases_results(browser, round_trips):
+    stream = browser.stream("*", chunk_size=1)
+    next(stream)
+    assert len(round_trips) == 2
+    stream.close()
+    assert len(round_trips) == 3, "Closing a stream early should release the rest of the set"
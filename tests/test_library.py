@@ -0,0 +1,27 @@
+from browserjquery import jquery_scripts
+
+
+def test_library_is_installed(browser):
+    assert browser.execute("return typeof window.__bjq.ops.find") == "function"
+
+
+def test_queries_only_send_the_library_call(browser, round_trips):
+    element = browser.find("a").first()
+    element.attr("href")
+    element.find_elements_with_text("Sign in")
+
+    assert round_trips, "Queries should reach the browser"
+    assert set(round_trips) == {jquery_scripts.LIBRARY_CALL}, "Queries should only ship the library call"
+
+
+def test_selectors_and_values_need_no_quoting(browser):
+    assert browser.find("a[title=\"it's\"]").elements == [], "Quotes in selectors should not break the query"
+    assert browser.find_elements_with_text("it's \"quoted\"").elements == []
+
+
+def test_library_is_reinstalled_after_reload(browser):
+    browser.driver.refresh()
+    assert browser.execute("return window.__bjq") is None, "Reload should drop the library"
+
+    assert browser.find("a").first().text() == "Sign in", "Queries should transparently reinstall the library"
+    assert browser.execute("return typeof window.__bjq") == "object"
@@ -0,0 +1,50 @@
+import time
+
+from browserjquery import BrowserJQuery
+
+
+def test_metrics_disabled_by_default(browser):
+    assert browser.metrics is None
+
+
+def test_metrics_record_operations(browser):
+    metrics = browser.enable_metrics()
+    try:
+        metrics.reset()
+        start = time.perf_counter()
+        browser.find("a").first().text()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        BrowserJQuery(browser.driver)
+        browser.query("return document.title;")
+
+        summary = metrics.summary()
+        assert summary["operations"]["find"]["count"] == 1
+        assert summary["operations"]["text"]["count"] == 1
+        find = summary["operations"]["find"]
+        assert find["in_page_ms"] >= 0, "In-page time should be measured for library operations"
+        assert "in_page_ms" not in summary["operations"]["script"], "Raw scripts report no in-page time"
+        assert 0 < find["wall_ms"] <= elapsed_ms
+        assert find["script_bytes"] > 0 and find["result_bytes"] > 0
+        assert summary["caches"]["document"]["hits"] == 1, "Known documents should count as cache hits"
+        assert "find" in metrics.report()
+    finally:
+        browser.disable_metrics()
+
+
+def test_metrics_listeners(browser):
+    records = []
+    metrics = browser.enable_metrics()
+    metrics.subscribe(records.append)
+    try:
+        browser.text()
+    finally:
+        browser.disable_metrics()
+    assert [record.operation for record in records] == ["text"]
+
+
+def test_metrics_keep_results_unchanged(browser):
+    browser.enable_metrics()
+    try:
+        assert browser.find("li").first().text() == "Item 1"
+    finally:
+        browser.disable_metrics()
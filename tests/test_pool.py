@@ -0,0 +1,90 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+from browserjquery.pool import BrowserJQueryPool
+
+TEST_PAGE_URL = f"file:///{Path(__file__).parent / 'data' / 'test_page.html'}"
+
+
+def make_driver():
+    options = Options()
+    options.add_argument("--headless")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    return webdriver.Chrome(options=options)
+
+
+def first_link_text(browser, url):
+    browser.driver.get(url)
+    return browser.find("a").first().text()
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with BrowserJQueryPool(size=2, factory=make_driver, max_uses=2) as pool:
+        yield pool
+
+
+def test_pool_map_keeps_order(pool):
+    assert pool.map(first_link_text, [TEST_PAGE_URL] * 4) == ["Sign in"] * 4
+
+
+def test_pool_recycles_worn_out_browsers(pool):
+    recycled = pool.recycled
+    for _ in range(2):
+        with pool.lease() as browser:
+            browser.driver.get(TEST_PAGE_URL)
+    assert pool.recycled > recycled, "Browsers should be replaced after max_uses leases"
+
+
+def test_pool_replaces_crashed_browser():
+    with BrowserJQueryPool(size=1, factory=make_driver) as pool:
+        with pytest.raises(Exception):
+            with pool.lease() as browser:
+                browser.driver.quit()
+                browser.text()
+        assert pool.recycled == 1, "The crashed browser should be detected and replaced"
+
+        with pool.lease() as browser:
+            browser.driver.get(TEST_PAGE_URL)
+            assert browser.find("a").first().text() == "Sign in", "A fresh browser should replace the crashed one"
+
+
+def test_pool_lease_fails_once_no_browsers_remain():
+    def crash():
+        raise ConnectionError("Browser crashed")
+
+    class ShrinkingPool(BrowserJQueryPool):
+        launches = 0
+
+        def _launch(self):
+            self.launches += 1
+            if self.launches > 1:
+                raise RuntimeError("Could not launch a browser")
+            return SimpleNamespace(driver=SimpleNamespace(quit=lambda: None), execute=lambda script: crash())
+
+    with ShrinkingPool(size=1, factory=make_driver) as pool:
+        with pytest.raises(ConnectionError):
+            with pool.lease() as browser:
+                browser.execute("return 1")
+        assert pool.recycled == 0
+
+        with pytest.raises(RuntimeError, match="no browsers left"):
+            with pool.lease(timeout=5):
+                pass
+
+
+def test_pool_lease_timeout():
+    with BrowserJQueryPool(size=1, factory=make_driver) as pool:
+        with pool.lease():
+            with pytest.raises(TimeoutError):
+                with pool.lease(timeout=0.1):
+                    pass
+
+
+def test_pool_map_with_processes(pool):
+    assert pool.map(first_link_text, [TEST_PAGE_URL] * 2, processes=True) == ["Sign in"] * 2
@@ -0,0 +1,53 @@
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+
+from browserjquery import BrowserJQuery
+
+RERENDER_LIST = "var ul = document.querySelector('ul'); ul.innerHTML = ul.innerHTML;"
+
+
+def test_stale_element_is_relocated_from_its_recipe(browser):
+    item = browser.find("li")[1]
+    assert item.recipe, "Elements found by a query remember how to find them again"
+
+    browser.execute(RERENDER_LIST)
+    assert item.text() == "Item 2", "The re-rendered element is found again and the query retried"
+
+    browser.execute(RERENDER_LIST)
+    assert item.get_attribute("textContent") == "Item 2", "Element methods relocate as well"
+
+
+def test_relocate_follows_nested_queries(browser):
+    links = browser.find("ul")[0].find("li")
+    item = links.last()
+    assert len(item.recipe) == 2
+
+    browser.execute(RERENDER_LIST)
+    assert item.relocate()
+    assert item.text() == "Item 3"
+
+
+def test_relocate_without_recipe(browser):
+    element = browser.driver.find_element("css selector", "li")
+    assert not browser._wrap(element).relocate()
+
+
+def test_stale_element_is_not_relocated_on_another_page(browser, test_page_path):
+    item = browser.find("li")[1]
+    try:
+        browser.driver.get("data:text/html,<ul><li>Other 1</li><li>Other 2</li></ul>")
+        with pytest.raises(StaleElementReferenceException):
+            item.text()
+
+        BrowserJQuery(browser.driver).find("li")
+        assert not item.relocate(), "Recipes are not replayed on another document"
+    finally:
+        browser.driver.get(f"file:///{test_page_path}")
+
+
+def test_relocate_inside_batch(browser):
+    item = browser.find("li")[1]
+    browser.execute(RERENDER_LIST)
+    with browser.batch():
+        assert not item.relocate(), "Relocating needs a round-trip, which batches defer"
+    assert item.relocate()
@@ -0,0 +1,62 @@
+import pytest
+
+from browserjquery.jquery import classify_selector, native_selector, scope_selector
+
+
+@pytest.mark.parametrize(
+    "selector, kind",
+    [
+        ("#container", "id"),
+        ("#container a", "css"),
+        ("a.nav-link", "css"),
+        ("p:not(.hidden)", "css"),
+        ("li:first-child", "css"),
+        ("input:checked", "css"),
+        ("a[title=':visible']", "css"),
+        ("li:first", "jquery"),
+        ("div:visible", "jquery"),
+        ("li:eq(1)", "jquery"),
+        ("p:contains('text')", "jquery"),
+        ("a[href!='#']", "jquery"),
+    ],
+)
+def test_classify_selector(selector, kind):
+    assert classify_selector(selector) == kind
+
+
+def test_scope_selector_prefixes_each_selector():
+    assert scope_selector("h1, h2") == ":scope h1, :scope h2"
+    assert scope_selector("> li") == ":scope > li"
+    assert scope_selector("a[title='x,y'], b:not(.c, .d)") == ":scope a[title='x,y'], :scope b:not(.c, .d)"
+
+
+def test_native_selector_skips_jquery_selectors():
+    assert native_selector("div:visible") is None
+    assert native_selector("div.item") == ":scope div.item"
+
+
+def test_native_find_matches_jquery(browser):
+    native = browser.find("nav a.nav-link")
+    jquery = browser.execute("return $(arguments[0]).find('nav a.nav-link').get()", browser.default_element)
+    assert native.elements == jquery, "Native and jQuery engines should find the same elements"
+
+
+def test_find_is_rooted_like_jquery(browser):
+    nav = browser.find("nav").first()
+    assert len(nav.find("header a")) == 0, "Selectors should only match below the root, like jQuery"
+    assert len(nav.find("> a")) == 2, "Leading combinators should be supported"
+
+
+def test_find_by_id(browser):
+    assert browser.find("#username").first().attr("id") == "username"
+    assert len(browser.find("#does-not-exist")) == 0
+
+
+def test_native_find_without_jquery(browser):
+    browser.execute("delete window.jQuery; delete window.$;")
+    links = browser.find("a.nav-link")
+    assert len(links) == 2, "CSS selectors should not need jQuery"
+    texts = browser.find_elements_with_text("Sign in", selector="a")
+    assert len(texts) == 1, "Text searches with CSS selectors should not need jQuery"
+
+    assert browser.find("a:first").first().text() == "Sign in", "jQuery should be re-injected on demand"
@@ -0,0 +1,76 @@
+import gc
+import weakref
+
+from browserjquery import BrowserJQuery
+from browserjquery import session as session_module
+from browserjquery.session import BrowserSession
+
+
+def test_wrappers_share_session(browser):
+    links = browser.find("a.nav-link")
+    assert links.session is browser.session, "Collections should share the browser session"
+    assert all(link.session is browser.session for link in links), "Wrapped elements should share the session"
+
+
+def test_session_is_per_driver(browser):
+    other = BrowserJQuery(browser.driver)
+    assert other.session is browser.session, "Instances on the same driver should share a session"
+    assert browser.session.jquery_injected, "Session should record jQuery injection"
+
+
+def test_wrapping_costs_no_round_trips(browser, round_trips):
+    elements = browser.find("*")
+    assert len(elements) > 20, "Test page should have enough elements"
+    round_trips.clear()
+
+    wrapped = list(elements) + elements.items() + [elements.first(), elements.last(), elements[1]]
+
+    assert len(wrapped) == 2 * len(elements) + 3
+    assert round_trips == [], "Wrapping elements should not touch the browser"
+
+
+def test_traversal_results_cost_one_round_trip(browser, round_trips):
+    element = browser.find("nav").first()
+    round_trips.clear()
+
+    children = element.children()
+    list(children)
+    element.next()
+
+    assert len(round_trips) == 2, "Each traversal should cost exactly one round-trip"
+
+
+def test_session_is_dropped_with_its_driver():
+    class Driver:
+        pass
+
+    sessions = len(session_module._SESSIONS)
+    driver = Driver()
+    assert BrowserSession.for_driver(driver).driver is driver
+    assert len(session_module._SESSIONS) == sessions + 1
+
+    driver_ref = weakref.ref(driver)
+    del driver
+    gc.collect()
+    assert driver_ref() is None, "The session should not keep its driver alive"
+    assert len(session_module._SESSIONS) == sessions, "The session should be dropped with its driver"
+
+
+def test_navigation_watch_is_removed_with_the_cache():
+    class Driver:
+        def execute(self, driver_command, params=None):
+            return {"value": None}
+
+    driver = Driver()
+    browser = BrowserJQuery(driver, default_element=object())
+    browser.enable_cache()
+    browser.enable_cache()
+    cache = browser.cache
+    cache.store("key", "value")
+    driver.execute("getTitle")
+    assert len(cache) == 1, "Other commands should keep cached results"
+    driver.execute("get", {"url": "about:blank"})
+    assert len(cache) == 0, "Navigation commands should clear cached results"
+
+    browser.disable_cache()
+    assert "execute" not in vars(driver), "Disabling the cache should restore the driver's execute"
@@ -0,0 +1,138 @@
+import re
+from pathlib import Path
+
+import pytest
+
+from browserjquery.snapshot import BrowserSnapshot, compile_selector
+
+
+@pytest.fixture(scope="module")
+def snapshot():
+    """A snapshot parsed from the test page, without a browser."""
+    return BrowserSnapshot.from_html((Path(__file__).parent / "data" / "test_page.html").read_text())
+
+
+def texts(elements):
+    return [element.text().strip() for element in elements]
+
+
+@pytest.mark.parametrize(
+    "selector, count",
+    [
+        ("a", 2),
+        ("nav > a.nav-link", 2),
+        ("header a, footer p", 4),
+        ("input[type='radio']", 2),
+        ("input[type!='radio']", 3),
+        ("input[placeholder^=User]", 1),
+        ("li:nth-child(odd)", 2),
+        ("li:first-child + li", 1),
+        ("label ~ input", 1),
+        ("div:has(> input:checked)", 2),
+        ("p:not(.hidden)", 2),
+        ("p:contains('footer')", 2),
+        ("li:first", 1),
+        ("li:eq(-1)", 1),
+        (".form-group :disabled", 1),
+        (":header", 1),
+    ],
+)
+def test_find_matches_selectors(snapshot, selector, count):
+    assert len(snapshot.find(selector)) == count
+
+
+def test_find_is_rooted_like_jquery(snapshot):
+    nav = snapshot.find("nav").first()
+    assert len(nav.find("header a")) == 0, "Selectors should only match below the root, like jQuery"
+    assert len(nav.find("> a")) == 2, "Leading combinators should be supported"
+
+
+def test_find_by_id(snapshot):
+    assert snapshot.find("#username").first().attr("placeholder") == "Username"
+    assert len(snapshot.find("#does-not-exist")) == 0
+
+
+def test_positional_filters_apply_to_match_set(snapshot):
+    assert texts(snapshot.find("li:eq(1)")) == ["Item 2"]
+    assert texts(snapshot.find("li:gt(0)")) == ["Item 2", "Item 3"]
+    assert texts(snapshot.find("li").first().siblings(":last")) == ["Item 3"]
+
+
+def test_live_only_selectors_are_rejected(snapshot):
+    with pytest.raises(ValueError, match="live"):
+        snapshot.find("p:visible")
+    with pytest.raises(ValueError):
+        compile_selector("a[")
+
+
+def test_traversal(snapshot):
+    link = snapshot.find("a").first()
+    assert link.parent().tag_name == "nav"
+    assert [parent.tag_name for parent in link.parents()][:3] == ["nav", "header", "div"]
+    assert link.next().text() == "Home"
+    assert link.prev() is None
+    assert link.find_closest_ancestor("#container").get_attribute("class") == "test-class"
+    assert texts(snapshot.find("ul").first().children()) == ["Item 1", "Item 2", "Item 3"]
+
+
+def test_content_and_state(snapshot):
+    paragraph = snapshot.find("section p").first()
+    assert paragraph.text() == "This is a test paragraph with nested elements."
+    assert paragraph.html() == "This is a test paragraph with <span>nested</span> elements."
+    assert snapshot.find("#remember").first().is_checked()
+    assert snapshot.find("#remember").first().attr("checked") == "checked"
+    assert snapshot.find("button[type='submit']").first().is_disabled()
+    assert snapshot.find("#container").first().has_class("test-class")
+    assert snapshot.find(".form-group").first().has("input#username")
+
+
+def test_text_search_matches_browser_semantics(snapshot):
+    assert snapshot.find_lowest_element_with_text("nested").tag_name == "span"
+    assert snapshot.find_lowest_element_with_text("Item 2", exact_match=True).tag_name == "li"
+    assert texts(snapshot.find_elements_with_selector_and_text("a", "sign IN", mode="casefold")) == ["Sign in"]
+    assert texts(snapshot.find_elements_with_text(re.compile(r"^Item \d$"), "li")) == ["Item 1", "Item 2", "Item 3"]
+    assert [e.tag_name for e in snapshot.find_deepest_elements_with_text("Item", limit=2)] == ["li", "li"]
+    with pytest.raises(ValueError):
+        snapshot.find_elements_with_text("Item", mode="fuzzy")
+
+
+def test_extract(snapshot):
+    records = snapshot.extract(".form-group", {"first_input": "find:input|attr:id", "label": "find:label|text"})
+    assert records[0] == {"first_input": "username", "label": "Remember me"}
+    assert records[2] == {"first_input": None, "label": None}
+    assert snapshot.find("a").extract({"title": "text"}, columns=True) == {"title": ["Sign in", "Home"]}
+
+
+def test_raw_text_is_not_parsed_as_markup():
+    snapshot = BrowserSnapshot.from_html(
+        "<body><p>Before</p><noscript><p>Fallback</p></noscript><script>var p = '<p>';</script><p>After</p></body>"
+    )
+    assert texts(snapshot.find("p")) == ["Before", "After"], "Raw text elements should hold a single text node"
+    assert snapshot.find("noscript").first().text() == "<p>Fallback</p>"
+    assert snapshot.find("noscript").first().html() == "<p>Fallback</p>"
+
+
+def test_template_contents_are_not_matched():
+    snapshot = BrowserSnapshot.from_html("<body><template><li>Row</li></template><ul><li>Item</li></ul></body>")
+    assert texts(snapshot.find("li")) == ["Item"], "Template contents are not part of the document tree"
+    template = snapshot.find("template").first()
+    assert template.children() == []
+    assert template.text() == ""
+    assert template.html() == "<li>Row</li>"
+    assert snapshot.find("ul").first().prev().tag_name == "template"
+
+
+def test_browser_snapshot_matches_live_page(browser, round_trips):
+    snapshot = browser.snapshot()
+    round_trips.clear()
+
+    assert texts(snapshot.find("a.nav-link")) == ["Sign in", "Home"]
+    assert snapshot.find_lowest_element_with_text("nested").tag_name == "span"
+    assert not round_trips, "Snapshot queries should not reach the browser"
+
+
+def test_snapshot_live_escape_hatch(browser):
+    snapshot = browser.snapshot()
+    live = snapshot.find("li:eq(1)").first().live()
+    assert live.text() == "Item 2", "Snapshot elements should map back to the live element"
+    assert [link.text() for link in snapshot.find("a").live()] == ["Sign in", "Home"]
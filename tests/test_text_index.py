@@ -0,0 +1,50 @@
+import pytest
+
+
+@pytest.fixture
+def indexed_browser(browser):
+    browser.enable_text_index()
+    yield browser
+    browser.disable_text_index()
+
+
+def test_text_index_matches_plain_search(browser, indexed_browser):
+    browser.disable_text_index()
+    plain = browser.find_elements_with_text("Sign in").elements
+    browser.enable_text_index()
+    assert indexed_browser.find_elements_with_text("Sign in").elements == plain
+
+
+def test_text_index_is_built_once(indexed_browser):
+    indexed_browser.find_elements_with_text("Sign in")
+    assert indexed_browser.execute("return !!window.__bjqTextIndex && !window.__bjqTextIndex.dirty")
+
+
+def test_text_index_finds_text_across_elements(indexed_browser):
+    element = indexed_browser.find_lowest_element_with_text("test paragraph with nested elements")
+    assert element and element.tag_name == "p", "Text spanning child elements should be found"
+
+
+def test_text_index_exact_match(indexed_browser):
+    element = indexed_browser.find_lowest_element_with_text("Item 2", exact_match=True)
+    assert element.tag_name == "li"
+    assert len(indexed_browser.find_elements_with_selector_and_text("a", "Home", exact_match=True)) == 1
+
+
+def test_text_index_follows_dom_changes(indexed_browser):
+    assert indexed_browser.find_lowest_element_with_text("Brand new text") is None
+    indexed_browser.execute("document.querySelector('h1').textContent = 'Brand new text';")
+    try:
+        element = indexed_browser.find_lowest_element_with_text("Brand new text")
+        assert element and element.tag_name == "h1", "Mutations should invalidate the index"
+    finally:
+        indexed_browser.execute("document.querySelector('h1').textContent = 'Test Page';")
+
+
+def test_text_index_needle_with_quotes(indexed_browser):
+    indexed_browser.execute("document.querySelector('h1').textContent = 'It\\'s \"quoted\"';")
+    try:
+        element = indexed_browser.find_lowest_element_with_text("It's \"quoted\"")
+        assert element and element.tag_name == "h1", "Quotes in the needle should not break the script"
+    finally:
+        indexed_browser.execute("document.querySelector('h1').textContent = 'Test Page';")
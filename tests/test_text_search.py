@@ -0,0 +1,49 @@
+import re
+
+import pytest
+
+
+def test_text_with_quotes_is_passed_safely(browser):
+    elements = browser.find_elements_with_text("it's \"quoted\"")
+    assert not elements, "Quotes in the needle should not break the script"
+
+
+def test_casefold_mode(browser):
+    element = browser.find_lowest_element_with_text("SIGN IN", mode="casefold")
+    assert element and element.text() == "Sign in"
+
+
+def test_normalized_mode(browser):
+    element = browser.find_lowest_element_with_text("  test   paragraph with\nnested ", mode="normalized")
+    assert element and element.tag_name == "p", "Whitespace should be collapsed before matching"
+
+
+def test_exact_mode(browser):
+    elements = browser.find_elements_with_text("Item 2", selector="li", mode="exact")
+    assert [e.text() for e in elements] == ["Item 2"]
+
+
+def test_regex_mode(browser):
+    elements = browser.find_elements_with_text(r"^Item \d$", selector="li", mode="regex")
+    assert len(elements) == 3
+
+
+def test_compiled_pattern_sets_regex_flags(browser):
+    elements = browser.find_elements_with_text(re.compile(r"^item [12]$", re.IGNORECASE), selector="li")
+    assert [e.text() for e in elements] == ["Item 1", "Item 2"]
+
+
+def test_limit_returns_first_matches(browser):
+    elements = browser.find_elements_with_text("Item", selector="li", limit=2)
+    assert [e.text() for e in elements] == ["Item 1", "Item 2"]
+
+
+def test_deepest_elements_first(browser):
+    elements = browser.find_deepest_elements_with_text("Sign in", limit=2)
+    assert elements.first().tag_name == "a", "The deepest element should come first"
+    assert elements.last().tag_name == "nav"
+
+
+def test_unknown_mode_is_rejected(browser):
+    with pytest.raises(ValueError):
+        browser.find_elements_with_text("Sign in", mode="fuzzy")
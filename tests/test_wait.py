@@ -0,0 +1,55 @@
+import time
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+APPEND_LATER = """
+    setTimeout(function() {
+        var div = document.createElement('div');
+        div.className = 'delayed';
+        div.textContent = arguments[0];
+        document.body.appendChild(div);
+    }.bind(null, arguments[0]), arguments[1]);
+"""
+
+REMOVE_LATER = """
+    setTimeout(function() {
+        document.querySelectorAll('.delayed').forEach(function(e) { e.remove(); });
+    }, arguments[0]);
+"""
+
+
+def test_wait_for_returns_when_element_appears(browser):
+    browser.execute(APPEND_LATER, "Loaded", 200)
+    start = time.perf_counter()
+    elements = browser.wait_for("div.delayed", text="Loaded", timeout=5)
+    assert time.perf_counter() - start < 2, "Waiting should end on the mutation, not on the timeout"
+    assert [element.text() for element in elements] == ["Loaded"]
+
+    browser.execute(REMOVE_LATER, 200)
+    browser.wait_until_gone("div.delayed", timeout=5)
+    assert len(browser.find("div.delayed")) == 0
+
+
+def test_wait_for_present_element_is_immediate(browser, round_trips):
+    assert len(browser.wait_for("li", timeout=1)) == 3
+    assert len(round_trips) == 1, "Waits run as a single asynchronous script"
+
+
+def test_wait_restores_script_timeout(browser):
+    timeout = browser.driver.timeouts.script
+    assert len(browser.wait_for("li", timeout=timeout)) == 3
+    assert browser.driver.timeouts.script == timeout, "A longer wait should not leave the driver timeout raised"
+
+    try:
+        browser.driver.set_script_timeout(timeout + 1)
+        browser.wait_for("li", timeout=timeout + 1)
+        assert browser.driver.timeouts.script == timeout + 1, "Timeouts set by the user should be kept"
+    finally:
+        browser.driver.set_script_timeout(timeout)
+
+
+def test_wait_for_visible_and_timeout(browser):
+    with pytest.raises(TimeoutException):
+        browser.wait_for("p.hidden", visible=True, timeout=0.3)
+    browser.wait_until_gone("p.hidden", visible=True, timeout=0.3)